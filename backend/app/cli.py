@@ -438,7 +438,7 @@ def list_users(org_id):
         user_roles = db.session.query(UserRole).filter_by(user_id=user.id).all()
         role_names = []
         for ur in user_roles:
-            role = db.session.query(Role).get(ur.role_id)
+            role = db.session.get(Role, ur.role_id)
             if role:
                 role_names.append(role.name)
 
@@ -1502,7 +1502,7 @@ def list_permissions_cli(role, category):
         click.echo("-"*80)
 
         for rp in role_perms:
-            perm = db.session.query(Permission).get(rp.permission_id)
+            perm = db.session.get(Permission, rp.permission_id)
             if perm:
                 click.echo(f"{perm.code:<30} {perm.name:<35} {perm.category}")
 
@@ -1631,7 +1631,7 @@ def enforce_developer_access_cli(dry_run, fix):
     dev_role_perms = db.session.query(RolePermission).filter_by(permission_id=developer_perm.id).all()
     non_developer_role_perms = []
     for rp in dev_role_perms:
-        role = db.session.query(Role).get(rp.role_id)
+        role = db.session.get(Role, rp.role_id)
         if role and role.name != 'developer':
             non_developer_role_perms.append((rp, role))
 
@@ -1653,7 +1653,7 @@ def enforce_developer_access_cli(dry_run, fix):
     if dev_overrides:
         click.echo("\nActive DEVELOPER_ACCESS overrides:")
         for o in dev_overrides:
-            user = db.session.query(User).get(o.user_id)
+            user = db.session.get(User, o.user_id)
             username = user.username if user else f"user#{o.user_id}"
             click.echo(
                 f"  - override_id={o.id} user={username} "
@@ -1812,8 +1812,8 @@ def list_sessions_cli(register_id, status, limit):
     click.echo("="*120)
 
     for session in sessions:
-        register = db.session.query(Register).get(session.register_id)
-        user = db.session.query(User).get(session.user_id)
+        register = db.session.get(Register, session.register_id)
+        user = db.session.get(User, session.user_id)
 
         register_num = register.register_number if register else "Unknown"
         username = user.username if user else "Unknown"
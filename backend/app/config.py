@@ -12,6 +12,11 @@ class Config:
         "sqlite:///apos.sqlite3",
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Compiled-statement cache per engine (SQLAlchemy default: 500). Sized to
+    # hold every hot statement shape across services without LRU churn.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "query_cache_size": int(os.environ.get("SQLALCHEMY_QUERY_CACHE_SIZE", "1200")),
+    }
 
     DEBUG_SEED_ENABLED = False
 
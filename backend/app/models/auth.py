@@ -271,6 +271,8 @@ class SessionToken(db.Model):
 
     # Token hash (never store plaintext tokens!)
     token_hash = db.Column(db.String(255), nullable=False, unique=True, index=True)
+    # First 8 bytes of the hash as a signed BIGINT; compact index used for lookups
+    token_hash_prefix = db.Column(db.BigInteger, nullable=True, index=True)
 
     # Session metadata
     created_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=db.func.now())
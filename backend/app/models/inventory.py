@@ -286,6 +286,8 @@ class Vendor(db.Model):
         db.UniqueConstraint("org_id", "code", name="uq_vendors_org_code"),
         db.Index("ix_vendors_org_id", "org_id"),
         db.Index("ix_vendors_org_active", "org_id", "is_active"),
+        # PostgreSQL also carries pg_trgm GIN indexes on name, code and
+        # reorder_mechanism for list_vendors ILIKE search (migration only).
         {"sqlite_autoincrement": True},
     )
 
@@ -139,7 +139,9 @@ class SettingValue(db.Model):
     __table_args__ = (
         db.UniqueConstraint("key", "scope_type", "scope_id", name="uq_settings_values_scope_key"),
         db.ForeignKeyConstraint(["key"], ["settings_registry.key"], name="fk_settings_values_key"),
-        db.Index("ix_settings_values_scope", "scope_type", "scope_id"),
+        # Leads with the scope so each (scope_type, scope_id) equality pair in
+        # _load_scope_values' OR and scope+key lookups share a single index.
+        db.Index("ix_settings_values_scope_key", "scope_type", "scope_id", "key"),
         db.Index("ix_settings_values_key", "key"),
         {"sqlite_autoincrement": True},
     )
@@ -86,6 +86,14 @@ class TimeClockBreak(db.Model):
     __tablename__ = "time_clock_breaks"
     __table_args__ = (
         db.Index("ix_time_clock_breaks_entry", "time_clock_entry_id"),
+        # PERFORMANCE: Only open breaks; the break guard on every clock action
+        # probes this instead of walking all of an entry's breaks.
+        db.Index(
+            "ix_time_clock_breaks_entry_open",
+            "time_clock_entry_id",
+            postgresql_where=db.text("end_at IS NULL"),
+            sqlite_where=db.text("end_at IS NULL"),
+        ),
         {"sqlite_autoincrement": True},
     )
 
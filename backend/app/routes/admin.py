@@ -65,7 +65,7 @@ def list_users():
         user_roles = db.session.query(UserRole).filter_by(user_id=user.id).all()
         role_names = []
         for ur in user_roles:
-            role = db.session.query(Role).get(ur.role_id)
+            role = db.session.get(Role, ur.role_id)
             if role:
                 role_names.append(role.name)
         user_dict["roles"] = role_names
@@ -81,7 +81,7 @@ def list_users():
 @require_permission("VIEW_USERS")
 def get_user(user_id: int):
     """Get a specific user by ID."""
-    user = db.session.query(User).get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({"error": "User not found"}), 404
@@ -94,7 +94,7 @@ def get_user(user_id: int):
     user_roles = db.session.query(UserRole).filter_by(user_id=user.id).all()
     role_names = []
     for ur in user_roles:
-        role = db.session.query(Role).get(ur.role_id)
+        role = db.session.get(Role, ur.role_id)
         if role:
             role_names.append(role.name)
     user_dict["roles"] = role_names
@@ -183,7 +183,7 @@ def update_user(user_id: int):
     - email: str
     - store_id: int
     """
-    user = db.session.query(User).get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({"error": "User not found"}), 404
@@ -293,7 +293,7 @@ def deactivate_user(user_id: int):
 
     The user will be immediately logged out and unable to log back in.
     """
-    user = db.session.query(User).get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({"error": "User not found"}), 404
@@ -339,7 +339,7 @@ def deactivate_user(user_id: int):
 @require_permission("DEACTIVATE_USER")
 def reactivate_user(user_id: int):
     """Reactivate a deactivated user account."""
-    user = db.session.query(User).get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({"error": "User not found"}), 404
@@ -376,7 +376,7 @@ def reset_user_password(user_id: int):
 
     This will also revoke all existing sessions for the user.
     """
-    user = db.session.query(User).get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({"error": "User not found"}), 404
@@ -464,7 +464,7 @@ def get_role(role_name: str):
     role_perms = db.session.query(RolePermission).filter_by(role_id=role.id).all()
     permissions = []
     for rp in role_perms:
-        perm = db.session.query(Permission).get(rp.permission_id)
+        perm = db.session.get(Permission, rp.permission_id)
         if perm:
             permissions.append(perm.to_dict())
 
@@ -513,7 +513,7 @@ def assign_role_to_user(user_id: int):
     Request body:
     - role_name: str (required)
     """
-    user = db.session.query(User).get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({"error": "User not found"}), 404
@@ -552,7 +552,7 @@ def assign_role_to_user(user_id: int):
 @require_permission("ASSIGN_ROLES")
 def remove_role_from_user(user_id: int, role_name: str):
     """Remove a role from a user."""
-    user = db.session.query(User).get(user_id)
+    user = db.session.get(User, user_id)
 
     if not user:
         return jsonify({"error": "User not found"}), 404
@@ -676,7 +676,7 @@ def list_permission_categories():
 @require_permission("MANAGE_PERMISSIONS")
 def list_permission_overrides(user_id: int):
     """List permission overrides for a user."""
-    user = db.session.query(User).get(user_id)
+    user = db.session.get(User, user_id)
     if not user:
         return jsonify({"error": "User not found"}), 404
 
@@ -696,7 +696,7 @@ def upsert_permission_override(user_id: int):
     - override_type: "GRANT" or "DENY" (required)
     - reason: str (optional)
     """
-    user = db.session.query(User).get(user_id)
+    user = db.session.get(User, user_id)
     if not user:
         return jsonify({"error": "User not found"}), 404
 
@@ -726,7 +726,7 @@ def upsert_permission_override(user_id: int):
 @require_permission("MANAGE_PERMISSIONS")
 def revoke_permission_override_route(user_id: int, permission_code: str):
     """Revoke a permission override for a user."""
-    user = db.session.query(User).get(user_id)
+    user = db.session.get(User, user_id)
     if not user:
         return jsonify({"error": "User not found"}), 404
 
@@ -14,14 +14,14 @@ from ..extensions import db
 from ..models import Sale, RegisterSession, User, Task
 from ..services import reporting_service, permission_service
 from ..services.reporting_service import ReportError
-from ..services.tenant_service import require_store_in_org, TenantAccessError
+from ..services.tenant_service import require_store_in_org_exists, TenantAccessError
 
 
 analytics_bp = Blueprint("analytics", __name__, url_prefix="/api/analytics")
 
 
 def _check_store_access(store_id: int) -> None:
-    require_store_in_org(store_id, g.org_id)
+    require_store_in_org_exists(store_id, g.org_id)
 
 
 def _parse_include_children() -> bool:
@@ -91,6 +91,7 @@ def switch_org():
     current_session.is_revoked = True
     current_session.revoked_reason = f"Developer switched to org {org_id}"
     db.session.commit()
+    session_service.invalidate_cached_session(current_session.token_hash)
 
     # Create a new session with the target org context
     user = g.current_user
@@ -103,6 +104,7 @@ def switch_org():
         org_id=org_id,
         store_id=None,
         token_hash=token_hash,
+        token_hash_prefix=session_service.token_hash_prefix(token_hash),
         created_at=now,
         last_used_at=now,
         expires_at=now + session_service.SESSION_ABSOLUTE_TIMEOUT,
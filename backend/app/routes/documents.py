@@ -10,7 +10,7 @@ from flask import Blueprint, request, jsonify, g
 
 from ..decorators import require_auth, require_permission
 from ..services.document_service import list_documents, get_document, DOCUMENT_TYPES
-from ..services.tenant_service import require_store_in_org, TenantAccessError, get_org_store_ids
+from ..services.tenant_service import require_store_in_org_exists, TenantAccessError, get_org_store_ids
 from ..services import user_store_access_service
 from app.time_utils import parse_iso_datetime
 
@@ -44,7 +44,7 @@ def list_documents_route():
 
     if store_id:
         try:
-            require_store_in_org(store_id, g.org_id)
+            require_store_in_org_exists(store_id, g.org_id)
         except TenantAccessError:
             return jsonify({"error": "Store not found"}), 404
         if store_id not in allowed_store_ids:
@@ -136,7 +136,7 @@ def get_sale_payments_route(sale_id: int):
         include_voided = request.args.get("include_voided", "false").lower() == "true"
 
         # Get sale
-        sale = db.session.query(Sale).get(sale_id)
+        sale = db.session.get(Sale, sale_id)
         if not sale:
             return jsonify({"error": "Sale not found"}), 404
 
@@ -171,7 +171,7 @@ def get_payment_route(payment_id: int):
 
     Returns payment with full transaction history (payment, voids, refunds).
     """
-    payment = db.session.query(Payment).get(payment_id)
+    payment = db.session.get(Payment, payment_id)
 
     if not payment:
         return jsonify({"error": "Payment not found"}), 404
@@ -29,6 +29,7 @@ from ..services import register_service, permission_service, store_service, sess
 from ..services.register_service import ShiftError
 from ..decorators import require_auth, require_permission
 from datetime import datetime
+from app.time_utils import utcnow
 
 
 registers_bp = Blueprint("registers", __name__, url_prefix="/api/registers")
@@ -45,7 +46,7 @@ def _is_global_operator() -> bool:
 def _ensure_store_scope(store_id: int | None):
     if store_id is not None:
         try:
-            tenant_service.require_store_in_org(store_id, g.org_id)
+            tenant_service.require_store_in_org_exists(store_id, g.org_id)
         except tenant_service.TenantAccessError:
             return jsonify({"error": "Store access denied"}), 403
     if _is_global_operator():
@@ -100,7 +101,7 @@ def create_register_route():
         if not all([store_id, name]):
             return jsonify({"error": "store_id and name required"}), 400
         try:
-            tenant_service.require_store_in_org(store_id, g.org_id)
+            tenant_service.require_store_in_org_exists(store_id, g.org_id)
         except tenant_service.TenantAccessError:
             return jsonify({"error": "Store access denied"}), 403
 
@@ -231,7 +232,7 @@ def update_register_route(register_id: int):
                 changed["is_active"] = {"from": register.is_active, "to": new_is_active}
                 register.is_active = new_is_active
 
-        register.updated_at = datetime.utcnow()
+        register.updated_at = utcnow()
         if changed:
             register_service.append_ledger_event(
                 store_id=register.store_id,
@@ -336,7 +337,7 @@ def close_shift_route(session_id: int):
         if closing_cash_cents < 0:
             return jsonify({"error": "closing_cash_cents cannot be negative"}), 400
 
-        session = db.session.query(RegisterSession).get(session_id)
+        session = db.session.get(RegisterSession, session_id)
         if not session:
             return jsonify({"error": "Session not found"}), 404
         scope_error = _ensure_store_scope(session.register.store_id)
@@ -427,7 +428,7 @@ def get_session_route(session_id: int):
     Requires: CREATE_SALE permission
     Available to: admin, manager, cashier
     """
-    session = db.session.query(RegisterSession).get(session_id)
+    session = db.session.get(RegisterSession, session_id)
 
     if not session:
         return jsonify({"error": "Session not found"}), 404
@@ -505,7 +506,7 @@ def no_sale_drawer_open_route(session_id: int):
     Prevents unauthorized drawer access.
     """
     try:
-        session = db.session.query(RegisterSession).get(session_id)
+        session = db.session.get(RegisterSession, session_id)
 
         if not session:
             return jsonify({"error": "Session not found"}), 404
@@ -575,7 +576,7 @@ def cash_drop_route(session_id: int):
     Requires manager approval for accountability.
     """
     try:
-        session = db.session.query(RegisterSession).get(session_id)
+        session = db.session.get(RegisterSession, session_id)
 
         if not session:
             return jsonify({"error": "Session not found"}), 404
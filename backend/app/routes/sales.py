@@ -103,7 +103,7 @@ def get_sale_route(sale_id: int):
     Requires: CREATE_SALE permission
     Available to: admin, manager, cashier
     """
-    sale = db.session.query(Sale).get(sale_id)
+    sale = db.session.get(Sale, sale_id)
     if not sale:
         return jsonify({"error": "Sale not found"}), 404
 
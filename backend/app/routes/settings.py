@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from flask import Blueprint, jsonify, request, g
+from flask import Blueprint, jsonify, make_response, request, g
 
 from ..decorators import require_auth
 from ..services import settings_service, permission_service
@@ -13,7 +13,7 @@ from ..services.settings_service import (
     SCOPE_DEVICE,
     SCOPE_USER,
 )
-from ..models import Register, Store, User
+from ..models import Register
 
 
 settings_bp = Blueprint("settings", __name__, url_prefix="/api")
@@ -39,18 +39,7 @@ def _parse_updates(payload: dict) -> list[dict]:
 
 
 def _scope_org(scope_type: str, scope_id: int) -> int | None:
-    if scope_type == SCOPE_ORG:
-        return scope_id
-    if scope_type == SCOPE_STORE:
-        store = Store.query.filter_by(id=scope_id).first()
-        return store.org_id if store else None
-    if scope_type == SCOPE_DEVICE:
-        device = Register.query.filter_by(id=scope_id).first()
-        return device.org_id if device else None
-    if scope_type == SCOPE_USER:
-        user = User.query.filter_by(id=scope_id).first()
-        return user.org_id if user else None
-    return None
+    return settings_service.scope_org_id_or_none(scope_type, scope_id)
 
 
 def _json_error(exc: Exception):
@@ -66,11 +55,16 @@ def _json_error(exc: Exception):
 @settings_bp.get("/settings/registry")
 @require_auth
 def get_settings_registry():
-    actor = _actor()
     # Visibility: managers+ for org-wide settings pages, but registry itself can be
     # loaded by authenticated users; edit permissions are enforced per key/scope.
-    data = settings_service.list_registry(actor)
-    return jsonify({"items": data, "count": len(data)})
+    # Only the developer flag affects the listing, so no full actor is built.
+    data, etag = settings_service.registry_listing(include_developer=bool(g.current_user.is_developer))
+    if request.if_none_match.contains(etag):
+        response = make_response("", 304)
+    else:
+        response = jsonify({"items": data, "count": len(data)})
+    response.set_etag(etag)
+    return response
 
 
 @settings_bp.get("/settings/effective")
@@ -16,7 +16,8 @@ from ..services import timekeeping_service
 from ..extensions import db
 from ..models import TimeClockEntry, User
 from ..services.timekeeping_service import TimekeepingError
-from ..services.tenant_service import require_store_in_org, TenantAccessError, get_org_store_ids
+from ..services.concurrency import commit_with_retry
+from ..services.tenant_service import require_store_in_org_exists, TenantAccessError, get_org_store_ids
 from app.time_utils import parse_iso_datetime
 
 
@@ -36,17 +37,20 @@ def clock_in_route():
         return jsonify({"error": "store_id is required"}), 400
 
     try:
-        require_store_in_org(store_id, g.org_id)
+        require_store_in_org_exists(store_id, g.org_id)
         entry = timekeeping_service.clock_in(
             user_id=g.current_user.id,
             store_id=store_id,
             register_session_id=register_session_id,
             notes=notes,
         )
+        commit_with_retry()
         return jsonify({"entry": entry.to_dict()}), 201
     except TenantAccessError:
+        db.session.rollback()
         return jsonify({"error": "Store not found"}), 404
     except TimekeepingError as e:
+        db.session.rollback()
         return jsonify({"error": str(e)}), 400
 
 
@@ -56,8 +60,10 @@ def clock_in_route():
 def clock_out_route():
     try:
         entry = timekeeping_service.clock_out(user_id=g.current_user.id)
+        commit_with_retry()
         return jsonify({"entry": entry.to_dict()})
     except TimekeepingError as e:
+        db.session.rollback()
         return jsonify({"error": str(e)}), 400
 
 
@@ -70,8 +76,10 @@ def start_break_route():
 
     try:
         brk = timekeeping_service.start_break(user_id=g.current_user.id, break_type=break_type)
+        commit_with_retry()
         return jsonify({"break": brk.to_dict()}), 201
     except TimekeepingError as e:
+        db.session.rollback()
         return jsonify({"error": str(e)}), 400
 
 
@@ -81,8 +89,10 @@ def start_break_route():
 def end_break_route():
     try:
         brk = timekeeping_service.end_break(user_id=g.current_user.id)
+        commit_with_retry()
         return jsonify({"break": brk.to_dict()})
     except TimekeepingError as e:
+        db.session.rollback()
         return jsonify({"error": str(e)}), 400
 
 
@@ -105,7 +115,7 @@ def list_entries_route():
         query = query.filter_by(user_id=user_id)
     if store_id:
         try:
-            require_store_in_org(store_id, g.org_id)
+            require_store_in_org_exists(store_id, g.org_id)
         except TenantAccessError:
             return jsonify({"error": "Store not found"}), 404
         query = query.filter_by(store_id=store_id)
@@ -161,8 +171,10 @@ def edit_entry_route(entry_id: int):
             notes=notes,
             reason=reason,
         )
+        commit_with_retry()
         return jsonify({"entry": entry.to_dict(), "edit_log": edit_log.to_dict()})
     except TimekeepingError as e:
+        db.session.rollback()
         return jsonify({"error": str(e)}), 400
 
 
@@ -197,8 +209,10 @@ def create_correction_route():
             reason=reason,
             submitted_by_user_id=g.current_user.id,
         )
+        commit_with_retry()
         return jsonify({"correction": correction.to_dict()}), 201
     except TimekeepingError as e:
+        db.session.rollback()
         return jsonify({"error": str(e)}), 400
 
 
@@ -215,6 +229,8 @@ def approve_correction_route(correction_id: int):
             approved_by_user_id=g.current_user.id,
             approval_notes=approval_notes,
         )
+        commit_with_retry()
         return jsonify({"correction": correction.to_dict()})
     except TimekeepingError as e:
+        db.session.rollback()
         return jsonify({"error": str(e)}), 400
@@ -44,7 +44,7 @@ def create_transfer():
             reason=data.get("reason"),
         )
 
-        commit_with_retry()
+        commit_with_retry(expire_on_commit=False)
 
         return jsonify(transfer.to_dict()), 201
 
@@ -88,7 +88,7 @@ def add_transfer_line(transfer_id: int):
             quantity=data["quantity"],
         )
 
-        commit_with_retry()
+        commit_with_retry(expire_on_commit=False)
 
         return jsonify(line.to_dict()), 201
 
@@ -123,7 +123,7 @@ def approve_transfer(transfer_id: int):
             user_id=g.current_user.id,
         )
 
-        commit_with_retry()
+        commit_with_retry(expire_on_commit=False)
 
         return jsonify(transfer.to_dict()), 200
 
@@ -156,7 +156,7 @@ def ship_transfer(transfer_id: int):
             user_id=g.current_user.id,
         )
 
-        commit_with_retry()
+        commit_with_retry(expire_on_commit=False)
 
         return jsonify(transfer.to_dict()), 200
 
@@ -189,7 +189,7 @@ def receive_transfer(transfer_id: int):
             user_id=g.current_user.id,
         )
 
-        commit_with_retry()
+        commit_with_retry(expire_on_commit=False)
 
         return jsonify(transfer.to_dict()), 200
 
@@ -233,7 +233,7 @@ def cancel_transfer(transfer_id: int):
             reason=reason,
         )
 
-        commit_with_retry()
+        commit_with_retry(expire_on_commit=False)
 
         return jsonify(transfer.to_dict()), 200
 
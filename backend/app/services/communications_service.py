@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from flask import g, has_request_context
 from sqlalchemy import or_
 
 from ..extensions import db
@@ -318,7 +319,7 @@ def list_tasks_for_user(org_id: int, user_id: int, store_id: int | None = None,
     return [t.to_dict() for t in q.order_by(Task.created_at.desc()).all()]
 
 
-def pending_tasks_for_clockout(org_id: int, user_id: int, store_id: int | None = None) -> list[dict]:
+def _pending_tasks_for_clockout_query(org_id: int, user_id: int, store_id: int | None):
     q = db.session.query(Task).filter(
         Task.org_id == org_id,
         Task.status == "PENDING",
@@ -326,9 +327,43 @@ def pending_tasks_for_clockout(org_id: int, user_id: int, store_id: int | None =
     )
     if store_id:
         q = q.filter(or_(Task.store_id == store_id, Task.store_id.is_(None)))
+    return q
+
+
+def pending_tasks_for_clockout(org_id: int, user_id: int, store_id: int | None = None) -> list[dict]:
+    q = _pending_tasks_for_clockout_query(org_id, user_id, store_id)
     return [t.to_dict() for t in q.order_by(Task.created_at.desc()).all()]
 
 
+def has_pending_tasks_for_clockout(org_id: int, user_id: int, store_id: int | None = None) -> bool:
+    """
+    Whether any pending task blocks a user's clock-out.
+
+    PERFORMANCE: An EXISTS probe instead of serializing the task rows, and
+    memoized per request so a retried clock-out does not rescan tasks.
+    Task writes drop the cache.
+    """
+    if not has_request_context():
+        return _load_has_pending_tasks(org_id, user_id, store_id)
+    cache = g.setdefault("_pending_tasks_cache", {})
+    key = (org_id, user_id, store_id)
+    pending = cache.get(key)
+    if pending is None:
+        pending = cache[key] = _load_has_pending_tasks(org_id, user_id, store_id)
+    return pending
+
+
+def _invalidate_pending_tasks_cache() -> None:
+    # Assignment and status edits can move a task between any cached keys
+    if has_request_context():
+        g.pop("_pending_tasks_cache", None)
+
+
+def _load_has_pending_tasks(org_id: int, user_id: int, store_id: int | None) -> bool:
+    q = _pending_tasks_for_clockout_query(org_id, user_id, store_id)
+    return db.session.query(q.exists()).scalar()
+
+
 def create_task(org_id: int, data: dict, user_id: int) -> dict:
     task = Task(
         org_id=org_id,
@@ -343,6 +378,7 @@ def create_task(org_id: int, data: dict, user_id: int) -> dict:
     )
     db.session.add(task)
     db.session.commit()
+    _invalidate_pending_tasks_cache()
     return task.to_dict()
 
 
@@ -374,6 +410,7 @@ def update_task(task_id: int, data: dict) -> dict | None:
         task.deferred_reason = data.get("deferred_reason")
 
     db.session.commit()
+    _invalidate_pending_tasks_cache()
     return task.to_dict()
 
 
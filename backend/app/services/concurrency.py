@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from contextlib import contextmanager
 
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm.exc import StaleDataError
@@ -40,8 +41,36 @@ def run_with_retry(func, *, attempts: int = 3, backoff_base: float = 0.1):
         raise last_exc
 
 
-def commit_with_retry(*, attempts: int = 3, backoff_base: float = 0.1):
-    """Commit current session with retry handling."""
+@contextmanager
+def no_expire_on_commit():
+    """
+    Keep loaded objects populated across a commit.
+
+    PERFORMANCE: A route that serializes the object it just wrote would
+    otherwise reload every expired row with a fresh SELECT after COMMIT.
+    """
+    session = db.session()
+    previous = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        yield session
+    finally:
+        session.expire_on_commit = previous
+
+
+def commit_with_retry(*, attempts: int = 3, backoff_base: float = 0.1, expire_on_commit: bool = True):
+    """
+    Commit current session with retry handling.
+
+    expire_on_commit=False: pass it when the caller serializes the objects
+    it just wrote straight after the commit (e.g. the transfer verb routes
+    returning to_dict()), so they stay loaded instead of being re-SELECTed.
+    See no_expire_on_commit.
+    """
     def _op():
-        db.session.commit()
+        if expire_on_commit:
+            db.session.commit()
+        else:
+            with no_expire_on_commit():
+                db.session.commit()
     return run_with_retry(_op, attempts=attempts, backoff_base=backoff_base)
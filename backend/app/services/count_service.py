@@ -254,6 +254,9 @@ def post_count(
         if count.status != COUNT_STATUS_APPROVED:
             raise CountError(f"Cannot post count in {count.status} status")
 
+        # One timestamp for the whole posting: every adjustment posts at the same instant
+        now = datetime.now(timezone.utc)
+
         # Create ADJUST transaction for each line with variance
         for line in count.lines:
             if line.variance_quantity == 0:
@@ -270,7 +273,7 @@ def post_count(
                 status="POSTED",  # Immediately affects inventory
                 inventory_state="SELLABLE",  # Adjusting sellable inventory
                 posted_by_user_id=user_id,
-                posted_at=datetime.now(timezone.utc),
+                posted_at=now,
                 note=f"Count {count.document_number} variance: {line.variance_quantity}",
             )
 
@@ -295,7 +298,7 @@ def post_count(
 
         count.status = COUNT_STATUS_POSTED
         count.posted_by_user_id = user_id
-        count.posted_at = datetime.now(timezone.utc)
+        count.posted_at = now
 
         append_ledger_event(
             store_id=count.store_id,
@@ -378,7 +381,7 @@ def get_count_summary(count_id: int) -> dict:
     Raises:
         CountError: If count not found
     """
-    count = db.session.query(Count).get(count_id)
+    count = db.session.get(Count, count_id)
     if not count:
         raise CountError(f"Count {count_id} not found")
 
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from sqlalchemy import update
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
 
 from ..extensions import db
 from ..models import (
@@ -38,7 +38,9 @@ def next_document_number(
     """
     Atomically allocate the next document number for a store/type.
 
-    Uses row-level lock on (store_id, document_type) to prevent race conditions.
+    A single INSERT ... ON CONFLICT DO UPDATE ... RETURNING creates or bumps
+    the (store_id, document_type) counter row under its row lock, so there
+    is no separate read and no insert race to recover from.
     """
     def _op() -> str:
         if not store_id:
@@ -46,42 +48,22 @@ def next_document_number(
         if not document_type:
             raise DocumentSequenceError("document_type is required")
 
+        dialect = db.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
         stmt = (
-            update(DocumentSequence)
-            .where(
-                DocumentSequence.store_id == store_id,
-                DocumentSequence.document_type == document_type,
+            insert(DocumentSequence)
+            .values(store_id=store_id, document_type=document_type, next_number=2)
+            .on_conflict_do_update(
+                index_elements=["store_id", "document_type"],
+                set_={
+                    "next_number": DocumentSequence.next_number + 1,
+                    "updated_at": func.now(),
+                },
             )
-            .values(next_number=DocumentSequence.next_number + 1)
+            .returning(DocumentSequence.next_number)
         )
-
-        result = db.session.execute(stmt)
-        if result.rowcount:
-            db.session.flush()
-            current = (
-                db.session.query(DocumentSequence.next_number)
-                .filter_by(store_id=store_id, document_type=document_type)
-                .scalar()
-            )
-            next_num = current - 1
-        else:
-            seq = DocumentSequence(store_id=store_id, document_type=document_type, next_number=2)
-            db.session.add(seq)
-            try:
-                db.session.flush()
-                next_num = 1
-            except IntegrityError:
-                db.session.rollback()
-                result = db.session.execute(stmt)
-                if not result.rowcount:
-                    raise
-                db.session.flush()
-                current = (
-                    db.session.query(DocumentSequence.next_number)
-                    .filter_by(store_id=store_id, document_type=document_type)
-                    .scalar()
-                )
-                next_num = current - 1
+        # next_number is the number the following call will hand out
+        next_num = db.session.execute(stmt).scalar_one() - 1
 
         return f"{prefix}-{store_id:03d}-{next_num:0{pad}d}"
 
@@ -363,7 +345,7 @@ def get_document(doc_type: str, doc_id: int) -> dict | None:
     if not model:
         return None
 
-    doc = db.session.query(model).filter_by(id=doc_id).first()
+    doc = db.session.get(model, doc_id)
     if not doc:
         return None
 
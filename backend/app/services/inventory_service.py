@@ -120,6 +120,53 @@ def get_quantity_on_hand(store_id: int, product_id: int, as_of: datetime | None
     return int(q.scalar() or 0)
 
 
+def get_quantities_on_hand(store_id: int, product_ids: list[int]) -> dict[int, int]:
+    """
+    Quantity on hand for several products at one store in a single query.
+
+    Same POSTED-only rule as get_quantity_on_hand; products without any
+    posted transactions are reported as 0.
+
+    WHY: Multi-line documents (e.g. transfers) validate every line; one
+    grouped SUM replaces a query per line.
+    """
+    if not product_ids:
+        return {}
+    rows = (
+        db.session.query(
+            InventoryTransaction.product_id,
+            func.coalesce(func.sum(InventoryTransaction.quantity_delta), 0),
+        )
+        .filter(
+            InventoryTransaction.store_id == store_id,
+            InventoryTransaction.product_id.in_(product_ids),
+            InventoryTransaction.status == "POSTED",  # Only count posted
+        )
+        .group_by(InventoryTransaction.product_id)
+        .all()
+    )
+    on_hand = {product_id: 0 for product_id in product_ids}
+    on_hand.update({product_id: int(qty or 0) for product_id, qty in rows})
+    return on_hand
+
+
+def find_insufficient_inventory(store_id: int, requested: dict[int, int]) -> dict[int, int]:
+    """
+    Products whose on-hand falls short of the requested quantity.
+
+    Returns {product_id: on_hand} for the short products only, from the
+    single grouped query behind get_quantities_on_hand. Products without
+    posted transactions count as 0 on hand, which a HAVING filter on the
+    grouped rows could not report.
+    """
+    on_hand = get_quantities_on_hand(store_id, list(requested))
+    return {
+        product_id: qty
+        for product_id, qty in on_hand.items()
+        if qty < requested[product_id]
+    }
+
+
 def get_weighted_average_cost_cents(
     store_id: int, product_id: int, as_of: datetime | None = None
 ) -> int | None:
@@ -151,11 +198,47 @@ def get_weighted_average_cost_cents(
         q = q.filter(InventoryTransaction.occurred_at <= as_of)
 
     row = q.one()
-    total_units = int(row.units or 0)
+    return _wac_from_totals(row.units, row.cost)
+
+
+def get_weighted_average_costs_cents(
+    store_id: int, product_ids: list[int], as_of: datetime | None = None
+) -> dict[int, int | None]:
+    """
+    Weighted average cost for several products at one store in a single query.
+
+    Same POSTED RECEIVE/inbound TRANSFER rules as get_weighted_average_cost_cents;
+    products without cost basis are reported as None.
+    """
+    if not product_ids:
+        return {}
+    q = db.session.query(
+        InventoryTransaction.product_id,
+        func.sum(InventoryTransaction.quantity_delta),
+        func.sum(InventoryTransaction.quantity_delta * InventoryTransaction.unit_cost_cents),
+    ).filter(
+        InventoryTransaction.store_id == store_id,
+        InventoryTransaction.product_id.in_(product_ids),
+        InventoryTransaction.type.in_(["RECEIVE", "TRANSFER"]),
+        InventoryTransaction.status == "POSTED",  # Only count posted
+        InventoryTransaction.quantity_delta > 0,
+        InventoryTransaction.unit_cost_cents.isnot(None),
+    )
+    if as_of is not None:
+        q = q.filter(InventoryTransaction.occurred_at <= as_of)
+
+    costs = {product_id: None for product_id in product_ids}
+    for product_id, units, cost in q.group_by(InventoryTransaction.product_id).all():
+        costs[product_id] = _wac_from_totals(units, cost)
+    return costs
+
+
+def _wac_from_totals(units, cost) -> int | None:
+    total_units = int(units or 0)
     if total_units <= 0:
         return None
 
-    total_cost = int(row.cost or 0)
+    total_cost = int(cost or 0)
     # nearest-cent rounding (half-up)
     return (total_cost + (total_units // 2)) // total_units
 
@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import Optional
 from datetime import datetime
 
+from sqlalchemy import insert
+
 from ..extensions import db
 from ..models import MasterLedgerEvent, OrganizationMasterLedger, Store
 """
@@ -49,7 +51,7 @@ def append_ledger_event(
     - No deletes/updates of existing events.
     - occurred_at is business time; created_at is system time (db default).
     """
-    store = db.session.query(Store).filter_by(id=store_id).first()
+    store = db.session.get(Store, store_id)
     if not store:
         raise ValueError(f"Store {store_id} not found for ledger event")
 
@@ -84,6 +86,39 @@ def append_ledger_event(
     return ev
 
 
+def append_ledger_events(events: list[dict]) -> None:
+    """
+    Append several master ledger events in one bulk INSERT.
+
+    Each item takes the same keyword arguments as append_ledger_event.
+    Stores and org ledgers are resolved once per distinct store/org rather
+    than per event; events are inserted in input order.
+
+    PERFORMANCE: Rows go straight to a Core-level executemany, skipping ORM
+    instance setup. Callers that need the event objects back should use
+    append_ledger_event.
+    """
+    if not events:
+        return
+
+    store_ids = {e["store_id"] for e in events}
+    org_by_store = dict(db.session.query(Store.id, Store.org_id).filter(Store.id.in_(store_ids)).all())
+    missing = store_ids - org_by_store.keys()
+    if missing:
+        raise ValueError(f"Store(s) {sorted(missing)} not found for ledger event")
+
+    ledger_id_by_org = {org_id: ensure_org_master_ledger(org_id).id for org_id in set(org_by_store.values())}
+
+    rows = []
+    for e in events:
+        row = {"org_ledger_id": ledger_id_by_org[org_by_store[e["store_id"]]], **e}
+        if row.get("occurred_at") is None:
+            # Leave the column out so the db default applies, as with a single append
+            row.pop("occurred_at", None)
+        rows.append(row)
+    db.session.execute(insert(MasterLedgerEvent), rows)
+
+
 def ensure_org_master_ledger(org_id: int, name: str = "Master Ledger") -> OrganizationMasterLedger:
     """
     Ensure an organization has exactly one master ledger record.
@@ -147,7 +147,7 @@ def approve_transaction(
     - Approval does NOT create master ledger events (only POSTED does)
     - Approval timestamp is recorded for audit trail
     """
-    tx = db.session.query(InventoryTransaction).get(transaction_id)
+    tx = db.session.get(InventoryTransaction, transaction_id)
     if tx is None:
         raise ValueError(f"InventoryTransaction {transaction_id} not found")
 
@@ -199,7 +199,7 @@ def post_transaction(
     to centralize lifecycle behavior. For now, inventory_service still handles it
     for backwards compatibility.
     """
-    tx = db.session.query(InventoryTransaction).get(transaction_id)
+    tx = db.session.get(InventoryTransaction, transaction_id)
     if tx is None:
         raise ValueError(f"InventoryTransaction {transaction_id} not found")
 
@@ -219,7 +219,7 @@ def get_sale_remaining_balance(sale_id: int) -> int:
     Returns:
         Amount remaining in cents (can be negative if overpaid)
     """
-    sale = db.session.query(Sale).get(sale_id)
+    sale = db.session.get(Sale, sale_id)
     if not sale:
         raise PaymentError(f"Sale {sale_id} not found")
 
@@ -349,7 +349,7 @@ def _log_payment_transaction(
         "REFUND": "payment.refunded",
     }.get(transaction_type, "payment.event")
 
-    sale = db.session.query(Sale).get(sale_id) if sale_id else None
+    sale = db.session.get(Sale, sale_id) if sale_id else None
     if not sale:
         raise PaymentError("Sale not found for payment transaction")
     store_id = sale.store_id
@@ -385,7 +385,7 @@ def _update_sale_payment_status(sale_id: int) -> None:
     - PAID: total_paid = total_due
     - OVERPAID: total_paid > total_due (cash over-tender)
     """
-    sale = db.session.query(Sale).get(sale_id)
+    sale = db.session.get(Sale, sale_id)
     if not sale:
         return
 
@@ -526,7 +526,7 @@ def get_payment_summary(sale_id: int) -> dict:
         - payment_status: UNPAID, PARTIAL, PAID, OVERPAID
         - payments: List of payment records
     """
-    sale = db.session.query(Sale).get(sale_id)
+    sale = db.session.get(Sale, sale_id)
     if not sale:
         raise PaymentError(f"Sale {sale_id} not found")
 
@@ -16,6 +16,8 @@ DESIGN PRINCIPLES:
 - Tenant isolation: All queries and logs scoped by org_id
 """
 
+from sqlalchemy import literal, select, union_all
+
 from ..extensions import db
 from ..models import User, UserRole, Role, RolePermission, Permission, SecurityEvent, UserPermissionOverride
 from ..permissions import PERMISSION_DEFINITIONS, DEFAULT_ROLE_PERMISSIONS
@@ -113,35 +115,39 @@ def get_user_permissions(user_id: int) -> set[str]:
     WHY: Centralized permission resolution. Checks all user's roles
     and collects union of their permissions.
     """
-    # Collect all permission codes from roles
-    permission_codes: set[str] = set()
-
-    user_roles = db.session.query(UserRole).filter_by(user_id=user_id).all()
-    for user_role in user_roles:
-        role_permissions = db.session.query(RolePermission).filter_by(
-            role_id=user_role.role_id
-        ).all()
-
-        for role_perm in role_permissions:
-            permission = db.session.query(Permission).get(role_perm.permission_id)
-            if permission:
-                permission_codes.add(permission.code)
-
-    # Apply per-user overrides (GRANT/DENY)
-    overrides = db.session.query(UserPermissionOverride).filter_by(
-        user_id=user_id,
-        is_active=True,
-    ).all()
+    # Role permissions and active overrides come back from one UNION ALL
+    # statement, tagged with their source, instead of a query per role and
+    # per role permission.
+    role_codes = (
+        select(Permission.code, literal("ROLE"))
+        .join(RolePermission, RolePermission.permission_id == Permission.id)
+        .join(UserRole, UserRole.role_id == RolePermission.role_id)
+        .where(UserRole.user_id == user_id)
+    )
+    override_codes = select(
+        UserPermissionOverride.permission_code,
+        UserPermissionOverride.override_type,
+    ).where(
+        UserPermissionOverride.user_id == user_id,
+        UserPermissionOverride.is_active.is_(True),
+    )
+    rows = db.session.execute(union_all(role_codes, override_codes)).all()
 
-    for override in overrides:
+    permission_codes: set[str] = set()
+    denied: set[str] = set()
+    for code, source in rows:
+        if source == "ROLE":
+            permission_codes.add(code)
         # Never allow overrides to change protected permissions
-        if override.permission_code in PROTECTED_PERMISSIONS:
+        elif code in PROTECTED_PERMISSIONS:
             continue
-        if override.override_type == "GRANT":
-            permission_codes.add(override.permission_code)
-        elif override.override_type == "DENY":
-            permission_codes.discard(override.permission_code)
+        elif source == "GRANT":
+            permission_codes.add(code)
+        elif source == "DENY":
+            denied.add(code)
 
+    # Per-user overrides (GRANT/DENY) take precedence over roles
+    permission_codes -= denied
     return permission_codes
 
 
@@ -286,7 +292,7 @@ def get_user_role_names(user_id: int) -> list[str]:
 
     role_names = []
     for user_role in user_roles:
-        role = db.session.query(Role).get(user_role.role_id)
+        role = db.session.get(Role, user_role.role_id)
         if role:
             role_names.append(role.name)
 
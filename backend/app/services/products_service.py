@@ -15,7 +15,7 @@ from ..extensions import db
 from ..models import Product, Store
 from ..validation import ConflictError
 from ..services.ledger_service import append_ledger_event
-from ..services.tenant_service import require_store_in_org, get_org_store_ids, TenantAccessError
+from ..services.tenant_service import require_store_in_org, require_store_in_org_exists, get_org_store_ids, TenantAccessError
 from app.time_utils import utcnow
 
 PRODUCT_MUTABLE_FIELDS = {"sku", "name", "description", "price_cents", "is_active"}
@@ -73,7 +73,7 @@ def list_products(
 
         # If specific store requested, validate it belongs to org
         if store_id is not None:
-            require_store_in_org(store_id, org_id)
+            require_store_in_org_exists(store_id, org_id)
             store_ids = {store_id}
 
     # Build query filtered to tenant's stores
@@ -225,7 +225,7 @@ def delete_product(*, product_id: int, org_id: int | None = None) -> bool:
 
     # MULTI-TENANT: Verify product's store belongs to org
     if org_id is not None:
-        require_store_in_org(p.store_id, org_id)
+        require_store_in_org_exists(p.store_id, org_id)
 
     # Soft-delete only: preserve IDs and historical references.
     if p.is_active:
@@ -272,7 +272,7 @@ def update_product(*, product_id: int, patch: dict, org_id: int | None = None) -
 
     # MULTI-TENANT: Verify product's store belongs to org
     if org_id is not None:
-        require_store_in_org(p.store_id, org_id)
+        require_store_in_org_exists(p.store_id, org_id)
 
     # SKU uniqueness enforcement if changing SKU
     if "sku" in patch and patch["sku"] != p.sku:
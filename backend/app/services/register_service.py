@@ -124,7 +124,7 @@ def deactivate_register(register_id: int) -> Register:
     WHY: Registers are never deleted (preserve historical data).
     Inactive registers cannot open new shifts.
     """
-    register = db.session.query(Register).get(register_id)
+    register = db.session.get(Register, register_id)
 
     if not register:
         raise RegisterError("Register not found")
@@ -168,7 +168,7 @@ def open_shift(
         ShiftError: If register has open shift or is inactive
     """
     # Check register exists and is active
-    register = db.session.query(Register).get(register_id)
+    register = db.session.get(Register, register_id)
 
     if not register:
         raise ShiftError("Register not found")
@@ -362,7 +362,7 @@ def log_drawer_event(
     db.session.add(event)
     db.session.flush()
 
-    register = db.session.query(Register).get(register_id)
+    register = db.session.get(Register, register_id)
     if not register:
         raise ShiftError("Register not found")
     store_id = register.store_id
@@ -406,7 +406,7 @@ def open_drawer_no_sale(
     Common reasons: Make change, give refund, fix error, etc.
     """
     # Verify session is open
-    session = db.session.query(RegisterSession).get(register_session_id)
+    session = db.session.get(RegisterSession, register_session_id)
 
     if not session or session.status != "OPEN":
         raise ShiftError("Session not open")
@@ -492,7 +492,7 @@ def get_shift_summary(session_id: int) -> dict:
         - Cash drawer event count
         - Variance information
     """
-    session = db.session.query(RegisterSession).get(session_id)
+    session = db.session.get(RegisterSession, session_id)
 
     if not session:
         raise ShiftError("Session not found")
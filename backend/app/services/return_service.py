@@ -194,7 +194,7 @@ def add_return_line(
 
         # Get original COGS from inventory transaction
         # CRITICAL: This is the original cost at sale time, not current WAC
-        original_inv_txn = db.session.query(InventoryTransaction).get(sale_line.inventory_transaction_id)
+        original_inv_txn = db.session.get(InventoryTransaction, sale_line.inventory_transaction_id)
         original_unit_cost_cents = None
         original_cogs_cents = None
 
@@ -468,7 +468,7 @@ def _update_return_refund_amount(return_id: int) -> None:
 
     Refund = Sum of all return line refunds - restocking fee
     """
-    return_doc = db.session.query(Return).get(return_id)
+    return_doc = db.session.get(Return, return_id)
     if not return_doc:
         return
 
@@ -490,7 +490,7 @@ def _update_return_refund_amount(return_id: int) -> None:
 
 def get_return(return_id: int) -> Return | None:
     """Get return by ID."""
-    return db.session.query(Return).get(return_id)
+    return db.session.get(Return, return_id)
 
 
 def get_sale_returns(sale_id: int) -> list[Return]:
@@ -523,7 +523,7 @@ def get_return_summary(return_id: int) -> dict:
         - original_sale: Original sale info
         - total_refund: Total refund amount
     """
-    return_doc = db.session.query(Return).get(return_id)
+    return_doc = db.session.get(Return, return_id)
     if not return_doc:
         raise ReturnError(f"Return {return_id} not found")
 
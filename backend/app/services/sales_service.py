@@ -211,7 +211,7 @@ def void_sale(
             if not line.inventory_transaction_id:
                 raise SaleError("Sale line missing inventory transaction")
 
-            original_tx = db.session.query(InventoryTransaction).get(line.inventory_transaction_id)
+            original_tx = db.session.get(InventoryTransaction, line.inventory_transaction_id)
             if not original_tx:
                 raise SaleError("Original inventory transaction not found")
 
@@ -20,10 +20,16 @@ SECURITY FEATURES:
 - Tenant context (org_id) is immutable for the session lifetime
 """
 
+import hmac
 import secrets
 import hashlib
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import NamedTuple
+from sqlalchemy import bindparam, delete, event, exists, or_, select, update
+from sqlalchemy.orm import joinedload, make_transient_to_detached
 from ..extensions import db
 from ..models import SessionToken, User, Organization
 from app.time_utils import utcnow
@@ -32,15 +38,39 @@ from app.time_utils import utcnow
 # Configuration constants
 SESSION_ABSOLUTE_TIMEOUT = timedelta(hours=24)  # Maximum session length
 SESSION_IDLE_TIMEOUT = timedelta(hours=2)        # Activity timeout
+SESSION_ACTIVITY_WRITE_INTERVAL = timedelta(seconds=60)  # Min gap between last_used_at writes
+SESSION_CACHE_TTL = timedelta(seconds=60)        # Max staleness of a cached validation
+SESSION_CACHE_MAX_SIZE = 10_000                  # LRU bound on cached sessions
+SESSION_CLEANUP_BATCH_SIZE = 10_000              # Rows deleted per cleanup transaction
 
 
-@dataclass
+# Process-local cache of validated sessions, keyed by token_hash.
+# Values are (cached_at, _CachedSession). Only the session's ids and
+# timestamps are cached; the user (and org) are re-read on every hit so
+# deactivations and role/password changes apply immediately.
+_session_cache: OrderedDict[str, tuple] = OrderedDict()
+_session_cache_lock = threading.Lock()
+
+
+class _CachedSession(NamedTuple):
+    id: int
+    user_id: int
+    org_id: int | None
+    store_id: int | None
+    expires_at: datetime
+    last_used_at: datetime
+
+
+@dataclass(slots=True, frozen=True)
 class SessionContext:
     """
     Complete session context returned by validate_session.
 
     MULTI-TENANT: Contains both user identity and tenant context.
     All fields are set from the immutable session record.
+
+    Frozen with __slots__: built once per authenticated request, so no
+    per-instance __dict__ is allocated.
     """
     user: User
     session: SessionToken
@@ -73,6 +103,66 @@ def hash_token(token: str) -> str:
     return hashlib.sha256(token.encode('utf-8')).hexdigest()
 
 
+def token_hash_prefix(token_hash: str) -> int:
+    """
+    Leading 8 bytes of a token hash as a signed 64-bit integer.
+
+    Stored in SessionToken.token_hash_prefix. Lookups walk the compact
+    BIGINT index instead of the 64-character string index; the full hash
+    is then verified in Python (see _find_session).
+    """
+    return int.from_bytes(bytes.fromhex(token_hash[:16]), "big", signed=True)
+
+
+def _match_token(candidates, token_hash: str) -> SessionToken | None:
+    """Pick the candidate whose full hash matches (constant-time compare)."""
+    for session in candidates:
+        if hmac.compare_digest(session.token_hash, token_hash):
+            return session
+    return None
+
+
+def _find_session(token_hash: str, *criteria, options=()) -> SessionToken | None:
+    """
+    Locate a session by hash prefix and confirm the full hash.
+
+    Extra criteria are applied in SQL; options are loader options (e.g.
+    joinedload) for relationships the caller is about to touch.
+    hmac.compare_digest keeps the final comparison constant-time.
+    """
+    candidates = db.session.query(SessionToken).options(*options).filter(
+        SessionToken.token_hash_prefix == token_hash_prefix(token_hash),
+        *criteria
+    ).all()
+    return _match_token(candidates, token_hash)
+
+
+# Hot validate_session lookup, built once at import. Every per-call value is
+# a bound parameter, so the statement is never reconstructed and always hits
+# SQLAlchemy's compiled-statement cache.
+_VALID_SESSION_STMT = (
+    select(SessionToken)
+    .options(joinedload(SessionToken.user))
+    .where(
+        SessionToken.token_hash_prefix == bindparam("prefix"),
+        SessionToken.is_revoked.is_(False),
+        SessionToken.expires_at >= bindparam("now"),
+        SessionToken.last_used_at >= bindparam("idle_cutoff"),
+        exists().where(
+            User.id == SessionToken.user_id,
+            User.is_active.is_(True),
+        ),
+        or_(
+            SessionToken.org_id.is_(None),
+            exists().where(
+                Organization.id == SessionToken.org_id,
+                Organization.is_active.is_(True),
+            ),
+        ),
+    )
+)
+
+
 def create_session(
     user_id: int,
     user_agent: str | None = None,
@@ -89,20 +179,23 @@ def create_session(
 
     Raises ValueError if user has no org_id (tenant context required).
     """
-    # Get user to capture tenant context
-    user = db.session.query(User).filter_by(id=user_id).first()
-    if not user:
+    # Get user tenant context and org status in one round-trip
+    row = db.session.execute(
+        select(User.org_id, User.store_id, User.is_developer, Organization.is_active)
+        .outerjoin(Organization, Organization.id == User.org_id)
+        .where(User.id == user_id)
+    ).one_or_none()
+    if not row:
         raise ValueError("User not found")
+    user_org_id, user_store_id, is_developer, org_is_active = row
 
     # MULTI-TENANT: Require org_id for non-developer users
-    if not user.org_id and not user.is_developer:
+    if not user_org_id and not is_developer:
         raise ValueError("User must belong to an organization")
 
     # Verify organization is active (if user has one)
-    if user.org_id:
-        org = db.session.query(Organization).filter_by(id=user.org_id).first()
-        if not org or not org.is_active:
-            raise ValueError("Organization is not active")
+    if user_org_id and not org_is_active:
+        raise ValueError("Organization is not active")
 
     plaintext_token = generate_token()
     token_hash = hash_token(plaintext_token)
@@ -110,12 +203,12 @@ def create_session(
     now = utcnow()
     expires_at = now + SESSION_ABSOLUTE_TIMEOUT
 
-    session_org_id = user.org_id
-    session_store_id = user.store_id
+    session_org_id = user_org_id
+    session_store_id = user_store_id
 
     # Developers are global operators and must not be implicitly org/store bound.
     # They can choose org context explicitly via developer switch-org flow.
-    if user.is_developer:
+    if is_developer:
         session_org_id = None
         session_store_id = None
 
@@ -124,6 +217,7 @@ def create_session(
         org_id=session_org_id,  # MULTI-TENANT: Capture tenant context
         store_id=session_store_id,  # May be None for org-level users
         token_hash=token_hash,
+        token_hash_prefix=token_hash_prefix(token_hash),
         created_at=now,
         last_used_at=now,
         expires_at=expires_at,
@@ -154,67 +248,225 @@ def validate_session(token: str) -> SessionContext | None:
     Updates last_used_at on successful validation (activity tracking).
 
     WHY: Central validation point. All protected routes call this.
+
+    PERFORMANCE: Recently validated tokens are served from a process-local
+    cache without querying session_tokens; only the user (and org) are
+    re-read by primary key. On a miss, one prebuilt SELECT checks every
+    validity rule in SQL and eager-loads the user. last_used_at is only written (and committed) when
+    the stored value is older than SESSION_ACTIVITY_WRITE_INTERVAL, so a
+    burst of requests costs one write per minute instead of one per request.
+    Sub-minute precision is irrelevant against a 2-hour idle timeout.
+    Only when no row matches do we fall back to working out which rule
+    failed (and auto-revoke).
     """
     token_hash = hash_token(token)
     now = utcnow()
 
-    # Find session by token hash
-    session = db.session.query(SessionToken).filter_by(
-        token_hash=token_hash,
-        is_revoked=False
-    ).first()
+    cached = _cached_session_context(token_hash, now)
+    if cached:
+        return cached
+
+    candidates = db.session.execute(
+        _VALID_SESSION_STMT,
+        {
+            "prefix": token_hash_prefix(token_hash),
+            "now": now,
+            "idle_cutoff": now - SESSION_IDLE_TIMEOUT,
+        },
+    ).unique().scalars()
+    session = _match_token(candidates, token_hash)
 
     if not session:
+        _revoke_invalid_session(token_hash, now)
         return None
 
-    # Check absolute timeout
-    if session.expires_at < now:
-        return None
+    user = session.user
 
-    # Check idle timeout
-    idle_time = now - session.last_used_at
-    if idle_time > SESSION_IDLE_TIMEOUT:
-        # Auto-revoke idle sessions
-        session.is_revoked = True
-        session.revoked_at = now
-        session.revoked_reason = "Idle timeout"
+    # Coalesced activity tracking
+    if now - session.last_used_at > SESSION_ACTIVITY_WRITE_INTERVAL:
+        session.last_used_at = now
+        _cache_put(token_hash, session, now)
         db.session.commit()
-        return None
+    else:
+        _cache_put(token_hash, session, now)
 
-    # Get the associated user
-    user = session.user
+    # Return full context with tenant information
+    return SessionContext(
+        user=user,
+        session=session,
+        org_id=session.org_id,
+        store_id=session.store_id
+    )
 
-    # SECURITY: Check if user account is active
-    if not user or not user.is_active:
-        session.is_revoked = True
-        session.revoked_at = now
-        session.revoked_reason = "User account deactivated"
-        db.session.commit()
+
+def _attach_session(cached: _CachedSession) -> SessionToken:
+    """
+    Rebuild the SessionToken from its cached ids and timestamps without a
+    SELECT. Columns that are not cached (token_hash, is_revoked, ...) are
+    left unloaded and are read from the database only if accessed.
+    """
+    obj = SessionToken(**cached._asdict())
+    make_transient_to_detached(obj)
+    return db.session.merge(obj, load=False)
+
+
+def _cache_put(token_hash: str, session: SessionToken, now) -> None:
+    entry = (
+        now,
+        _CachedSession(
+            id=session.id,
+            user_id=session.user_id,
+            org_id=session.org_id,
+            store_id=session.store_id,
+            expires_at=session.expires_at,
+            last_used_at=session.last_used_at,
+        ),
+    )
+    with _session_cache_lock:
+        _session_cache[token_hash] = entry
+        _session_cache.move_to_end(token_hash)
+        while len(_session_cache) > SESSION_CACHE_MAX_SIZE:
+            _session_cache.popitem(last=False)
+
+
+def _cached_session_context(token_hash: str, now) -> SessionContext | None:
+    """
+    Fast path for validate_session: serve a recently validated session
+    from the process-local cache without querying session_tokens.
+
+    Only ids and timestamps are cached. The user, and the org when the
+    session has one, are loaded by primary key on every hit (identity map
+    first), so a deactivation in any process takes effect on the next
+    request. Revocations in this process invalidate entries immediately;
+    revocations made by other processes are picked up within
+    SESSION_CACHE_TTL. Timeouts are re-checked on every hit.
+    """
+    with _session_cache_lock:
+        entry = _session_cache.get(token_hash)
+        if entry is None:
+            return None
+        cached_at, cached = entry
+        if now - cached_at > SESSION_CACHE_TTL:
+            del _session_cache[token_hash]
+            return None
+        _session_cache.move_to_end(token_hash)
+
+    if cached.expires_at < now or now - cached.last_used_at > SESSION_IDLE_TIMEOUT:
+        invalidate_cached_session(token_hash)
         return None
 
-    # MULTI-TENANT: Check if organization is still active
-    if session.org_id is not None:
-        org = session.organization
-        if not org or not org.is_active:
-            session.is_revoked = True
-            session.revoked_at = now
-            session.revoked_reason = "Organization deactivated"
-            db.session.commit()
+    # SECURITY: Never trust cached account state; the full path re-checks
+    # and auto-revokes when the user or org has been deactivated.
+    user = db.session.get(User, cached.user_id)
+    if user is None or not user.is_active:
+        invalidate_cached_session(token_hash)
+        return None
+    if cached.org_id is not None:
+        org = db.session.get(Organization, cached.org_id)
+        if org is None or not org.is_active:
+            invalidate_cached_session(token_hash)
             return None
 
-    # Valid session - update activity timestamp
-    session.last_used_at = now
-    db.session.commit()
+    if now - cached.last_used_at > SESSION_ACTIVITY_WRITE_INTERVAL:
+        db.session.execute(
+            update(SessionToken)
+            .where(SessionToken.id == cached.id)
+            .values(last_used_at=now)
+        )
+        db.session.commit()
+        cached = cached._replace(last_used_at=now)
+        with _session_cache_lock:
+            if token_hash in _session_cache:
+                _session_cache[token_hash] = (cached_at, cached)
 
-    # Return full context with tenant information
     return SessionContext(
         user=user,
-        session=session,
-        org_id=session.org_id,
-        store_id=session.store_id
+        session=_attach_session(cached),
+        org_id=cached.org_id,
+        store_id=cached.store_id
     )
 
 
+def invalidate_cached_session(token_hash: str) -> None:
+    """Drop a session from the validation cache (call after revoking it)."""
+    with _session_cache_lock:
+        _session_cache.pop(token_hash, None)
+
+
+def _invalidate_cached_sessions_where(predicate) -> None:
+    with _session_cache_lock:
+        stale = [
+            token_hash
+            for token_hash, (_, cached) in _session_cache.items()
+            if predicate(cached)
+        ]
+        for token_hash in stale:
+            del _session_cache[token_hash]
+
+
+def _invalidate_cached_user_sessions(user_id: int) -> None:
+    _invalidate_cached_sessions_where(lambda cached: cached.user_id == user_id)
+
+
+def invalidate_cached_org_sessions(org_id: int) -> None:
+    """Drop every cached session scoped to an organization."""
+    _invalidate_cached_sessions_where(lambda cached: cached.org_id == org_id)
+
+
+@event.listens_for(Organization.is_active, "set")
+def _on_org_is_active_set(org, value, oldvalue, initiator):
+    # Deactivating an org drops its cached sessions in this process at once;
+    # other processes refuse them on their next hit via the org re-check.
+    if not value and org.id is not None:
+        invalidate_cached_org_sessions(org.id)
+
+
+def _revoke_invalid_session(token_hash: str, now) -> None:
+    """
+    Slow path for validate_session: determine why a token was rejected.
+
+    Idle sessions and sessions whose user or organization has been
+    deactivated are auto-revoked with a reason; unknown, revoked, and
+    expired tokens are left untouched.
+    """
+    session = _find_session(
+        token_hash,
+        SessionToken.is_revoked.is_(False),
+        options=(joinedload(SessionToken.user), joinedload(SessionToken.organization)),
+    )
+
+    if not session:
+        return
+
+    # Check absolute timeout
+    if session.expires_at < now:
+        return
+
+    reason = None
+    if now - session.last_used_at > SESSION_IDLE_TIMEOUT:
+        reason = "Idle timeout"
+    elif not session.user or not session.user.is_active:
+        reason = "User account deactivated"
+    elif session.org_id is not None and (
+        not session.organization or not session.organization.is_active
+    ):
+        reason = "Organization deactivated"
+
+    if reason is None:
+        # Lost a race with a concurrent update; treat as invalid this time.
+        return
+
+    # Conditional UPDATE: a no-op if a concurrent revoke_session won the race,
+    # so no row lock is needed between the SELECT above and this write.
+    db.session.execute(
+        update(SessionToken)
+        .where(SessionToken.id == session.id, SessionToken.is_revoked.is_(False))
+        .values(is_revoked=True, revoked_at=now, revoked_reason=reason)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+
 def revoke_session(token: str, reason: str = "User logout") -> bool:
     """
     Revoke session token.
@@ -226,10 +478,7 @@ def revoke_session(token: str, reason: str = "User logout") -> bool:
     """
     token_hash = hash_token(token)
 
-    session = db.session.query(SessionToken).filter_by(
-        token_hash=token_hash,
-        is_revoked=False
-    ).first()
+    session = _find_session(token_hash, SessionToken.is_revoked.is_(False))
 
     if not session:
         return False
@@ -239,6 +488,7 @@ def revoke_session(token: str, reason: str = "User logout") -> bool:
     session.revoked_reason = reason
 
     db.session.commit()
+    invalidate_cached_session(token_hash)
     return True
 
 
@@ -250,26 +500,24 @@ def revoke_all_user_sessions(user_id: int, reason: str = "Revoke all sessions")
 
     WHY: Security response (password change, account compromise, etc.)
     Forces re-authentication on all devices.
-    """
-    now = utcnow()
 
-    sessions = db.session.query(SessionToken).filter_by(
+    Issued as a single bulk UPDATE; no session rows are loaded.
+    """
+    count = db.session.query(SessionToken).filter_by(
         user_id=user_id,
         is_revoked=False
-    ).all()
-
-    count = 0
-    for session in sessions:
-        session.is_revoked = True
-        session.revoked_at = now
-        session.revoked_reason = reason
-        count += 1
+    ).update({
+        "is_revoked": True,
+        "revoked_at": utcnow(),
+        "revoked_reason": reason,
+    }, synchronize_session=False)
 
     db.session.commit()
+    _invalidate_cached_user_sessions(user_id)
     return count
 
 
-def cleanup_expired_sessions() -> int:
+def cleanup_expired_sessions(batch_size: int = SESSION_CLEANUP_BATCH_SIZE) -> int:
     """
     Delete expired and revoked sessions older than 30 days.
 
@@ -277,17 +525,32 @@ def cleanup_expired_sessions() -> int:
 
     WHY: Database cleanup. Expired sessions accumulate over time.
     Run this periodically (daily cron job recommended).
+
+    Deletes in batches of batch_size rows, committing between batches, so
+    a large backlog never holds one long table lock or one huge transaction.
     """
-    cutoff = utcnow() - timedelta(days=30)
+    now = utcnow()
+    cutoff = now - timedelta(days=30)
 
     # Delete sessions that are both old AND (expired OR revoked)
-    deleted = db.session.query(SessionToken).filter(
-        db.or_(
-            SessionToken.expires_at < utcnow(),
-            SessionToken.is_revoked == True
-        ),
-        SessionToken.created_at < cutoff
-    ).delete()
+    batch_ids = (
+        select(SessionToken.id)
+        .where(
+            db.or_(
+                SessionToken.expires_at < now,
+                SessionToken.is_revoked.is_(True)
+            ),
+            SessionToken.created_at < cutoff
+        )
+        .limit(batch_size)
+    )
+    stmt = delete(SessionToken).where(SessionToken.id.in_(batch_ids))
 
-    db.session.commit()
-    return deleted
+    total = 0
+    while True:
+        deleted = db.session.execute(stmt).rowcount
+        db.session.commit()
+        total += deleted
+        if deleted < batch_size:
+            break
+    return total
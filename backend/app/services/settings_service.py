@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 import sqlalchemy as sa
+from flask import g, has_request_context
+from sqlalchemy.dialects import postgresql, sqlite
 
 from ..extensions import db
 from ..models import (
@@ -29,7 +32,7 @@ SCOPE_USER = "USER"
 ALL_SCOPES = {SCOPE_ORG, SCOPE_STORE, SCOPE_DEVICE, SCOPE_USER}
 PRECEDENCE = [SCOPE_USER, SCOPE_DEVICE, SCOPE_STORE, SCOPE_ORG]
 
-COLOR_RE = re.compile(r"^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})$")
+COLOR_RE = re.compile(r"#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
 
 STORE_ADMIN_ONLY_KEYS = {
     "store.timezone",
@@ -66,7 +69,11 @@ class SettingsActor:
 
 
 def make_actor(*, user_id: int) -> SettingsActor:
-    user = db.session.query(User).filter_by(id=user_id).first()
+    # Only the columns the actor needs; the user's permissions follow in a
+    # single statement from permission_service.
+    user = db.session.execute(
+        sa.select(User.id, User.org_id, User.store_id, User.is_developer).where(User.id == user_id)
+    ).first()
     if not user:
         raise SettingsAuthorizationError("User not found")
     return SettingsActor(
@@ -86,13 +93,64 @@ def _has(actor: SettingsActor, code: str) -> bool:
     return _is_admin(actor) or code in actor.permissions
 
 
+# Process-wide registry cache. Registry rows only change when SETTINGS_CATALOG
+# is seeded, so each map is built once per process and rebuilt whenever
+# _REGISTRY_VERSION moves. Cached rows are detached from any DB session and
+# must be treated as read-only.
+_REGISTRY_VERSION = 0
+_REGISTRY_CACHE: dict[bool, tuple[int, dict[str, SettingRegistry]]] = {}
+# Compiled validators keyed by SettingRegistry.id; cleared with the registry cache.
+_VALIDATOR_CACHE: dict[int, Callable[[Any], Any]] = {}
+# frozenset(scope_allowed) keyed by SettingRegistry.id; cleared with the registry cache.
+_ALLOWED_SCOPES_CACHE: dict[int, frozenset[str]] = {}
+# SettingRegistry.to_dict() keyed by SettingRegistry.id; cleared with the
+# registry cache. Shared between responses, so callers must not mutate it.
+_REGISTRY_DICT_CACHE: dict[int, dict[str, Any]] = {}
+# Sorted registry listing and its ETag per developer flag, keyed to the
+# registry map it was built from.
+_REGISTRY_LISTING_CACHE: dict[bool, tuple[dict[str, SettingRegistry], list[dict], str]] = {}
+
+
+def invalidate_registry_cache() -> None:
+    """Force the next registry read to reload from the database."""
+    global _REGISTRY_VERSION
+    _REGISTRY_VERSION += 1
+    _VALIDATOR_CACHE.clear()
+    _ALLOWED_SCOPES_CACHE.clear()
+    _REGISTRY_DICT_CACHE.clear()
+    _REGISTRY_LISTING_CACHE.clear()
+
+
+def _registry_dict(registry: SettingRegistry) -> dict[str, Any]:
+    data = _REGISTRY_DICT_CACHE.get(registry.id)
+    if data is None:
+        data = _REGISTRY_DICT_CACHE[registry.id] = registry.to_dict()
+    return data
+
+
+def _allowed_scopes(registry: SettingRegistry) -> frozenset[str]:
+    allowed = _ALLOWED_SCOPES_CACHE.get(registry.id)
+    if allowed is None:
+        allowed = _ALLOWED_SCOPES_CACHE[registry.id] = frozenset(registry.scope_allowed or ())
+    return allowed
+
+
 def _get_registry_map(include_developer: bool = False) -> dict[str, SettingRegistry]:
+    cached = _REGISTRY_CACHE.get(include_developer)
+    if cached and cached[0] == _REGISTRY_VERSION:
+        return cached[1]
+
     ensure_registry_seeded()
+    version = _REGISTRY_VERSION
     query = db.session.query(SettingRegistry)
     if not include_developer:
         query = query.filter(SettingRegistry.is_developer_only.is_(False))
     rows = query.order_by(SettingRegistry.key.asc()).all()
-    return {r.key: r for r in rows}
+    for row in rows:
+        db.session.expunge(row)
+    registry_map = {r.key: r for r in rows}
+    _REGISTRY_CACHE[include_developer] = (version, registry_map)
+    return registry_map
 
 
 def ensure_registry_seeded() -> int:
@@ -124,41 +182,98 @@ def ensure_registry_seeded() -> int:
             )
         )
     db.session.commit()
+    invalidate_registry_cache()
     return len(to_add)
 
 
+_SCOPE_MODELS = {
+    SCOPE_ORG: Organization,
+    SCOPE_STORE: Store,
+    SCOPE_DEVICE: Register,
+    SCOPE_USER: User,
+}
+
+
+def _scope_entity(scope_type: str, scope_id: int):
+    """
+    Load the row behind a scope via the session identity map.
+
+    The first lookup issues one SELECT; every later lookup of the same scope
+    in the same DB session (e.g. per-key permission checks in a bulk update)
+    is served from memory.
+    """
+    return db.session.get(_SCOPE_MODELS[scope_type], scope_id)
+
+
+def _scope_column(scope_type: str, scope_id: int, column: sa.orm.InstrumentedAttribute) -> tuple[bool, Any]:
+    """
+    Read one column of the row behind a scope as (found, value).
+
+    PERFORMANCE: Reuses the row if the permission checks already loaded it
+    into the identity map; otherwise selects only the requested column
+    instead of hydrating the full ORM object.
+    """
+    model = _SCOPE_MODELS[scope_type]
+    loaded = db.session.identity_map.get(sa.inspect(model).identity_key_from_primary_key((scope_id,)))
+    if loaded is not None:
+        return True, getattr(loaded, column.key)
+    row = db.session.execute(sa.select(column).where(model.id == scope_id)).first()
+    if row is None:
+        return False, None
+    return True, row[0]
+
+
 def _scope_org_id(scope_type: str, scope_id: int) -> int:
+    """
+    Resolve the organization that owns a scope.
+
+    PERFORMANCE: Memoized on flask.g for the lifetime of a request, so the
+    route tenant guard and the service checks resolve each scope once.
+    Outside a request every call resolves against the database.
+    """
+    if not has_request_context():
+        return _resolve_scope_org_id(scope_type, scope_id)
+    cache = g.setdefault("_settings_scope_org_cache", {})
+    org_id = cache.get((scope_type, scope_id))
+    if org_id is None:
+        org_id = cache[(scope_type, scope_id)] = _resolve_scope_org_id(scope_type, scope_id)
+    return org_id
+
+
+def scope_org_id_or_none(scope_type: str, scope_id: int) -> int | None:
+    """_scope_org_id for callers that treat a missing scope as None."""
+    try:
+        return _scope_org_id(scope_type, scope_id)
+    except SettingsNotFoundError:
+        return None
+
+
+def _resolve_scope_org_id(scope_type: str, scope_id: int) -> int:
     if scope_type == SCOPE_ORG:
-        org = db.session.query(Organization).filter_by(id=scope_id).first()
-        if not org:
+        found, _ = _scope_column(SCOPE_ORG, scope_id, Organization.id)
+        if not found:
             raise SettingsNotFoundError("Organization not found")
         return scope_id
     if scope_type == SCOPE_STORE:
-        store = db.session.query(Store).filter_by(id=scope_id).first()
-        if not store:
+        found, org_id = _scope_column(SCOPE_STORE, scope_id, Store.org_id)
+        if not found:
             raise SettingsNotFoundError("Store not found")
-        return int(store.org_id)
+        return int(org_id)
     if scope_type == SCOPE_DEVICE:
-        reg = db.session.query(Register).filter_by(id=scope_id).first()
-        if not reg:
+        found, org_id = _scope_column(SCOPE_DEVICE, scope_id, Register.org_id)
+        if not found:
             raise SettingsNotFoundError("Device not found")
-        return int(reg.org_id)
+        return int(org_id)
     if scope_type == SCOPE_USER:
-        user = db.session.query(User).filter_by(id=scope_id).first()
-        if not user:
+        found, org_id = _scope_column(SCOPE_USER, scope_id, User.org_id)
+        if not found:
             raise SettingsNotFoundError("User not found")
-        if not user.org_id:
+        if not org_id:
             raise SettingsNotFoundError("User has no organization")
-        return int(user.org_id)
+        return int(org_id)
     raise SettingsValidationError("Invalid scope_type")
 
 
-def _ensure_scope_in_org(scope_type: str, scope_id: int, org_id: int):
-    resolved = _scope_org_id(scope_type, scope_id)
-    if resolved != org_id:
-        raise SettingsAuthorizationError("Cross-organization access denied")
-
-
 def _can_view_scope(actor: SettingsActor, scope_type: str, scope_id: int) -> bool:
     if _is_admin(actor):
         return True
@@ -167,7 +282,7 @@ def _can_view_scope(actor: SettingsActor, scope_type: str, scope_id: int) -> boo
     if scope_type == SCOPE_STORE:
         if not _has(actor, "VIEW_STORES"):
             return False
-        store = db.session.query(Store).filter_by(id=scope_id).first()
+        store = _scope_entity(SCOPE_STORE, scope_id)
         if not store:
             return False
         if actor.org_id != store.org_id:
@@ -176,7 +291,7 @@ def _can_view_scope(actor: SettingsActor, scope_type: str, scope_id: int) -> boo
     if scope_type == SCOPE_DEVICE:
         if not _has(actor, "VIEW_DEVICE_SETTINGS"):
             return False
-        device = db.session.query(Register).filter_by(id=scope_id).first()
+        device = _scope_entity(SCOPE_DEVICE, scope_id)
         if not device:
             return False
         if actor.org_id != device.org_id:
@@ -199,7 +314,7 @@ def _can_edit_scope(actor: SettingsActor, scope_type: str, scope_id: int, key: s
             return False
         if not _has(actor, "MANAGE_STORES"):
             return False
-        store = db.session.query(Store).filter_by(id=scope_id).first()
+        store = _scope_entity(SCOPE_STORE, scope_id)
         if not store:
             return False
         if actor.org_id != store.org_id:
@@ -208,7 +323,7 @@ def _can_edit_scope(actor: SettingsActor, scope_type: str, scope_id: int, key: s
     if scope_type == SCOPE_DEVICE:
         if not _has(actor, "MANAGE_DEVICE_SETTINGS"):
             return False
-        device = db.session.query(Register).filter_by(id=scope_id).first()
+        device = _scope_entity(SCOPE_DEVICE, scope_id)
         if not device:
             return False
         if actor.org_id != device.org_id:
@@ -221,104 +336,195 @@ def _can_edit_scope(actor: SettingsActor, scope_type: str, scope_id: int, key: s
     return False
 
 
-def _coerce_value(registry: SettingRegistry, raw_value: Any) -> Any:
-    t = registry.value_type
-    v = raw_value
-    if t == "bool":
-        if isinstance(v, bool):
-            return v
-        if isinstance(v, str):
-            s = v.strip().lower()
-            if s in {"true", "1", "yes", "on"}:
-                return True
-            if s in {"false", "0", "no", "off"}:
-                return False
-        raise SettingsValidationError(f"{registry.key}: expected boolean")
-    if t in {"int", "decimal_cents", "duration_seconds"}:
-        if isinstance(v, bool):
-            raise SettingsValidationError(f"{registry.key}: expected integer")
-        if isinstance(v, int):
-            return v
-        if isinstance(v, float) and int(v) == v:
-            return int(v)
-        if isinstance(v, str):
-            try:
-                return int(v.strip())
-            except Exception:
-                pass
+def _coerce_bool(registry: SettingRegistry, v: Any) -> bool:
+    if isinstance(v, bool):
+        return v
+    if isinstance(v, str):
+        s = v.strip().lower()
+        if s in {"true", "1", "yes", "on"}:
+            return True
+        if s in {"false", "0", "no", "off"}:
+            return False
+    raise SettingsValidationError(f"{registry.key}: expected boolean")
+
+
+def _coerce_int(registry: SettingRegistry, v: Any) -> int:
+    if isinstance(v, bool):
         raise SettingsValidationError(f"{registry.key}: expected integer")
-    if t == "decimal":
-        if isinstance(v, (int, float)) and not isinstance(v, bool):
-            return float(v)
-        if isinstance(v, str):
+    if isinstance(v, int):
+        return v
+    if isinstance(v, float) and int(v) == v:
+        return int(v)
+    if isinstance(v, str):
+        try:
+            return int(v.strip())
+        except Exception:
+            pass
+    raise SettingsValidationError(f"{registry.key}: expected integer")
+
+
+def _coerce_decimal(registry: SettingRegistry, v: Any) -> float:
+    if isinstance(v, (int, float)) and not isinstance(v, bool):
+        return float(v)
+    if isinstance(v, str):
+        try:
+            return float(v.strip())
+        except Exception:
+            pass
+    raise SettingsValidationError(f"{registry.key}: expected decimal")
+
+
+def _coerce_str(registry: SettingRegistry, v: Any) -> str | None:
+    if v is None:
+        return None
+    if not isinstance(v, str):
+        return str(v)
+    return v
+
+
+def _coerce_json(registry: SettingRegistry, v: Any) -> Any:
+    if isinstance(v, str):
+        s = v.strip()
+        if s == "":
+            return None
+        if (s.startswith("{") and s.endswith("}")) or (s.startswith("[") and s.endswith("]")):
             try:
-                return float(v.strip())
+                return json.loads(s)
             except Exception:
                 pass
-        raise SettingsValidationError(f"{registry.key}: expected decimal")
-    if t in {"string", "enum"}:
-        if v is None:
-            return None
-        if not isinstance(v, str):
-            return str(v)
-        return v
-    if t == "json":
-        if isinstance(v, str):
-            s = v.strip()
-            if s == "":
-                return None
-            if (s.startswith("{") and s.endswith("}")) or (s.startswith("[") and s.endswith("]")):
-                try:
-                    return json.loads(s)
-                except Exception:
-                    pass
-        return v
-    if t == "color":
-        if not isinstance(v, str) or not COLOR_RE.match(v.strip()):
-            raise SettingsValidationError(f"{registry.key}: expected hex color")
-        return v.strip()
     return v
 
 
-def _validate_constraints(registry: SettingRegistry, value: Any):
+def _coerce_color(registry: SettingRegistry, v: Any) -> str:
+    if not isinstance(v, str) or not COLOR_RE.fullmatch(v.strip()):
+        raise SettingsValidationError(f"{registry.key}: expected hex color")
+    return v.strip()
+
+
+def _coerce_passthrough(registry: SettingRegistry, v: Any) -> Any:
+    return v
+
+
+# Coercer per registry value_type; unknown types pass the value through.
+_COERCERS: dict[str, Callable[[SettingRegistry, Any], Any]] = {
+    "bool": _coerce_bool,
+    "int": _coerce_int,
+    "decimal_cents": _coerce_int,
+    "duration_seconds": _coerce_int,
+    "decimal": _coerce_decimal,
+    "string": _coerce_str,
+    "enum": _coerce_str,
+    "json": _coerce_json,
+    "color": _coerce_color,
+}
+
+
+def _build_validator(registry: SettingRegistry) -> Callable[[Any], Any]:
+    """
+    Compile coerce + constraint checks for one registry row into a closure.
+
+    Everything derivable from the registry (type, enum options, regex,
+    min/max) is resolved once here instead of on every value.
+    """
     validation = registry.validation_json or {}
-    if value is None:
-        return
-    if registry.value_type == "enum":
-        options = validation.get("enum", [])
-        if options and value not in options:
-            raise SettingsValidationError(f"{registry.key}: expected one of {options}")
-    if registry.value_type in {"int", "decimal", "decimal_cents", "duration_seconds"}:
-        if "min" in validation and value < validation["min"]:
-            raise SettingsValidationError(f"{registry.key}: must be >= {validation['min']}")
-        if "max" in validation and value > validation["max"]:
-            raise SettingsValidationError(f"{registry.key}: must be <= {validation['max']}")
-    if registry.value_type == "string" and "regex" in validation:
-        if not re.match(validation["regex"], str(value)):
-            raise SettingsValidationError(f"{registry.key}: format is invalid")
+    key = registry.key
+    value_type = registry.value_type
+
+    checks: list[Callable[[Any], None]] = []
+    if value_type == "enum" and validation.get("enum"):
+        options = validation["enum"]
+        options_set = frozenset(options)
+
+        def _check_enum(value):
+            if value not in options_set:
+                raise SettingsValidationError(f"{key}: expected one of {options}")
+        checks.append(_check_enum)
+    if value_type in {"int", "decimal", "decimal_cents", "duration_seconds"}:
+        if "min" in validation:
+            lo = validation["min"]
+
+            def _check_min(value):
+                if value < lo:
+                    raise SettingsValidationError(f"{key}: must be >= {lo}")
+            checks.append(_check_min)
+        if "max" in validation:
+            hi = validation["max"]
+
+            def _check_max(value):
+                if value > hi:
+                    raise SettingsValidationError(f"{key}: must be <= {hi}")
+            checks.append(_check_max)
+    if value_type == "string" and "regex" in validation:
+        pattern = re.compile(validation["regex"])
+
+        def _check_regex(value):
+            if not pattern.fullmatch(str(value)):
+                raise SettingsValidationError(f"{key}: format is invalid")
+        checks.append(_check_regex)
+
+    coerce = _COERCERS.get(value_type, _coerce_passthrough)
+
+    def _validate(raw_value: Any) -> Any:
+        value = coerce(registry, raw_value)
+        if value is not None:
+            for check in checks:
+                check(value)
+        return value
+
+    return _validate
 
 
 def _normalize_value(registry: SettingRegistry, value: Any) -> Any:
-    coerced = _coerce_value(registry, value)
-    _validate_constraints(registry, coerced)
-    return coerced
+    validator = _VALIDATOR_CACHE.get(registry.id)
+    if validator is None:
+        validator = _VALIDATOR_CACHE[registry.id] = _build_validator(registry)
+    return validator(value)
 
 
 def list_registry(actor: SettingsActor) -> list[dict]:
-    query = db.session.query(SettingRegistry)
-    if not actor.is_developer:
-        query = query.filter(SettingRegistry.is_developer_only.is_(False))
-    rows = query.order_by(SettingRegistry.category.asc(), SettingRegistry.subcategory.asc(), SettingRegistry.key.asc()).all()
-    return [r.to_dict() for r in rows]
+    return registry_listing(include_developer=actor.is_developer)[0]
+
+
+def registry_listing(*, include_developer: bool) -> tuple[list[dict], str]:
+    """
+    Serialized registry rows plus an ETag for the listing.
+
+    PERFORMANCE: Built once per registry version and developer flag, so the
+    registry endpoint can answer If-None-Match with a 304 without touching
+    the database or re-serializing.
+    """
+    registry_map = _get_registry_map(include_developer=include_developer)
+    cached = _REGISTRY_LISTING_CACHE.get(include_developer)
+    if cached and cached[0] is registry_map:
+        return cached[1], cached[2]
+
+    # NULL subcategories sort first, as they did with the previous ORDER BY
+    # on SQLite.
+    rows = sorted(
+        registry_map.values(),
+        key=lambda r: (r.category, r.subcategory is not None, r.subcategory or "", r.key),
+    )
+    items = [_registry_dict(r) for r in rows]
+    body = json.dumps(items, sort_keys=True, separators=(",", ":"), default=str)
+    etag = hashlib.sha256(body.encode("utf-8")).hexdigest()
+    _REGISTRY_LISTING_CACHE[include_developer] = (registry_map, items, etag)
+    return items, etag
 
 
 def _load_scope_values(scope_filters: list[tuple[str, int]]) -> dict[tuple[str, int], dict[str, Any]]:
     if not scope_filters:
         return {}
-    clauses = []
-    for scope_type, scope_id in scope_filters:
-        clauses.append(sa.and_(SettingValue.scope_type == scope_type, SettingValue.scope_id == scope_id))
-    rows = db.session.query(SettingValue).filter(sa.or_(*clauses)).all()
+    # One equality pair per scope (at most four). Unlike a row-value IN,
+    # which SQLite answers with a full table scan, each pair is an index
+    # search on ix_settings_values_scope_key on both SQLite and PostgreSQL.
+    rows = db.session.query(SettingValue).filter(
+        sa.or_(
+            *(
+                sa.and_(SettingValue.scope_type == scope_type, SettingValue.scope_id == scope_id)
+                for scope_type, scope_id in scope_filters
+            )
+        )
+    ).all()
     out: dict[tuple[str, int], dict[str, Any]] = {}
     for row in rows:
         out.setdefault((row.scope_type, row.scope_id), {})[row.key] = row.value_json
@@ -334,6 +540,27 @@ def resolve_effective_settings(
     include_sensitive: bool = False,
     include_developer: bool = False,
 ) -> dict[str, dict[str, Any]]:
+    effective, _ = _resolve_effective(
+        org_id=org_id,
+        store_id=store_id,
+        device_id=device_id,
+        user_id=user_id,
+        include_sensitive=include_sensitive,
+        include_developer=include_developer,
+    )
+    return effective
+
+
+def _resolve_effective(
+    *,
+    org_id: int,
+    store_id: int | None,
+    device_id: int | None,
+    user_id: int | None,
+    include_sensitive: bool,
+    include_developer: bool,
+) -> tuple[dict[str, dict[str, Any]], dict[tuple[str, int], dict[str, Any]]]:
+    """resolve_effective_settings, also returning the raw per-scope values it loaded."""
     registry_map = _get_registry_map(include_developer=include_developer)
     scope_filters: list[tuple[str, int]] = [(SCOPE_ORG, org_id)]
     if store_id:
@@ -344,32 +571,36 @@ def resolve_effective_settings(
         scope_filters.append((SCOPE_USER, user_id))
     values_by_scope = _load_scope_values(scope_filters)
 
+    # Resolve scope ids and their value maps once, in precedence order,
+    # instead of re-deriving them for every registry key.
+    scope_id_map = {SCOPE_USER: user_id, SCOPE_DEVICE: device_id, SCOPE_STORE: store_id, SCOPE_ORG: org_id}
+    active_scopes = [
+        (scope, values_by_scope.get((scope, scope_id_map[scope]), {}))
+        for scope in PRECEDENCE
+        if scope_id_map[scope] is not None
+    ]
+
+    # ORG is always active, so a single active scope means org-only
+    # resolution (the ORG settings page); skip the precedence walk for it.
+    org_values = active_scopes[0][1] if len(active_scopes) == 1 else None
+
     result: dict[str, dict[str, Any]] = {}
     for key, reg in registry_map.items():
         if reg.is_sensitive and not include_sensitive:
             continue
-        allowed = set(reg.scope_allowed or [])
         chosen_value = reg.default_value_json
         chosen_source = "SYSTEM_DEFAULT"
-        for scope in PRECEDENCE:
-            scope_id = None
-            if scope == SCOPE_USER:
-                scope_id = user_id
-            elif scope == SCOPE_DEVICE:
-                scope_id = device_id
-            elif scope == SCOPE_STORE:
-                scope_id = store_id
-            elif scope == SCOPE_ORG:
-                scope_id = org_id
-            if scope_id is None:
-                continue
-            if scope not in allowed:
-                continue
-            scoped = values_by_scope.get((scope, scope_id), {})
-            if key in scoped:
-                chosen_value = scoped[key]
-                chosen_source = scope
-                break
+        if org_values is not None:
+            if key in org_values and SCOPE_ORG in _allowed_scopes(reg):
+                chosen_value = org_values[key]
+                chosen_source = SCOPE_ORG
+        else:
+            allowed = _allowed_scopes(reg)
+            for scope, scoped in active_scopes:
+                if scope in allowed and key in scoped:
+                    chosen_value = scoped[key]
+                    chosen_source = scope
+                    break
         result[key] = {
             "value": chosen_value,
             "source": chosen_source,
@@ -380,7 +611,7 @@ def resolve_effective_settings(
             "requires_reprice": bool(reg.requires_reprice),
             "requires_recalc": bool(reg.requires_recalc),
         }
-    return result
+    return result, values_by_scope
 
 
 def get_scope_settings(
@@ -394,10 +625,13 @@ def get_scope_settings(
     if not _can_view_scope(actor, scope_type, scope_id):
         raise SettingsAuthorizationError("Access denied")
     org_id = _scope_org_id(scope_type, scope_id)
-    _ensure_scope_in_org(scope_type, scope_id, org_id)
+    if actor.org_id != org_id and not actor.is_developer:
+        raise SettingsAuthorizationError("Cross-organization access denied")
 
     registry_map = _get_registry_map(include_developer=actor.is_developer)
-    effective = resolve_effective_settings(
+    # The scope's own values are part of the effective-resolution query, so
+    # they are reused here rather than fetched again.
+    effective, values_by_scope = _resolve_effective(
         org_id=org_id,
         store_id=scope_id if scope_type == SCOPE_STORE else None,
         device_id=scope_id if scope_type == SCOPE_DEVICE else None,
@@ -405,35 +639,34 @@ def get_scope_settings(
         include_sensitive=False,
         include_developer=actor.is_developer,
     )
-    local_rows = db.session.query(SettingValue).filter_by(scope_type=scope_type, scope_id=scope_id).all()
-    local_map = {r.key: r for r in local_rows}
+    local_map = values_by_scope.get((scope_type, scope_id), {})
 
     items = []
     for key, reg in registry_map.items():
-        allowed = set(reg.scope_allowed or [])
+        allowed = _allowed_scopes(reg)
         if scope_type not in allowed:
             continue
         if reg.is_sensitive:
             continue
-        local = local_map.get(key)
+        has_local = key in local_map
         eff = effective.get(key, {"value": reg.default_value_json, "source": "SYSTEM_DEFAULT"})
         items.append(
             {
                 "key": key,
                 "scope_type": scope_type,
                 "scope_id": scope_id,
-                "value_json": local.value_json if local else None,
+                "value_json": local_map.get(key),
                 "effective_value_json": eff["value"],
                 "effective_source": eff["source"],
-                "inherited": local is None,
-                "registry": reg.to_dict(),
+                "inherited": not has_local,
+                "registry": _registry_dict(reg),
             }
         )
     items.sort(key=lambda x: x["key"])
     return {"scope_type": scope_type, "scope_id": scope_id, "org_id": org_id, "items": items}
 
 
-def _write_audit(
+def _audit_values(
     *,
     key: str,
     scope_type: str,
@@ -443,19 +676,17 @@ def _write_audit(
     changed_by_user_id: int,
     change_reason: str | None = None,
     request_metadata_json: dict[str, Any] | None = None,
-):
-    db.session.add(
-        SettingAudit(
-            key=key,
-            scope_type=scope_type,
-            scope_id=scope_id,
-            old_value_json=old_value,
-            new_value_json=new_value,
-            changed_by_user_id=changed_by_user_id,
-            change_reason=change_reason,
-            request_metadata_json=request_metadata_json,
-        )
-    )
+) -> dict[str, Any]:
+    return {
+        "key": key,
+        "scope_type": scope_type,
+        "scope_id": scope_id,
+        "old_value_json": old_value,
+        "new_value_json": new_value,
+        "changed_by_user_id": changed_by_user_id,
+        "change_reason": change_reason,
+        "request_metadata_json": request_metadata_json,
+    }
 
 
 def bulk_upsert_scope_settings(
@@ -473,13 +704,29 @@ def bulk_upsert_scope_settings(
     if not updates:
         return {"updated": [], "errors": []}
     org_id = _scope_org_id(scope_type, scope_id)
-    _ensure_scope_in_org(scope_type, scope_id, org_id)
     if actor.org_id != org_id and not actor.is_developer:
         raise SettingsAuthorizationError("Access denied")
 
     registry_map = _get_registry_map(include_developer=actor.is_developer)
     updated: list[dict[str, Any]] = []
     errors: list[dict[str, Any]] = []
+    # New SettingValue rows (by key) and audit rows are collected and written
+    # with one multi-row INSERT each once every item has validated.
+    new_values: dict[str, dict[str, Any]] = {}
+    audit_rows: list[dict[str, Any]] = []
+
+    # Prefetch every existing row touched by this batch in one query.
+    keys = {item.get("key") for item in updates if item.get("key") in registry_map}
+    existing: dict[str, SettingValue] = {}
+    if keys:
+        existing = {
+            r.key: r
+            for r in db.session.query(SettingValue).filter(
+                SettingValue.scope_type == scope_type,
+                SettingValue.scope_id == scope_id,
+                SettingValue.key.in_(keys),
+            )
+        }
 
     for item in updates:
         key = item.get("key")
@@ -491,7 +738,7 @@ def bulk_upsert_scope_settings(
         if reg.is_developer_only and not actor.is_developer:
             errors.append({"key": key, "error": "Developer-only setting"})
             continue
-        allowed = set(reg.scope_allowed or [])
+        allowed = _allowed_scopes(reg)
         if scope_type not in allowed:
             errors.append({"key": key, "error": f"Scope {scope_type} is not allowed for this key"})
             continue
@@ -499,48 +746,60 @@ def bulk_upsert_scope_settings(
             errors.append({"key": key, "error": "Access denied"})
             continue
         try:
-            row = db.session.query(SettingValue).filter_by(scope_type=scope_type, scope_id=scope_id, key=key).first()
-            old_value = row.value_json if row else None
+            pending = new_values.get(key)
+            row = existing.get(key) if pending is None else None
+            if pending is not None:
+                old_value = pending["value_json"]
+            else:
+                old_value = row.value_json if row else None
             if unset:
-                if row:
+                if pending is not None:
+                    del new_values[key]
+                elif row:
                     db.session.delete(row)
-                _write_audit(
-                    key=key,
-                    scope_type=scope_type,
-                    scope_id=scope_id,
-                    old_value=old_value,
-                    new_value=None,
-                    changed_by_user_id=actor.user_id,
-                    change_reason=change_reason,
-                    request_metadata_json=request_metadata_json,
+                    del existing[key]
+                audit_rows.append(
+                    _audit_values(
+                        key=key,
+                        scope_type=scope_type,
+                        scope_id=scope_id,
+                        old_value=old_value,
+                        new_value=None,
+                        changed_by_user_id=actor.user_id,
+                        change_reason=change_reason,
+                        request_metadata_json=request_metadata_json,
+                    )
                 )
                 updated.append({"key": key, "scope_type": scope_type, "scope_id": scope_id, "value_json": None, "unset": True})
                 continue
 
             normalized = _normalize_value(reg, item.get("value_json"))
-            if row:
+            if pending is not None:
+                pending["value_json"] = normalized
+            elif row:
                 row.value_json = normalized
                 row.updated_by_user_id = actor.user_id
                 row.source = source
             else:
-                row = SettingValue(
+                new_values[key] = {
+                    "key": key,
+                    "scope_type": scope_type,
+                    "scope_id": scope_id,
+                    "value_json": normalized,
+                    "updated_by_user_id": actor.user_id,
+                    "source": source,
+                }
+            audit_rows.append(
+                _audit_values(
                     key=key,
                     scope_type=scope_type,
                     scope_id=scope_id,
-                    value_json=normalized,
-                    updated_by_user_id=actor.user_id,
-                    source=source,
+                    old_value=old_value,
+                    new_value=normalized,
+                    changed_by_user_id=actor.user_id,
+                    change_reason=change_reason,
+                    request_metadata_json=request_metadata_json,
                 )
-                db.session.add(row)
-            _write_audit(
-                key=key,
-                scope_type=scope_type,
-                scope_id=scope_id,
-                old_value=old_value,
-                new_value=normalized,
-                changed_by_user_id=actor.user_id,
-                change_reason=change_reason,
-                request_metadata_json=request_metadata_json,
             )
             updated.append({"key": key, "scope_type": scope_type, "scope_id": scope_id, "value_json": normalized, "unset": False})
         except SettingsError as exc:
@@ -550,6 +809,10 @@ def bulk_upsert_scope_settings(
         db.session.rollback()
         return {"updated": [], "errors": errors}
 
+    if new_values:
+        db.session.execute(sa.insert(SettingValue), list(new_values.values()))
+    if audit_rows:
+        db.session.execute(sa.insert(SettingAudit), audit_rows)
     db.session.commit()
     return {"updated": updated, "errors": []}
 
@@ -563,23 +826,53 @@ def get_org_settings(org_id: int) -> list[dict]:
     return [r.to_dict() for r in rows]
 
 
-def upsert_org_setting(org_id: int, key: str, value: str | None, user_id: int) -> dict:
-    row = db.session.query(OrganizationSetting).filter_by(org_id=org_id, key=key).first()
-    if row:
-        row.value = value
-        row.updated_by_user_id = user_id
+def _upsert(model, index_elements: list[str], values: dict[str, Any], update_keys: list[str], *, guard=None):
+    """
+    Atomic INSERT ... ON CONFLICT DO UPDATE ... RETURNING for one row.
+
+    One round-trip and no SELECT-then-write race. PostgreSQL and SQLite
+    share the same ON CONFLICT syntax.
+
+    guard: optional SQL criteria (e.g. a tenancy check). The row is then
+    written via INSERT ... SELECT ... WHERE guard, and None is returned
+    when the guard matches nothing.
+    """
+    dialect = db.session.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    if guard is None:
+        stmt = insert(model).values(**values)
     else:
-        row = OrganizationSetting(org_id=org_id, key=key, value=value, updated_by_user_id=user_id)
-        db.session.add(row)
+        source = sa.select(*[sa.literal(v, model.__table__.c[k].type) for k, v in values.items()]).where(guard)
+        stmt = insert(model).from_select(list(values), source)
+    set_ = {k: stmt.excluded[k] for k in update_keys}
+    set_["updated_at"] = sa.func.now()
+    stmt = (
+        stmt
+        .on_conflict_do_update(index_elements=index_elements, set_=set_)
+        .returning(model)
+        .execution_options(populate_existing=True)
+    )
+    return db.session.execute(stmt).scalar_one_or_none()
+
+
+def upsert_org_setting(org_id: int, key: str, value: str | None, user_id: int) -> dict:
+    row = _upsert(
+        OrganizationSetting,
+        ["org_id", "key"],
+        {"org_id": org_id, "key": key, "value": value, "updated_by_user_id": user_id},
+        ["value", "updated_by_user_id"],
+    )
+    result = row.to_dict()
     db.session.commit()
-    return row.to_dict()
+    return result
 
 
-def _require_device_in_org(device_id: int, org_id: int) -> Register:
-    device = db.session.query(Register).filter_by(id=device_id, org_id=org_id).first()
-    if not device:
+def _require_device_in_org(device_id: int, org_id: int) -> None:
+    in_org = db.session.query(
+        sa.exists().where(Register.id == device_id, Register.org_id == org_id)
+    ).scalar()
+    if not in_org:
         raise SettingsNotFoundError("Device not found")
-    return device
 
 
 def get_device_settings(device_id: int, org_id: int) -> list[dict]:
@@ -589,13 +882,17 @@ def get_device_settings(device_id: int, org_id: int) -> list[dict]:
 
 
 def upsert_device_setting(device_id: int, org_id: int, key: str, value: str | None, user_id: int) -> dict:
-    _require_device_in_org(device_id, org_id)
-    row = db.session.query(DeviceSetting).filter_by(device_id=device_id, key=key).first()
-    if row:
-        row.value = value
-        row.updated_by_user_id = user_id
-    else:
-        row = DeviceSetting(device_id=device_id, key=key, value=value, updated_by_user_id=user_id)
-        db.session.add(row)
+    # Tenancy check and upsert in one statement: nothing is written unless
+    # the device belongs to the org.
+    row = _upsert(
+        DeviceSetting,
+        ["device_id", "key"],
+        {"device_id": device_id, "key": key, "value": value, "updated_by_user_id": user_id},
+        ["value", "updated_by_user_id"],
+        guard=sa.and_(Register.id == device_id, Register.org_id == org_id),
+    )
+    if row is None:
+        raise SettingsNotFoundError("Device not found")
+    result = row.to_dict()
     db.session.commit()
-    return row.to_dict()
+    return result
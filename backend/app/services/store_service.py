@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from sqlalchemy import select
+
 from app.extensions import db
 from app.models import Store, StoreConfig
 from app.services.concurrency import lock_for_update, run_with_retry
+from app.services.tenant_service import invalidate_org_store_ids
 
 
 class StoreError(Exception):
@@ -43,6 +46,7 @@ def create_store(
 
         db.session.add(store)
         db.session.commit()
+        invalidate_org_store_ids(org_id)
         return store
 
     return run_with_retry(_op)
@@ -123,38 +127,49 @@ def get_store_config(store_id: int, key: str) -> StoreConfig | None:
     return db.session.query(StoreConfig).filter_by(store_id=store_id, key=key).first()
 
 
+def _subtree_cte(store_id: int):
+    """
+    Recursive CTE of (id, parent_store_id) for store_id and all descendants.
+
+    UNION (not UNION ALL) discards rows already seen, so a corrupt parent
+    cycle terminates instead of recursing forever. Supported by both
+    SQLite and PostgreSQL.
+    """
+    tree = (
+        select(Store.id, Store.parent_store_id)
+        .where(Store.id == store_id)
+        .cte("store_subtree", recursive=True)
+    )
+    return tree.union(
+        select(Store.id, Store.parent_store_id).where(Store.parent_store_id == tree.c.id)
+    )
+
+
 def get_descendant_store_ids(store_id: int, *, include_self: bool = True) -> list[int]:
-    stores = db.session.query(Store).all()
-    children_map: dict[int, list[int]] = {}
-    for store in stores:
-        if store.parent_store_id is None:
-            continue
-        children_map.setdefault(store.parent_store_id, []).append(store.id)
-
-    result: list[int] = []
-    if include_self:
-        result.append(store_id)
-
-    stack = list(children_map.get(store_id, []))
-    while stack:
-        current = stack.pop()
-        if current in result:
-            continue
-        result.append(current)
-        stack.extend(children_map.get(current, []))
+    subtree = _subtree_cte(store_id)
+    ids = db.session.execute(select(subtree.c.id)).scalars().all()
 
+    result: list[int] = [store_id] if include_self else []
+    result.extend(i for i in ids if i != store_id)
     return result
 
 
 def get_store_tree(org_id: int, store_id: int) -> dict:
-    store = _get_store_in_org(org_id, store_id)
-    if not store:
+    subtree = _subtree_cte(store_id)
+    stores = (
+        db.session.query(Store)
+        .filter(Store.id.in_(select(subtree.c.id)), Store.org_id == org_id)
+        .order_by(Store.id.asc())
+        .all()
+    )
+    by_id = {s.id: s for s in stores}
+    if store_id not in by_id:
         raise StoreError("Store not found")
 
-    def _build(node: Store) -> dict:
-        return {
-            "store": node.to_dict(),
-            "children": [_build(child) for child in node.child_stores],
-        }
+    # Assemble the nested dict in memory from the single subtree query.
+    nodes = {s.id: {"store": s.to_dict(), "children": []} for s in stores}
+    for s in stores:
+        if s.id != store_id and s.parent_store_id in nodes:
+            nodes[s.parent_store_id]["children"].append(nodes[s.id])
 
-    return _build(store)
+    return nodes[store_id]
@@ -23,7 +23,8 @@ USAGE:
     stores = get_org_stores(g.org_id)
 """
 
-from flask import g, request
+from flask import g, has_request_context, request
+from sqlalchemy import select
 from ..extensions import db
 from ..models import Store, Organization
 from .permission_service import log_security_event
@@ -97,6 +98,24 @@ def require_store_in_org(store_id: int, org_id: int) -> Store:
     return store
 
 
+def require_store_in_org_exists(store_id: int, org_id: int) -> None:
+    """
+    Validate that a store belongs to the organization without loading it.
+
+    SECURITY: Same guarantee and errors as require_store_in_org; use it when
+    the Store object itself is not needed.
+
+    PERFORMANCE: The success path is a single EXISTS probe on
+    (id, org_id). Only a failed check falls back to require_store_in_org,
+    which loads the row to log the precise cross-tenant reason.
+    """
+    in_org = db.session.query(
+        db.session.query(Store.id).filter_by(id=store_id, org_id=org_id).exists()
+    ).scalar()
+    if not in_org:
+        require_store_in_org(store_id, org_id)
+
+
 def require_stores_in_org(store_ids: list[int], org_id: int) -> list[Store]:
     """
     Validate multiple stores belong to the specified organization.
@@ -117,29 +136,18 @@ def require_stores_in_org(store_ids: list[int], org_id: int) -> list[Store]:
     if not store_ids:
         return []
 
-    stores = db.session.query(Store).filter(Store.id.in_(store_ids)).all()
-
-    # Check all requested stores were found
-    found_ids = {s.id for s in stores}
-    missing_ids = set(store_ids) - found_ids
+    # Filter by org in SQL: stores of other orgs are never loaded, and
+    # "missing" and "belongs to another org" are the same answer.
+    stores = db.session.query(Store).filter(Store.id.in_(store_ids), Store.org_id == org_id).all()
 
-    if missing_ids:
+    if len(stores) != len(set(store_ids)):
+        missing_ids = set(store_ids) - {s.id for s in stores}
         _log_cross_tenant_attempt(
-            f"Stores not found: {missing_ids}",
+            f"Stores not found in org {org_id}: {missing_ids}",
             org_id=org_id
         )
         raise TenantAccessError("One or more stores not found")
 
-    # Check all stores belong to the org
-    for store in stores:
-        if store.org_id != org_id:
-            _log_cross_tenant_attempt(
-                f"Store {store.id} belongs to org {store.org_id}, not {org_id}",
-                org_id=org_id,
-                attempted_store_id=store.id
-            )
-            raise TenantAccessError("One or more stores not found")
-
     return stores
 
 
@@ -173,9 +181,28 @@ def get_org_store_ids(org_id: int) -> set[int]:
 
     Returns:
         Set of store IDs belonging to the organization
+
+    PERFORMANCE: Memoized on flask.g for the lifetime of a request, so
+    scoped_query and route-level checks share one SELECT per org.
     """
-    stores = db.session.query(Store.id).filter_by(org_id=org_id).all()
-    return {s.id for s in stores}
+    if not has_request_context():
+        return _load_org_store_ids(org_id)
+    cache = g.setdefault("_org_store_ids", {})
+    store_ids = cache.get(org_id)
+    if store_ids is None:
+        store_ids = cache[org_id] = frozenset(_load_org_store_ids(org_id))
+    # Callers may narrow or extend the set they get back
+    return set(store_ids)
+
+
+def invalidate_org_store_ids(org_id: int) -> None:
+    """Drop the request-scoped store id cache for an org after adding stores."""
+    if has_request_context():
+        g.get("_org_store_ids", {}).pop(org_id, None)
+
+
+def _load_org_store_ids(org_id: int) -> set[int]:
+    return set(db.session.scalars(select(Store.id).where(Store.org_id == org_id)))
 
 
 def validate_org_active(org_id: int) -> Organization:
@@ -243,15 +270,22 @@ def _log_cross_tenant_attempt(
     if user_id and hasattr(user_id, 'id'):
         user_id = user_id.id
 
+    resource = action = ip_address = user_agent = None
+    # Resolve the request proxy once rather than per field
+    if has_request_context():
+        req = request._get_current_object()
+        resource, action = req.path, req.method
+        ip_address, user_agent = req.remote_addr, req.headers.get("User-Agent")
+
     log_security_event(
         user_id=user_id,
         event_type="CROSS_TENANT_ACCESS_DENIED",
         success=False,
-        resource=request.path if request else None,
-        action=request.method if request else None,
+        resource=resource,
+        action=action,
         reason=reason,
-        ip_address=request.remote_addr if request else None,
-        user_agent=request.headers.get("User-Agent") if request else None,
+        ip_address=ip_address,
+        user_agent=user_agent,
         org_id=org_id,
         store_id=attempted_store_id
     )
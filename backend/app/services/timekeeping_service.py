@@ -5,10 +5,16 @@ Timekeeping Service (Shift-Based)
 
 WHY: Employees clock in/out to open/close a shift. Shifts are immutable once closed.
 Corrections are append-only records that require manager approval.
+
+TRANSACTIONS: Functions flush but never commit. The calling route commits
+once, so a multi-step request lands in a single transaction.
 """
 
 from datetime import datetime
 
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import joinedload
+
 from ..extensions import db
 from ..models import TimeClockEntry, TimeClockBreak, TimeClockCorrection, User
 from .ledger_service import append_ledger_event
@@ -21,8 +27,26 @@ class TimekeepingError(ValueError):
     pass
 
 
+# PERFORMANCE: Built once at import; the engine's compiled-statement cache
+# then serves every clock-in/out and status poll without recompiling.
+_OPEN_ENTRY_STMT = (
+    select(TimeClockEntry)
+    .where(TimeClockEntry.user_id == bindparam("user_id"), TimeClockEntry.status == "OPEN")
+    .limit(1)
+)
+_OPEN_BREAK_STMT = (
+    select(TimeClockBreak)
+    .where(TimeClockBreak.time_clock_entry_id == bindparam("entry_id"), TimeClockBreak.end_at.is_(None))
+    .limit(1)
+)
+
+
 def _get_open_entry(user_id: int) -> TimeClockEntry | None:
-    return db.session.query(TimeClockEntry).filter_by(user_id=user_id, status="OPEN").first()
+    return db.session.execute(_OPEN_ENTRY_STMT, {"user_id": user_id}).scalars().first()
+
+
+def _get_open_break(entry_id: int) -> TimeClockBreak | None:
+    return db.session.execute(_OPEN_BREAK_STMT, {"entry_id": entry_id}).scalars().first()
 
 
 def clock_in(*, user_id: int, store_id: int, register_session_id: int | None = None, notes: str | None = None) -> TimeClockEntry:
@@ -50,7 +74,6 @@ def clock_in(*, user_id: int, store_id: int, register_session_id: int | None = N
         occurred_at=entry.clock_in_at,
     )
 
-    db.session.commit()
     return entry
 
 
@@ -59,22 +82,19 @@ def clock_out(*, user_id: int) -> TimeClockEntry:
     if not entry:
         raise TimekeepingError("User is not clocked in")
 
-    user = db.session.query(User).filter_by(id=user_id).first()
+    # Identity map hit when the route already loaded the current user
+    user = db.session.get(User, user_id)
     if user and user.org_id:
-        pending = communications_service.pending_tasks_for_clockout(
+        if communications_service.has_pending_tasks_for_clockout(
             org_id=user.org_id,
             user_id=user_id,
             store_id=entry.store_id,
-        )
-        if pending:
+        ):
             raise TimekeepingError(
                 "You have pending tasks. Complete or defer assigned tasks before clocking out."
             )
 
-    open_break = db.session.query(TimeClockBreak).filter_by(
-        time_clock_entry_id=entry.id,
-        end_at=None,
-    ).first()
+    open_break = _get_open_break(entry.id)
     if open_break:
         raise TimekeepingError("Cannot clock out while on break")
 
@@ -97,7 +117,6 @@ def clock_out(*, user_id: int) -> TimeClockEntry:
         occurred_at=entry.clock_out_at,
     )
 
-    db.session.commit()
     return entry
 
 
@@ -106,10 +125,7 @@ def start_break(*, user_id: int, break_type: str = "UNPAID") -> TimeClockBreak:
     if not entry:
         raise TimekeepingError("User is not clocked in")
 
-    open_break = db.session.query(TimeClockBreak).filter_by(
-        time_clock_entry_id=entry.id,
-        end_at=None,
-    ).first()
+    open_break = _get_open_break(entry.id)
     if open_break:
         raise TimekeepingError("Break already in progress")
 
@@ -131,7 +147,6 @@ def start_break(*, user_id: int, break_type: str = "UNPAID") -> TimeClockBreak:
         occurred_at=brk.start_at,
     )
 
-    db.session.commit()
     return brk
 
 
@@ -140,10 +155,7 @@ def end_break(*, user_id: int) -> TimeClockBreak:
     if not entry:
         raise TimekeepingError("User is not clocked in")
 
-    brk = db.session.query(TimeClockBreak).filter_by(
-        time_clock_entry_id=entry.id,
-        end_at=None,
-    ).first()
+    brk = _get_open_break(entry.id)
     if not brk:
         raise TimekeepingError("No active break")
 
@@ -164,7 +176,6 @@ def end_break(*, user_id: int) -> TimeClockBreak:
         occurred_at=brk.end_at,
     )
 
-    db.session.commit()
     return brk
 
 
@@ -173,10 +184,7 @@ def get_current_status(user_id: int) -> dict:
     if not entry:
         return {"status": "CLOCKED_OUT", "entry": None, "on_break": False}
 
-    open_break = db.session.query(TimeClockBreak).filter_by(
-        time_clock_entry_id=entry.id,
-        end_at=None,
-    ).first()
+    open_break = _get_open_break(entry.id)
 
     return {
         "status": "ON_BREAK" if open_break else "CLOCKED_IN",
@@ -193,7 +201,7 @@ def create_correction(
     reason: str,
     submitted_by_user_id: int,
 ) -> TimeClockCorrection:
-    entry = db.session.query(TimeClockEntry).filter_by(id=entry_id).first()
+    entry = db.session.get(TimeClockEntry, entry_id)
     if not entry:
         raise TimekeepingError("Time clock entry not found")
 
@@ -201,7 +209,9 @@ def create_correction(
         raise TimekeepingError("reason is required")
 
     correction = TimeClockCorrection(
-        time_clock_entry_id=entry.id,
+        # Relationship rather than the bare FK, so the loaded entry stays
+        # attached and an approval in this session needs no reload
+        time_clock_entry=entry,
         original_clock_in_at=entry.clock_in_at,
         original_clock_out_at=entry.clock_out_at,
         corrected_clock_in_at=corrected_clock_in_at,
@@ -224,7 +234,6 @@ def create_correction(
         note=reason,
     )
 
-    db.session.commit()
     return correction
 
 
@@ -241,7 +250,7 @@ def edit_entry(
     if not reason or not reason.strip():
         raise TimekeepingError("reason is required for edits")
 
-    entry = db.session.query(TimeClockEntry).filter_by(id=entry_id).first()
+    entry = db.session.get(TimeClockEntry, entry_id)
     if not entry:
         raise TimekeepingError("Time clock entry not found")
 
@@ -294,7 +303,6 @@ def edit_entry(
         note=reason.strip(),
     )
 
-    db.session.commit()
     return entry, correction
 
 
@@ -304,7 +312,13 @@ def approve_correction(
     approved_by_user_id: int,
     approval_notes: str | None = None,
 ) -> TimeClockCorrection:
-    correction = db.session.query(TimeClockCorrection).filter_by(id=correction_id).first()
+    # PERFORMANCE: The ledger event needs the entry's store; load it in the same query
+    correction = (
+        db.session.query(TimeClockCorrection)
+        .options(joinedload(TimeClockCorrection.time_clock_entry))
+        .filter_by(id=correction_id)
+        .first()
+    )
     if not correction:
         raise TimekeepingError("Time clock correction not found")
 
@@ -318,7 +332,7 @@ def approve_correction(
 
     db.session.flush()
 
-    entry = correction.entry
+    entry = correction.time_clock_entry
     append_ledger_event(
         store_id=entry.store_id,
         event_type="timeclock.correction_approved",
@@ -330,5 +344,4 @@ def approve_correction(
         note=approval_notes,
     )
 
-    db.session.commit()
     return correction
@@ -16,14 +16,20 @@ LIFECYCLE:
 5. CANCELLED: Cancelled before shipping
 """
 from __future__ import annotations
+from sqlalchemy import exists, insert, select, update
+from sqlalchemy.orm import selectinload
 from app.extensions import db
 from app.models import Transfer, TransferLine, InventoryTransaction, Product
-from app.services.inventory_service import get_quantity_on_hand, get_weighted_average_cost_cents
+from app.services.inventory_service import (
+    find_insufficient_inventory,
+    get_quantity_on_hand,
+    get_weighted_average_costs_cents,
+)
 from app.services.concurrency import lock_for_update, run_with_retry
 from app.services.document_service import next_document_number
-from app.services.ledger_service import append_ledger_event
+from app.services.ledger_service import append_ledger_event, append_ledger_events
 from typing import Optional
-from datetime import datetime, timezone
+from app.time_utils import to_utc_z, utcnow
 
 
 # Transfer status constants
@@ -39,6 +45,53 @@ class TransferError(Exception):
     pass
 
 
+# PERFORMANCE: Bulk INSERT ... RETURNING for ship/receive postings; skips
+# per-row ORM instance setup and returns ids in parameter (line) order.
+# Built once so the compiled form is reused from the statement cache.
+_INSERT_TRANSACTIONS_STMT = insert(InventoryTransaction).returning(
+    InventoryTransaction.id, sort_by_parameter_order=True
+)
+
+# TransferLine.to_dict() fields, selected as plain rows by get_transfer_summary.
+_SUMMARY_LINE_COLUMNS = (
+    TransferLine.id,
+    TransferLine.transfer_id,
+    TransferLine.product_id,
+    TransferLine.quantity,
+    TransferLine.unit_cost_cents,
+    TransferLine.out_transaction_id,
+    TransferLine.in_transaction_id,
+    TransferLine.version_id,
+    TransferLine.created_at,
+)
+
+
+def _get_transfer_with_lines(transfer_id: int) -> Transfer | None:
+    """Load the transfer header and its lines in the same round of queries (no lock)."""
+    return db.session.get(Transfer, transfer_id, options=[selectinload(Transfer.lines)])
+
+
+def _require_status(transfer: Transfer, expected: str, verb: str) -> None:
+    """Raise the standard TransferError when the transfer is not in the expected status."""
+    if transfer.status != expected:
+        raise TransferError(f"Cannot {verb} transfer in {transfer.status} status")
+
+
+def _lock_transfer_in_status(transfer_id: int, status: str, verb: str) -> Transfer:
+    """
+    Lock the transfer header and re-check its status just before writing.
+
+    WHY: Verbs validate against unlocked reads first, so the row lock is
+    held only for the state transition itself. Refreshing under the lock
+    catches a concurrent transition made in the meantime.
+    """
+    transfer = lock_for_update(
+        db.session.query(Transfer).filter_by(id=transfer_id)
+    ).populate_existing().one()
+    _require_status(transfer, status, verb)
+    return transfer
+
+
 def create_transfer(
     from_store_id: int,
     to_store_id: int,
@@ -119,21 +172,23 @@ def add_transfer_line(
         TransferError: If validation fails
     """
     def _op():
-        transfer = lock_for_update(db.session.query(Transfer).filter_by(id=transfer_id)).first()
-        if not transfer:
-            raise TransferError(f"Transfer {transfer_id} not found")
-
-        if transfer.status != TRANSFER_STATUS_PENDING:
-            raise TransferError(f"Cannot add lines to transfer in {transfer.status} status")
-
         if quantity <= 0:
             raise TransferError("Quantity must be positive")
 
+        # LOCK ORDER: Product before Transfer. Inventory postings lock only
+        # products, so taking the product first keeps every path acquiring
+        # locks in the same order and rules out a wait cycle.
         # Verify product exists (lock to prevent concurrent depletion)
         product = lock_for_update(db.session.query(Product).filter_by(id=product_id)).first()
         if not product:
             raise TransferError(f"Product {product_id} not found")
 
+        transfer = lock_for_update(db.session.query(Transfer).filter_by(id=transfer_id)).first()
+        if not transfer:
+            raise TransferError(f"Transfer {transfer_id} not found")
+
+        _require_status(transfer, TRANSFER_STATUS_PENDING, "add lines to")
+
         # Verify sufficient inventory at source store
         on_hand = get_quantity_on_hand(transfer.from_store_id, product_id)
         if on_hand < quantity:
@@ -183,20 +238,33 @@ def approve_transfer(
         TransferError: If validation fails
     """
     def _op():
-        transfer = lock_for_update(db.session.query(Transfer).filter_by(id=transfer_id)).first()
-        if not transfer:
-            raise TransferError(f"Transfer {transfer_id} not found")
-
-        if transfer.status != TRANSFER_STATUS_PENDING:
-            raise TransferError(f"Cannot approve transfer in {transfer.status} status")
-
-        if not transfer.lines:
+        # PERFORMANCE: Guarded UPDATE ... RETURNING validates and approves in one
+        # round-trip; concurrent approvals race on the WHERE clause, not a lock.
+        # version_id is bumped by hand since bulk UPDATE skips the ORM counter.
+        transfer = db.session.scalars(
+            update(Transfer)
+            .where(
+                Transfer.id == transfer_id,
+                Transfer.status == TRANSFER_STATUS_PENDING,
+                exists().where(TransferLine.transfer_id == Transfer.id),
+            )
+            .values(
+                status=TRANSFER_STATUS_APPROVED,
+                approved_by_user_id=user_id,
+                approved_at=utcnow(),
+                version_id=Transfer.version_id + 1,
+            )
+            .returning(Transfer)
+        ).one_or_none()
+
+        if transfer is None:
+            # Error path only: work out which guard failed
+            transfer = db.session.get(Transfer, transfer_id)
+            if not transfer:
+                raise TransferError(f"Transfer {transfer_id} not found")
+            _require_status(transfer, TRANSFER_STATUS_PENDING, "approve")
             raise TransferError("Cannot approve transfer with no lines")
 
-        transfer.status = TRANSFER_STATUS_APPROVED
-        transfer.approved_by_user_id = user_id
-        transfer.approved_at = datetime.now(timezone.utc)
-
         append_ledger_event(
             store_id=transfer.from_store_id,
             event_type="transfer.approved",
@@ -232,67 +300,80 @@ def ship_transfer(
         TransferError: If validation fails
     """
     def _op():
-        transfer = lock_for_update(db.session.query(Transfer).filter_by(id=transfer_id)).first()
+        transfer = _get_transfer_with_lines(transfer_id)
         if not transfer:
             raise TransferError(f"Transfer {transfer_id} not found")
 
-        if transfer.status != TRANSFER_STATUS_APPROVED:
-            raise TransferError(f"Cannot ship transfer in {transfer.status} status")
+        _require_status(transfer, TRANSFER_STATUS_APPROVED, "ship")
 
-        # Create OUT transactions at source store for each line
-        for line in transfer.lines:
-            # Re-verify sufficient inventory
-            on_hand = get_quantity_on_hand(transfer.from_store_id, line.product_id)
-            if on_hand < line.quantity:
+        # Lines are frozen once approved; keep them across the locked refresh below
+        lines = list(transfer.lines)
+
+        # One timestamp for the whole event: every line posts at the same instant
+        now = utcnow()
+
+        # Re-verify sufficient inventory and price every line: one query each
+        requested = {line.product_id: line.quantity for line in lines}
+        short = find_insufficient_inventory(transfer.from_store_id, requested)
+        for line in lines:
+            if line.product_id in short:
                 raise TransferError(
                     f"Insufficient inventory for product {line.product_id}. "
-                    f"On-hand: {on_hand}, required: {line.quantity}"
+                    f"On-hand: {short[line.product_id]}, required: {line.quantity}"
                 )
+        wac_by_product = get_weighted_average_costs_cents(transfer.from_store_id, list(requested))
 
-            unit_cost_cents = get_weighted_average_cost_cents(transfer.from_store_id, line.product_id)
+        # Create OUT transactions at source store for each line
+        note = f"Transfer {transfer.document_number} to store {transfer.to_store_id}"
+        out_rows = []
+        for line in lines:
+            unit_cost_cents = wac_by_product[line.product_id]
             if unit_cost_cents is None:
                 raise TransferError(f"Cannot transfer product {line.product_id} without cost basis")
 
-            line.unit_cost_cents = unit_cost_cents
-
-            # Create negative TRANSFER transaction with IN_TRANSIT state
-            out_txn = InventoryTransaction(
-                store_id=transfer.from_store_id,
-                product_id=line.product_id,
-                type="TRANSFER",
-                quantity_delta=-line.quantity,  # Negative: leaving store
-                unit_cost_cents=unit_cost_cents,
-                status="POSTED",  # Immediately affects inventory
-                inventory_state="IN_TRANSIT",  # In transit to destination
-                posted_by_user_id=user_id,
-                posted_at=datetime.now(timezone.utc),
-                note=f"Transfer {transfer.document_number} to store {transfer.to_store_id}",
-            )
-
-            db.session.add(out_txn)
-            db.session.flush()
-
-            # Link transaction to line
-            line.out_transaction_id = out_txn.id
-
-            append_ledger_event(
+            # Negative TRANSFER transaction with IN_TRANSIT state
+            out_rows.append({
+                "store_id": transfer.from_store_id,
+                "product_id": line.product_id,
+                "type": "TRANSFER",
+                "quantity_delta": -line.quantity,  # Negative: leaving store
+                "unit_cost_cents": unit_cost_cents,
+                "status": "POSTED",  # Immediately affects inventory
+                "inventory_state": "IN_TRANSIT",  # In transit to destination
+                "posted_by_user_id": user_id,
+                "posted_at": now,
+                "note": note,
+            })
+
+        # Validation is done; hold the row lock only for the writes
+        transfer = _lock_transfer_in_status(transfer_id, TRANSFER_STATUS_APPROVED, "ship")
+
+        out_txn_ids = db.session.scalars(_INSERT_TRANSACTIONS_STMT, out_rows).all()
+
+        ledger_events = []
+        for line, row, out_txn_id in zip(lines, out_rows, out_txn_ids):
+            # Link transaction and cost basis to line
+            line.unit_cost_cents = row["unit_cost_cents"]
+            line.out_transaction_id = out_txn_id
+
+            ledger_events.append(dict(
                 store_id=transfer.from_store_id,
                 event_type="inventory.transfer_out",
                 event_category="inventory",
                 entity_type="inventory_transaction",
-                entity_id=out_txn.id,
+                entity_id=out_txn_id,
                 actor_user_id=user_id,
                 transfer_id=transfer.id,
-                occurred_at=out_txn.posted_at,
-                note=out_txn.note,
-                payload=f"product_id={line.product_id},quantity={line.quantity},unit_cost_cents={unit_cost_cents}",
-            )
+                occurred_at=now,
+                note=note,
+                payload=f"product_id={line.product_id},quantity={line.quantity},unit_cost_cents={line.unit_cost_cents}",
+            ))
 
         transfer.status = TRANSFER_STATUS_IN_TRANSIT
         transfer.shipped_by_user_id = user_id
-        transfer.shipped_at = datetime.now(timezone.utc)
+        transfer.shipped_at = now
 
-        append_ledger_event(
+        ledger_events.append(dict(
             store_id=transfer.from_store_id,
             event_type="transfer.shipped",
             event_category="transfers",
@@ -301,7 +382,8 @@ def ship_transfer(
             actor_user_id=user_id,
             transfer_id=transfer.id,
             occurred_at=transfer.shipped_at,
-        )
+        ))
+        append_ledger_events(ledger_events)
 
         return transfer
 
@@ -327,57 +409,68 @@ def receive_transfer(
         TransferError: If validation fails
     """
     def _op():
-        transfer = lock_for_update(db.session.query(Transfer).filter_by(id=transfer_id)).first()
+        transfer = _get_transfer_with_lines(transfer_id)
         if not transfer:
             raise TransferError(f"Transfer {transfer_id} not found")
 
-        if transfer.status != TRANSFER_STATUS_IN_TRANSIT:
-            raise TransferError(f"Cannot receive transfer in {transfer.status} status")
+        _require_status(transfer, TRANSFER_STATUS_IN_TRANSIT, "receive")
+
+        # Lines are frozen once shipped; keep them across the locked refresh below
+        lines = list(transfer.lines)
+
+        # One timestamp for the whole event: every line posts at the same instant
+        now = utcnow()
 
         # Create IN transactions at destination store for each line
-        for line in transfer.lines:
+        note = f"Transfer {transfer.document_number} from store {transfer.from_store_id}"
+        in_rows = []
+        for line in lines:
             unit_cost_cents = line.unit_cost_cents
             if unit_cost_cents is None:
                 raise TransferError("Transfer line missing unit cost")
 
-            # Create positive TRANSFER transaction with SELLABLE state
-            in_txn = InventoryTransaction(
-                store_id=transfer.to_store_id,
-                product_id=line.product_id,
-                type="TRANSFER",
-                quantity_delta=line.quantity,  # Positive: arriving at store
-                unit_cost_cents=unit_cost_cents,
-                status="POSTED",  # Immediately affects inventory
-                inventory_state="SELLABLE",  # Ready for sale
-                posted_by_user_id=user_id,
-                posted_at=datetime.now(timezone.utc),
-                note=f"Transfer {transfer.document_number} from store {transfer.from_store_id}",
-            )
-
-            db.session.add(in_txn)
-            db.session.flush()
-
+            # Positive TRANSFER transaction with SELLABLE state
+            in_rows.append({
+                "store_id": transfer.to_store_id,
+                "product_id": line.product_id,
+                "type": "TRANSFER",
+                "quantity_delta": line.quantity,  # Positive: arriving at store
+                "unit_cost_cents": unit_cost_cents,
+                "status": "POSTED",  # Immediately affects inventory
+                "inventory_state": "SELLABLE",  # Ready for sale
+                "posted_by_user_id": user_id,
+                "posted_at": now,
+                "note": note,
+            })
+
+        # Validation is done; hold the row lock only for the writes
+        transfer = _lock_transfer_in_status(transfer_id, TRANSFER_STATUS_IN_TRANSIT, "receive")
+
+        in_txn_ids = db.session.scalars(_INSERT_TRANSACTIONS_STMT, in_rows).all()
+
+        ledger_events = []
+        for line, in_txn_id in zip(lines, in_txn_ids):
             # Link transaction to line
-            line.in_transaction_id = in_txn.id
+            line.in_transaction_id = in_txn_id
 
-            append_ledger_event(
+            ledger_events.append(dict(
                 store_id=transfer.to_store_id,
                 event_type="inventory.transfer_in",
                 event_category="inventory",
                 entity_type="inventory_transaction",
-                entity_id=in_txn.id,
+                entity_id=in_txn_id,
                 actor_user_id=user_id,
                 transfer_id=transfer.id,
-                occurred_at=in_txn.posted_at,
-                note=in_txn.note,
-                payload=f"product_id={line.product_id},quantity={line.quantity},unit_cost_cents={unit_cost_cents}",
-            )
+                occurred_at=now,
+                note=note,
+                payload=f"product_id={line.product_id},quantity={line.quantity},unit_cost_cents={line.unit_cost_cents}",
+            ))
 
         transfer.status = TRANSFER_STATUS_RECEIVED
         transfer.received_by_user_id = user_id
-        transfer.received_at = datetime.now(timezone.utc)
+        transfer.received_at = now
 
-        append_ledger_event(
+        ledger_events.append(dict(
             store_id=transfer.to_store_id,
             event_type="transfer.received",
             event_category="transfers",
@@ -386,7 +479,8 @@ def receive_transfer(
             actor_user_id=user_id,
             transfer_id=transfer.id,
             occurred_at=transfer.received_at,
-        )
+        ))
+        append_ledger_events(ledger_events)
 
         return transfer
 
@@ -425,7 +519,7 @@ def cancel_transfer(
 
         transfer.status = TRANSFER_STATUS_CANCELLED
         transfer.cancelled_by_user_id = user_id
-        transfer.cancelled_at = datetime.now(timezone.utc)
+        transfer.cancelled_at = utcnow()
         transfer.cancellation_reason = reason
 
         append_ledger_event(
@@ -458,11 +552,20 @@ def get_transfer_summary(transfer_id: int) -> dict:
     Raises:
         TransferError: If transfer not found
     """
-    transfer = db.session.query(Transfer).get(transfer_id)
+    transfer = db.session.get(Transfer, transfer_id)
     if not transfer:
         raise TransferError(f"Transfer {transfer_id} not found")
 
-    return {
-        **transfer.to_dict(),
-        "lines": [line.to_dict() for line in transfer.lines],
-    }
+    # PERFORMANCE: Read-only path; lines come back as plain rows instead of
+    # instrumented TransferLine objects. Keys match TransferLine.to_dict().
+    lines = []
+    for row in db.session.execute(
+        select(*_SUMMARY_LINE_COLUMNS)
+        .where(TransferLine.transfer_id == transfer_id)
+        .order_by(TransferLine.id)
+    ).mappings():
+        line = dict(row)
+        line["created_at"] = to_utc_z(line["created_at"])
+        lines.append(line)
+
+    return {**transfer.to_dict(), "lines": lines}
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from flask import g, has_request_context
+from sqlalchemy import or_
+
 from ..extensions import db
 from ..models import User, Store, UserStoreManagerAccess
 
@@ -9,22 +12,66 @@ def get_manager_store_ids(user_id: int, *, include_primary: bool = True) -> set[
     Get store IDs where the user has managerial access.
 
     include_primary includes User.store_id as implicit managerial scope.
+
+    PERFORMANCE: Memoized per request; authorization checks call this
+    repeatedly for the same user. Grants and revokes drop the entry.
     """
-    rows = db.session.query(UserStoreManagerAccess.store_id).filter_by(user_id=user_id).all()
-    store_ids = {row[0] for row in rows}
+    if not has_request_context():
+        return _load_manager_store_ids(user_id, include_primary)
+    cache = g.setdefault("_manager_store_ids", {})
+    key = (user_id, include_primary)
+    store_ids = cache.get(key)
+    if store_ids is None:
+        store_ids = cache[key] = frozenset(_load_manager_store_ids(user_id, include_primary))
+    # Callers may narrow or extend the set they get back
+    return set(store_ids)
+
+
+def invalidate_manager_store_ids(user_id: int) -> None:
+    """Drop the request-scoped manager store cache for a user after access changes."""
+    if has_request_context():
+        cache = g.get("_manager_store_ids", {})
+        for include_primary in (True, False):
+            cache.pop((user_id, include_primary), None)
+
+
+def _load_manager_store_ids(user_id: int, include_primary: bool) -> set[int]:
+    # One round-trip: the user's primary store rides along on each access row
+    rows = (
+        db.session.query(User.store_id, UserStoreManagerAccess.store_id)
+        .outerjoin(UserStoreManagerAccess, UserStoreManagerAccess.user_id == User.id)
+        .filter(User.id == user_id)
+        .all()
+    )
+    store_ids = {access_store_id for _, access_store_id in rows if access_store_id is not None}
 
-    if include_primary:
-        user = db.session.query(User).filter_by(id=user_id).first()
-        if user and user.store_id is not None:
-            store_ids.add(user.store_id)
+    if include_primary and rows and rows[0][0] is not None:
+        store_ids.add(rows[0][0])
 
     return store_ids
 
 
 def user_can_manage_store(user_id: int, store_id: int | None) -> bool:
+    """
+    Whether the user manages store_id, directly or as their primary store.
+
+    PERFORMANCE: Reuses the request's memoized store set when one is
+    already loaded; otherwise answers with a single EXISTS probe rather
+    than materializing every managed store.
+    """
     if store_id is None:
         return False
-    return store_id in get_manager_store_ids(user_id, include_primary=True)
+    if has_request_context():
+        cached = g.get("_manager_store_ids", {}).get((user_id, True))
+        if cached is not None:
+            return store_id in cached
+    via_access = (
+        db.session.query(UserStoreManagerAccess.user_id)
+        .filter_by(user_id=user_id, store_id=store_id)
+        .exists()
+    )
+    via_primary = db.session.query(User.id).filter_by(id=user_id, store_id=store_id).exists()
+    return bool(db.session.query(or_(via_access, via_primary)).scalar())
 
 
 def list_manager_access(user_id: int) -> list[UserStoreManagerAccess]:
@@ -37,11 +84,11 @@ def list_manager_access(user_id: int) -> list[UserStoreManagerAccess]:
 
 
 def grant_manager_access(*, user_id: int, store_id: int, granted_by_user_id: int | None = None) -> UserStoreManagerAccess:
-    user = db.session.query(User).filter_by(id=user_id).first()
+    user = db.session.get(User, user_id)
     if not user:
         raise ValueError("User not found")
 
-    store = db.session.query(Store).filter_by(id=store_id).first()
+    store = db.session.get(Store, store_id)
     if not store:
         raise ValueError("Store not found")
 
@@ -59,6 +106,7 @@ def grant_manager_access(*, user_id: int, store_id: int, granted_by_user_id: int
     )
     db.session.add(access)
     db.session.commit()
+    invalidate_manager_store_ids(user_id)
     return access
 
 
@@ -69,4 +117,5 @@ def revoke_manager_access(*, user_id: int, store_id: int) -> bool:
 
     db.session.delete(access)
     db.session.commit()
+    invalidate_manager_store_ids(user_id)
     return True
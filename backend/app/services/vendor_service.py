@@ -16,8 +16,11 @@ DESIGN:
 - Vendor is stored on receive document header, not per line item
 """
 
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
 from ..extensions import db
-from ..models import Vendor, Organization
+from ..models import Vendor, Organization, Store
 from .ledger_service import append_ledger_event
 from app.time_utils import utcnow
 
@@ -32,6 +35,26 @@ class VendorValidationError(Exception):
     pass
 
 
+def _first_store_id(org_id: int) -> int | None:
+    """Lowest store id in the org, used to place org-level vendor events in the ledger."""
+    # PERFORMANCE: LIMIT 1 scalar instead of loading the whole org.stores collection
+    return (
+        db.session.query(Store.id)
+        .filter(Store.org_id == org_id)
+        .order_by(Store.id)
+        .limit(1)
+        .scalar()
+    )
+
+
+def _flush_or_duplicate_code(code: str | None) -> None:
+    try:
+        db.session.flush()
+    except IntegrityError:
+        db.session.rollback()
+        raise VendorValidationError(f"Vendor code '{code}' already exists in this organization")
+
+
 def create_vendor(
     *,
     org_id: int,
@@ -89,16 +112,6 @@ def create_vendor(
         if not code:
             code = None
 
-    # Check for duplicate code within organization
-    if code:
-        existing = db.session.query(Vendor).filter(
-            Vendor.org_id == org_id,
-            Vendor.code == code,
-            Vendor.is_active.is_(True),
-        ).first()
-        if existing:
-            raise VendorValidationError(f"Vendor code '{code}' already exists in this organization")
-
     vendor = Vendor(
         org_id=org_id,
         name=name,
@@ -113,15 +126,17 @@ def create_vendor(
     )
 
     db.session.add(vendor)
-    db.session.flush()
+    # uq_vendors_org_code enforces code uniqueness, so the INSERT doubles as
+    # the duplicate check (inactive vendors keep their codes as well)
+    _flush_or_duplicate_code(code)
 
     # Emit ledger event
     # Note: Vendors are org-level, so we use org's first store or None for store_id
     # In practice, this should be associated with the store context of the operation
-    first_store = org.stores[0] if org.stores else None
-    if first_store:
+    first_store_id = _first_store_id(org_id)
+    if first_store_id:
         append_ledger_event(
-            store_id=first_store.id,
+            store_id=first_store_id,
             event_type="vendor.created",
             event_category="vendor",
             entity_type="vendor",
@@ -182,15 +197,6 @@ def update_vendor(
     if code is not None:
         if code:
             code = code.strip().upper()
-            # Check for duplicate code
-            existing = db.session.query(Vendor).filter(
-                Vendor.org_id == vendor.org_id,
-                Vendor.code == code,
-                Vendor.id != vendor_id,
-                Vendor.is_active.is_(True),
-            ).first()
-            if existing:
-                raise VendorValidationError(f"Vendor code '{code}' already exists in this organization")
             vendor.code = code
         else:
             vendor.code = None
@@ -212,14 +218,14 @@ def update_vendor(
     if notes is not None:
         vendor.notes = notes
 
-    db.session.flush()
+    # Duplicate codes are rejected by uq_vendors_org_code on flush
+    _flush_or_duplicate_code(vendor.code)
 
     # Emit ledger event
-    org = vendor.organization
-    first_store = org.stores[0] if org.stores else None
-    if first_store:
+    first_store_id = _first_store_id(vendor.org_id)
+    if first_store_id:
         append_ledger_event(
-            store_id=first_store.id,
+            store_id=first_store_id,
             event_type="vendor.updated",
             event_category="vendor",
             entity_type="vendor",
@@ -293,14 +299,14 @@ def list_vendors(
     Returns:
         Tuple of (list of Vendor objects, total count)
     """
-    query = db.session.query(Vendor).filter(Vendor.org_id == org_id)
+    filters = [Vendor.org_id == org_id]
 
     if not include_inactive:
-        query = query.filter(Vendor.is_active.is_(True))
+        filters.append(Vendor.is_active.is_(True))
 
     if search:
         search_term = f"%{search}%"
-        query = query.filter(
+        filters.append(
             db.or_(
                 Vendor.name.ilike(search_term),
                 Vendor.code.ilike(search_term),
@@ -308,14 +314,24 @@ def list_vendors(
             )
         )
 
-    # Get total count before pagination
-    total = query.count()
+    # PERFORMANCE: COUNT(*) OVER () returns the total alongside the page,
+    # so the predicate is planned and scanned once instead of twice.
+    rows = db.session.execute(
+        select(Vendor, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(Vendor.name.asc())
+        .offset(offset)
+        .limit(limit)
+    ).all()
 
-    # Apply ordering and pagination
-    query = query.order_by(Vendor.name.asc())
-    query = query.offset(offset).limit(limit)
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    if offset <= 0:
+        return [], 0
 
-    return query.all(), total
+    # An offset past the last row returns no rows to carry the total.
+    total = db.session.scalar(select(func.count()).select_from(Vendor).where(*filters))
+    return [], total
 
 
 def deactivate_vendor(
@@ -347,11 +363,10 @@ def deactivate_vendor(
     db.session.flush()
 
     # Emit ledger event
-    org = vendor.organization
-    first_store = org.stores[0] if org.stores else None
-    if first_store:
+    first_store_id = _first_store_id(vendor.org_id)
+    if first_store_id:
         append_ledger_event(
-            store_id=first_store.id,
+            store_id=first_store_id,
             event_type="vendor.deactivated",
             event_category="vendor",
             entity_type="vendor",
@@ -393,11 +408,10 @@ def reactivate_vendor(
     db.session.flush()
 
     # Emit ledger event
-    org = vendor.organization
-    first_store = org.stores[0] if org.stores else None
-    if first_store:
+    first_store_id = _first_store_id(vendor.org_id)
+    if first_store_id:
         append_ledger_event(
-            store_id=first_store.id,
+            store_id=first_store_id,
             event_type="vendor.reactivated",
             event_category="vendor",
             entity_type="vendor",
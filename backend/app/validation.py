@@ -5,10 +5,11 @@ from datetime import datetime
 from app.time_utils import parse_iso_datetime
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
 
 from sqlalchemy import Boolean, Integer, String, Text, DateTime
-from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.orm import DeclarativeMeta, Mapper
 
 
 # Maximum price: $9,999,999.99 (999,999,999 cents)
@@ -24,85 +25,160 @@ class ConflictError(ValueError):
     """409-level business rule conflict (e.g., duplicate SKU)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelValidationPolicy:
     """
     Central policy layer:
     - writable_fields: what clients are allowed to set (security boundary)
     - required_on_create: fields required for POST
     - allow_null_fields: extra allowlist for setting null even if you want to special-case later
+
+    Field sets are normalized to frozensets at construction, so policies are
+    truly immutable and validate_payload never has to default them per call.
     """
-    writable_fields: set[str]
-    required_on_create: set[str] = None  # type: ignore
+    writable_fields: frozenset[str]
+    required_on_create: frozenset[str] = frozenset()
     # Optional: keep for future; currently we just honor SQLAlchemy column.nullable
-    allow_null_fields: set[str] | None = None
+    allow_null_fields: frozenset[str] | None = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "writable_fields", frozenset(self.writable_fields))
+        object.__setattr__(self, "required_on_create", frozenset(self.required_on_create or ()))
+        if self.allow_null_fields is not None:
+            object.__setattr__(self, "allow_null_fields", frozenset(self.allow_null_fields))
 
-def _columns_by_key(model: DeclarativeMeta) -> dict[str, Any]:
-    mapper = model.__mapper__
-    return {c.key: c for c in mapper.columns}
+
+def _coerce_int(key: str, value: Any) -> int:
+    # Integers - strict validation to reject floats and scientific notation
+    # Already an int (but not bool which is a subclass of int)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    # String input - must be plain digits (with optional leading minus)
+    if isinstance(value, str):
+        stripped = value.strip()
+        # Fast path: base-10 int() accepts no 'e' or '.', so success means
+        # the value already passed the checks below
+        try:
+            return int(stripped)
+        except ValueError:
+            pass
+        # Reject scientific notation (e.g., "1e15", "1E10")
+        if 'e' in stripped.lower():
+            raise ValidationError(f"{key} must be a plain integer (scientific notation not allowed)")
+        # Reject decimal points (e.g., "12.5")
+        if '.' in stripped:
+            raise ValidationError(f"{key} must be an integer (no decimals)")
+        raise ValidationError(f"{key} must be an integer")
+    # Reject floats explicitly
+    if isinstance(value, float):
+        raise ValidationError(f"{key} must be an integer, not a decimal")
+    # Other types
+    raise ValidationError(f"{key} must be an integer")
+
+
+def _coerce_bool(key: str, value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    # fallback: truthiness
+    return bool(value)
+
+
+def _coerce_dt(key: str, value: Any) -> datetime:
+    # Datetimes (accept ISO-8601 strings; normalize to UTC)
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            dt = parse_iso_datetime(value)
+        except Exception:
+            raise ValidationError(f"{key} must be an ISO-8601 datetime")
+        if dt is None:
+            raise ValidationError(f"{key} must be an ISO-8601 datetime")
+        return dt
+    raise ValidationError(f"{key} must be a datetime")
+
+
+def _coerce_str(key: str, value: Any) -> str:
+    # JSON strings skip the str() call; strip() already returns the same
+    # object when there is nothing to trim
+    if type(value) is str:
+        return value.strip()
+    return str(value).strip()
+
+
+def _coerce_passthrough(key: str, value: Any) -> Any:
+    # Default: leave as-is
+    return value
 
 
-def _coerce_value(col, value: Any):
-    coltype = col.type
+# Exact column type class -> coercer. Subclasses (BigInteger, Unicode,
+# dialect variants) are resolved through the MRO once and then cached here.
+_COERCERS: dict[type, Callable[[str, Any], Any]] = {
+    Integer: _coerce_int,
+    Boolean: _coerce_bool,
+    DateTime: _coerce_dt,
+    String: _coerce_str,
+    Text: _coerce_str,
+}
+
+
+def _coercer_for(coltype) -> Callable[[str, Any], Any]:
+    cls = type(coltype)
+    coerce = _COERCERS.get(cls)
+    if coerce is None:
+        coerce = next(
+            (_COERCERS[base] for base in cls.__mro__ if base in _COERCERS),
+            _coerce_passthrough,
+        )
+        _COERCERS[cls] = coerce
+    return coerce
+
 
+def _coerce_value(col, value: Any):
     if value is None:
         return None
+    return _coercer_for(col.type)(col.key, value)
 
-    # Integers - strict validation to reject floats and scientific notation
-    if isinstance(coltype, Integer):
-        # Already an int (but not bool which is a subclass of int)
-        if isinstance(value, int) and not isinstance(value, bool):
-            return value
-        # String input - must be plain digits (with optional leading minus)
-        if isinstance(value, str):
-            stripped = value.strip()
-            if not stripped:
-                raise ValidationError(f"{col.key} must be an integer")
-            # Reject scientific notation (e.g., "1e15", "1E10")
-            if 'e' in stripped.lower():
-                raise ValidationError(f"{col.key} must be a plain integer (scientific notation not allowed)")
-            # Reject decimal points (e.g., "12.5")
-            if '.' in stripped:
-                raise ValidationError(f"{col.key} must be an integer (no decimals)")
-            try:
-                return int(stripped)
-            except ValueError:
-                raise ValidationError(f"{col.key} must be an integer")
-        # Reject floats explicitly
-        if isinstance(value, float):
-            raise ValidationError(f"{col.key} must be an integer, not a decimal")
-        # Other types
-        raise ValidationError(f"{col.key} must be an integer")
-
-    # Booleans
-    if isinstance(coltype, Boolean):
-        if isinstance(value, bool):
-            return value
-        # fallback: truthiness
-        return bool(value)
 
-    # Datetimes (accept ISO-8601 strings; normalize to UTC)
-    if isinstance(coltype, DateTime):
-        if isinstance(value, datetime):
-            return value
-        if isinstance(value, str):
-            try:
-                dt = parse_iso_datetime(value)
-            except Exception:
-                raise ValidationError(f"{col.key} must be an ISO-8601 datetime")
-            if dt is None:
-                raise ValidationError(f"{col.key} must be an ISO-8601 datetime")
-            return dt
-        raise ValidationError(f"{col.key} must be a datetime")
-
-
-    # Strings / Text
-    if isinstance(coltype, (String, Text)):
-        return str(value).strip()
+@dataclass(frozen=True)
+class _FieldSpec:
+    """Column metadata resolved once per model for validate_payload."""
+    coerce: Callable[[str, Any], Any]
+    nullable: bool
+    reject_blank: bool
+    max_length: int | None
 
-    # Default: leave as-is
-    return value
+
+# Keyed weakly on the mapper: specs hold no column references, so a
+# disposed mapper (e.g. a throwaway test registry) drops its entry.
+_FIELD_SPECS: WeakKeyDictionary[Mapper, dict[str, _FieldSpec]] = WeakKeyDictionary()
+
+
+def _field_specs(model: DeclarativeMeta) -> dict[str, _FieldSpec]:
+    """
+    Resolve each column's coercer and constraints once per model.
+
+    PERFORMANCE: validate_payload runs on every product/inventory write;
+    walking the mapper and probing column types per request and per field
+    is repeated work for metadata that is fixed at import.
+    """
+    mapper = model.__mapper__
+    specs = _FIELD_SPECS.get(mapper)
+    if specs is None:
+        specs = {}
+        for col in mapper.columns:
+            coltype = col.type
+            is_text = isinstance(coltype, (String, Text))
+            specs[col.key] = _FieldSpec(
+                coerce=_coercer_for(coltype),
+                nullable=bool(col.nullable),
+                # Blank string check for non-nullable text fields
+                reject_blank=is_text and not col.nullable,
+                # Max length check for String(n)
+                max_length=coltype.length if isinstance(coltype, String) and coltype.length else None,
+            )
+        _FIELD_SPECS[mapper] = specs
+    return specs
 
 
 def validate_payload(
@@ -127,44 +203,43 @@ def validate_payload(
     if not isinstance(payload, dict):
         raise ValidationError("Invalid JSON payload")
 
-    required = policy.required_on_create or set()
     if not partial:
-        missing = [f for f in required if f not in payload]
+        missing = [f for f in policy.required_on_create if f not in payload]
         if missing:
             raise ValidationError(f"Missing required fields: {', '.join(missing)}")
 
-    cols = _columns_by_key(model)
+    specs = _field_specs(model)
 
-    # Reject unknown / non-writable fields
-    for k in payload.keys():
-        if k not in policy.writable_fields:
-            raise ValidationError(f"Field not allowed: {k}")
-        if k not in cols:
-            raise ValidationError(f"Unknown field: {k}")
+    # Reject unknown / non-writable fields. Set differences clear the
+    # common all-valid payload in C; the loop only runs to name the
+    # first offending key in payload order.
+    keys = payload.keys()
+    if keys - policy.writable_fields or keys - specs.keys():
+        for k in keys:
+            if k not in policy.writable_fields:
+                raise ValidationError(f"Field not allowed: {k}")
+            if k not in specs:
+                raise ValidationError(f"Unknown field: {k}")
 
     patch: dict = {}
 
     for k, raw in payload.items():
-        col = cols[k]
+        spec = specs[k]
 
         # NULL handling
         if raw is None:
-            if not col.nullable:
+            if not spec.nullable:
                 raise ValidationError(f"{k} cannot be null")
             patch[k] = None
             continue
 
-        val = _coerce_value(col, raw)
+        val = spec.coerce(k, raw)
 
-        # Blank string check for non-nullable text fields
-        if isinstance(col.type, (String, Text)) and not col.nullable:
-            if isinstance(val, str) and val == "":
-                raise ValidationError(f"{k} cannot be blank")
+        if spec.reject_blank and isinstance(val, str) and val == "":
+            raise ValidationError(f"{k} cannot be blank")
 
-        # Max length check for String(n)
-        if isinstance(col.type, String) and col.type.length and isinstance(val, str):
-            if len(val) > col.type.length:
-                raise ValidationError(f"{k} exceeds max length {col.type.length}")
+        if spec.max_length is not None and isinstance(val, str) and len(val) > spec.max_length:
+            raise ValidationError(f"{k} exceeds max length {spec.max_length}")
 
         patch[k] = val
 
@@ -187,44 +262,74 @@ def enforce_rules_product(patch: dict) -> None:
         if price > MAX_PRICE_CENTS:
             raise ValidationError(f"price_cents cannot exceed {MAX_PRICE_CENTS} (${MAX_PRICE_CENTS / 100:,.2f})")
 
-def enforce_rules_inventory_receive(patch: dict) -> None:
-    # RECEIVE requires qty > 0 and unit_cost_cents present and >= 0
+def _rule_qty_required(tx_type: str, patch: dict) -> None:
+    if "quantity_delta" not in patch:
+        raise ValidationError(f"quantity_delta is required for {tx_type}")
+
+
+def _rule_qty_positive(tx_type: str, patch: dict) -> None:
     if "quantity_delta" in patch:
-        if patch["quantity_delta"] is None or patch["quantity_delta"] <= 0:
-            raise ValidationError("quantity_delta must be > 0 for RECEIVE")
+        qty = patch["quantity_delta"]
+        if qty is None or qty <= 0:
+            raise ValidationError(f"quantity_delta must be > 0 for {tx_type}")
 
-    if "unit_cost_cents" not in patch or patch["unit_cost_cents"] is None:
-        raise ValidationError("unit_cost_cents is required for RECEIVE")
 
-    if patch["unit_cost_cents"] < 0:
+def _rule_qty_nonzero(tx_type: str, patch: dict) -> None:
+    if "quantity_delta" in patch:
+        qty = patch["quantity_delta"]
+        if qty is None or qty == 0:
+            raise ValidationError(f"quantity_delta must be non-zero for {tx_type}")
+
+
+def _rule_cost_required(tx_type: str, patch: dict) -> None:
+    cost = patch.get("unit_cost_cents")
+    if cost is None:
+        raise ValidationError(f"unit_cost_cents is required for {tx_type}")
+    if cost < 0:
         raise ValidationError("unit_cost_cents must be >= 0")
 
 
-def enforce_rules_inventory_adjust(patch: dict) -> None:
+def _rule_cost_forbidden(tx_type: str, patch: dict) -> None:
+    if patch.get("unit_cost_cents") is not None:
+        raise ValidationError(f"unit_cost_cents must be omitted for {tx_type}")
+
+
+def _rule_sale_ids_required(tx_type: str, patch: dict) -> None:
+    for field in ("sale_id", "sale_line_id"):
+        value = patch.get(field)
+        if value is None or str(value).strip() == "":
+            raise ValidationError(f"{field} is required for {tx_type}")
+
+
+# Inventory transaction type -> ordered business rules. The first failing
+# rule raises, so order sets which message a client sees.
+_INVENTORY_RULES: dict[str, tuple[Callable[[str, dict], None], ...]] = {
+    # RECEIVE requires qty > 0 and unit_cost_cents present and >= 0
+    "RECEIVE": (_rule_qty_positive, _rule_cost_required),
     # ADJUST requires qty != 0 and forbids unit_cost_cents
-    if "quantity_delta" in patch:
-        if patch["quantity_delta"] is None or patch["quantity_delta"] == 0:
-            raise ValidationError("quantity_delta must be non-zero for ADJUST")
+    "ADJUST": (_rule_qty_nonzero, _rule_cost_forbidden),
+    # SALE requires qty > 0, forbids unit_cost_cents (backend computes WAC
+    # snapshot), and requires sale identifiers
+    "SALE": (_rule_qty_required, _rule_qty_positive, _rule_cost_forbidden, _rule_sale_ids_required),
+}
 
-    if "unit_cost_cents" in patch and patch["unit_cost_cents"] is not None:
-        raise ValidationError("unit_cost_cents must be omitted for ADJUST")
 
-def enforce_rules_inventory_sale(patch: dict) -> None:
-    # SALE requires qty > 0, forbids unit_cost_cents, and requires sale identifiers
-    if "quantity_delta" not in patch:
-        raise ValidationError("quantity_delta is required for SALE")
+def enforce_rules_inventory(tx_type: str, patch: dict) -> None:
+    """Apply the business rules for an inventory transaction type."""
+    rules = _INVENTORY_RULES.get(tx_type)
+    if rules is None:
+        raise ValidationError(f"Unsupported inventory transaction type: {tx_type}")
+    for rule in rules:
+        rule(tx_type, patch)
 
-    if patch["quantity_delta"] is None or patch["quantity_delta"] <= 0:
-        raise ValidationError("quantity_delta must be > 0 for SALE")
 
-    # SALE never accepts unit_cost_cents input (backend computes WAC snapshot)
-    if "unit_cost_cents" in patch and patch["unit_cost_cents"] is not None:
-        raise ValidationError("unit_cost_cents must be omitted for SALE")
+def enforce_rules_inventory_receive(patch: dict) -> None:
+    enforce_rules_inventory("RECEIVE", patch)
+
 
-    sale_id = patch.get("sale_id")
-    if sale_id is None or str(sale_id).strip() == "":
-        raise ValidationError("sale_id is required for SALE")
+def enforce_rules_inventory_adjust(patch: dict) -> None:
+    enforce_rules_inventory("ADJUST", patch)
 
-    sale_line_id = patch.get("sale_line_id")
-    if sale_line_id is None or str(sale_line_id).strip() == "":
-        raise ValidationError("sale_line_id is required for SALE")
+
+def enforce_rules_inventory_sale(patch: dict) -> None:
+    enforce_rules_inventory("SALE", patch)
@@ -0,0 +1,41 @@
+"""Add indexed token_hash_prefix to session_tokens
+
+Revision ID: 20261018_session_hash_prefix
+Revises: 20260212_repair_security
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_session_hash_prefix"
+down_revision = "20260212_repair_security"
+branch_labels = None
+depends_on = None
+
+
+def _prefix(token_hash: str) -> int:
+    return int.from_bytes(bytes.fromhex(token_hash[:16]), "big", signed=True)
+
+
+def upgrade():
+    with op.batch_alter_table("session_tokens", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("token_hash_prefix", sa.BigInteger(), nullable=True))
+        batch_op.create_index("ix_session_tokens_token_hash_prefix", ["token_hash_prefix"], unique=False)
+
+    # Backfill prefixes for existing sessions so they keep validating
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, token_hash FROM session_tokens")).fetchall()
+    for row_id, token_hash in rows:
+        bind.execute(
+            sa.text("UPDATE session_tokens SET token_hash_prefix = :prefix WHERE id = :id"),
+            {"prefix": _prefix(token_hash), "id": row_id},
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("session_tokens", schema=None) as batch_op:
+        batch_op.drop_index("ix_session_tokens_token_hash_prefix")
+        batch_op.drop_column("token_hash_prefix")
@@ -0,0 +1,33 @@
+"""Replace the settings_values scope index with a (scope_type, scope_id, key) index
+
+Revision ID: 20261018_settings_scope_key_ix
+Revises: 20261018_session_hash_prefix
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_settings_scope_key_ix"
+down_revision = "20261018_session_hash_prefix"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    values_indexes = {ix["name"] for ix in inspector.get_indexes("settings_values")}
+    with op.batch_alter_table("settings_values", schema=None) as batch_op:
+        if "ix_settings_values_scope_key" not in values_indexes:
+            batch_op.create_index("ix_settings_values_scope_key", ["scope_type", "scope_id", "key"], unique=False)
+        # (scope_type, scope_id) is a prefix of the new index
+        if "ix_settings_values_scope" in values_indexes:
+            batch_op.drop_index("ix_settings_values_scope")
+
+
+def downgrade():
+    with op.batch_alter_table("settings_values", schema=None) as batch_op:
+        batch_op.create_index("ix_settings_values_scope", ["scope_type", "scope_id"], unique=False)
+        batch_op.drop_index("ix_settings_values_scope_key")
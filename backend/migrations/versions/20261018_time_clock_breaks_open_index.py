@@ -0,0 +1,34 @@
+"""Add a partial index for open time clock breaks
+
+Revision ID: 20261018_timeclock_break_open
+Revises: 20261018_settings_scope_key_ix
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_timeclock_break_open"
+down_revision = "20261018_settings_scope_key_ix"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    break_indexes = {ix["name"] for ix in inspector.get_indexes("time_clock_breaks")}
+    if "ix_time_clock_breaks_entry_open" not in break_indexes:
+        op.create_index(
+            "ix_time_clock_breaks_entry_open",
+            "time_clock_breaks",
+            ["time_clock_entry_id"],
+            unique=False,
+            postgresql_where=sa.text("end_at IS NULL"),
+            sqlite_where=sa.text("end_at IS NULL"),
+        )
+
+
+def downgrade():
+    op.drop_index("ix_time_clock_breaks_entry_open", table_name="time_clock_breaks")
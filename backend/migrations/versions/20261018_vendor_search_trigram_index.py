@@ -0,0 +1,52 @@
+"""Add trigram indexes for vendor search
+
+Revision ID: 20261018_vendor_search_trgm
+Revises: 20261018_timeclock_break_open
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_vendor_search_trgm"
+down_revision = "20261018_timeclock_break_open"
+branch_labels = None
+depends_on = None
+
+
+_INDEXES = {
+    "ix_vendors_name_trgm": "name",
+    "ix_vendors_code_trgm": "code",
+    "ix_vendors_reorder_mechanism_trgm": "reorder_mechanism",
+}
+
+
+def upgrade():
+    # list_vendors searches with ILIKE '%term%', which a B-tree cannot serve.
+    # pg_trgm GIN indexes answer ILIKE directly; every OR'd column needs one
+    # for the planner to combine them. Other dialects keep scanning.
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    vendor_indexes = {ix["name"] for ix in sa.inspect(bind).get_indexes("vendors")}
+    for name, column in _INDEXES.items():
+        if name not in vendor_indexes:
+            op.create_index(
+                name,
+                "vendors",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for name in _INDEXES:
+        op.drop_index(name, table_name="vendors", if_exists=True)
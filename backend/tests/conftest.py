@@ -5,9 +5,12 @@ Provides:
 - Flask app with in-memory SQLite
 - Seeded permissions and default roles
 - Admin, manager, and cashier users with tokens
+- isolated_org factory for suites that need their own tenant rows
 """
 
+import itertools
 import os
+
 import pytest
 
 # Set DATABASE_URL before importing app so create_app() picks it up
@@ -81,6 +84,43 @@ def seed(app):
         return {"org_id": org.id, "store_id": store.id}
 
 
+_isolated_org_seq = itertools.count(1)
+
+
+@pytest.fixture
+def isolated_org(app):
+    """
+    Factory for a fresh org with its own stores and, optionally, a user.
+
+    WHY: test_settings_service resets the shared org/store/user tables, so
+    suites that need tenant rows for the whole test build their own.
+
+    Returns {"org_id", "store_ids", "user"}; the user (if any) belongs to
+    the first store.
+    """
+    def make(*, store_count: int = 1, with_user: bool = True) -> dict:
+        n = next(_isolated_org_seq)
+        org = Organization(name=f"Isolated Org {n}", code=f"ISOLATED{n}", is_active=True)
+        _db.session.add(org)
+        _db.session.flush()
+        stores = [Store(org_id=org.id, name=f"Isolated Store {n}-{i}") for i in range(store_count)]
+        _db.session.add_all(stores)
+        _db.session.commit()
+
+        user = None
+        if with_user:
+            user = create_user(
+                username=f"isolated_user_{n}",
+                email=f"isolated_{n}@test.local",
+                password="TestPassword123!",
+                org_id=org.id,
+                store_id=stores[0].id,
+            )
+        return {"org_id": org.id, "store_ids": [store.id for store in stores], "user": user}
+
+    return make
+
+
 @pytest.fixture
 def client(app):
     """Flask test client."""
@@ -0,0 +1,29 @@
+"""
+Document numbering tests.
+
+Verifies per-store, per-type sequences start at 1 and increase by one.
+"""
+
+from app.extensions import db
+from app.models import DocumentSequence
+from app.services.document_service import next_document_number
+
+
+class TestNextDocumentNumber:
+    def test_sequence_starts_at_one_and_increments(self, seed):
+        store_id = seed["store_id"]
+        db.session.query(DocumentSequence).filter_by(store_id=store_id, document_type="TEST_SEQ").delete()
+
+        first = next_document_number(store_id=store_id, document_type="TEST_SEQ", prefix="X")
+        second = next_document_number(store_id=store_id, document_type="TEST_SEQ", prefix="X")
+
+        assert first == f"X-{store_id:03d}-0001"
+        assert second == f"X-{store_id:03d}-0002"
+        seq = db.session.query(DocumentSequence).filter_by(store_id=store_id, document_type="TEST_SEQ").one()
+        assert seq.next_number == 3
+
+    def test_sequences_are_per_type(self, seed):
+        store_id = seed["store_id"]
+        next_document_number(store_id=store_id, document_type="TEST_SEQ_A", prefix="A")
+        other = next_document_number(store_id=store_id, document_type="TEST_SEQ_B", prefix="B", pad=6)
+        assert other == f"B-{store_id:03d}-000001"
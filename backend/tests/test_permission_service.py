@@ -0,0 +1,77 @@
+"""
+Permission service tests.
+
+Verifies:
+- Role permissions are collected for the user
+- Active GRANT/DENY overrides are applied over role permissions
+- Inactive overrides are ignored
+"""
+
+import itertools
+
+import pytest
+
+from app.extensions import db
+from app.models import UserPermissionOverride
+from app.services import permission_service
+from app.services.auth_service import assign_role, create_user
+
+
+_user_seq = itertools.count(1)
+
+
+@pytest.fixture
+def cashier(app, seed):
+    n = next(_user_seq)
+    u = create_user(
+        username=f"perm_user_{n}",
+        email=f"perm_{n}@test.local",
+        password="TestPassword123!",
+        org_id=seed["org_id"],
+        store_id=seed["store_id"],
+    )
+    assign_role(u.id, "cashier")
+    db.session.commit()
+    return u
+
+
+class TestGetUserPermissions:
+    def test_role_permissions(self, cashier):
+        perms = permission_service.get_user_permissions(cashier.id)
+        assert "CREATE_SALE" in perms
+        assert "CREATE_USER" not in perms
+
+    def test_user_without_roles_has_none(self, app, seed):
+        u = create_user(
+            username="perm_no_roles",
+            email="perm_no_roles@test.local",
+            password="TestPassword123!",
+            org_id=seed["org_id"],
+            store_id=seed["store_id"],
+        )
+        assert permission_service.get_user_permissions(u.id) == set()
+
+    def test_overrides_applied(self, cashier):
+        for code, override_type in (("CREATE_USER", "GRANT"), ("CREATE_SALE", "DENY")):
+            permission_service.grant_permission_override(
+                user_id=cashier.id,
+                permission_code=code,
+                granted_by_user_id=cashier.id,
+                override_type=override_type,
+            )
+
+        perms = permission_service.get_user_permissions(cashier.id)
+        assert "CREATE_USER" in perms
+        assert "CREATE_SALE" not in perms
+
+    def test_inactive_override_ignored(self, cashier):
+        permission_service.grant_permission_override(
+            user_id=cashier.id,
+            permission_code="CREATE_SALE",
+            granted_by_user_id=cashier.id,
+            override_type="DENY",
+        )
+        db.session.query(UserPermissionOverride).filter_by(user_id=cashier.id).update({"is_active": False})
+        db.session.commit()
+
+        assert "CREATE_SALE" in permission_service.get_user_permissions(cashier.id)
@@ -0,0 +1,206 @@
+"""
+Session service tests.
+
+Verifies:
+- Valid tokens return tenant context and bump last_used_at
+- Idle and deactivated-user sessions are auto-revoked with a reason
+- Expired and revoked tokens are rejected
+- Cached hits re-check the user and org instead of trusting cached state
+- Bulk revocation and cleanup
+"""
+
+import itertools
+from datetime import timedelta
+
+import pytest
+
+from app.extensions import db
+from sqlalchemy import update
+
+from app.models import Organization, SessionToken, User
+from app.services import session_service
+from app.services.auth_service import create_user
+from app.time_utils import utcnow
+
+
+_user_seq = itertools.count(1)
+
+
+@pytest.fixture
+def user(app, seed):
+    n = next(_user_seq)
+    u = create_user(
+        username=f"session_user_{n}",
+        email=f"session_{n}@test.local",
+        password="TestPassword123!",
+        org_id=seed["org_id"],
+        store_id=seed["store_id"],
+    )
+    db.session.commit()
+    return u
+
+
+def _session_row(token: str) -> SessionToken:
+    return db.session.query(SessionToken).filter_by(
+        token_hash=session_service.hash_token(token)
+    ).one()
+
+
+class TestValidateSession:
+    def test_valid_token_returns_context(self, user, seed):
+        _, token = session_service.create_session(user.id)
+        row = _session_row(token)
+        row.last_used_at = utcnow() - timedelta(minutes=30)
+        db.session.commit()
+
+        context = session_service.validate_session(token)
+
+        assert context is not None
+        assert context.user.id == user.id
+        assert context.org_id == seed["org_id"]
+        assert context.store_id == seed["store_id"]
+        assert utcnow() - _session_row(token).last_used_at < timedelta(minutes=1)
+
+    def test_recent_activity_not_rewritten(self, user):
+        _, token = session_service.create_session(user.id)
+        recent = utcnow() - timedelta(seconds=5)
+        row = _session_row(token)
+        row.last_used_at = recent
+        db.session.commit()
+
+        assert session_service.validate_session(token) is not None
+        assert _session_row(token).last_used_at == recent
+
+    def test_unknown_token_rejected(self, app):
+        assert session_service.validate_session(session_service.generate_token()) is None
+
+    def test_idle_session_revoked(self, user):
+        _, token = session_service.create_session(user.id)
+        row = _session_row(token)
+        row.last_used_at = utcnow() - session_service.SESSION_IDLE_TIMEOUT - timedelta(minutes=1)
+        db.session.commit()
+
+        assert session_service.validate_session(token) is None
+        row = _session_row(token)
+        assert row.is_revoked is True
+        assert row.revoked_reason == "Idle timeout"
+
+    def test_expired_session_rejected_without_revoke(self, user):
+        _, token = session_service.create_session(user.id)
+        row = _session_row(token)
+        row.expires_at = utcnow() - timedelta(minutes=1)
+        db.session.commit()
+
+        assert session_service.validate_session(token) is None
+        assert _session_row(token).is_revoked is False
+
+    def test_deactivated_user_session_revoked(self, user):
+        _, token = session_service.create_session(user.id)
+        db.session.get(User, user.id).is_active = False
+        db.session.commit()
+
+        assert session_service.validate_session(token) is None
+        row = _session_row(token)
+        assert row.is_revoked is True
+        assert row.revoked_reason == "User account deactivated"
+
+    def test_revoked_session_rejected(self, user):
+        _, token = session_service.create_session(user.id)
+        assert session_service.revoke_session(token) is True
+
+        assert session_service.validate_session(token) is None
+        assert session_service.revoke_session(token) is False
+
+
+class TestSessionCache:
+    def test_cached_hit_returns_attached_objects(self, user, seed):
+        _, token = session_service.create_session(user.id)
+        assert session_service.validate_session(token) is not None
+        db.session.expunge_all()
+
+        context = session_service.validate_session(token)
+
+        assert context is not None
+        assert context.user.username == user.username
+        assert context.user.organization.id == seed["org_id"]
+        assert context.session in db.session
+
+    def test_cached_hit_rejects_user_deactivated_elsewhere(self, user):
+        _, token = session_service.create_session(user.id)
+        assert session_service.validate_session(token) is not None
+
+        # Simulates another worker: no revoke call, no cache invalidation
+        db.session.execute(update(User).where(User.id == user.id).values(is_active=False))
+        db.session.commit()
+
+        assert session_service.validate_session(token) is None
+        assert _session_row(token).revoked_reason == "User account deactivated"
+
+    def test_org_deactivation_drops_cached_sessions(self, user, seed):
+        _, token = session_service.create_session(user.id)
+        assert session_service.validate_session(token) is not None
+        token_hash = session_service.hash_token(token)
+
+        org = db.session.get(Organization, seed["org_id"])
+        try:
+            org.is_active = False
+            assert token_hash not in session_service._session_cache
+            db.session.commit()
+            assert session_service.validate_session(token) is None
+        finally:
+            org.is_active = True
+            db.session.commit()
+
+    def test_cached_session_loads_uncached_columns(self, user):
+        _, token = session_service.create_session(user.id)
+        assert session_service.validate_session(token) is not None
+        db.session.expunge_all()
+
+        context = session_service.validate_session(token)
+
+        assert context.session.token_hash == session_service.hash_token(token)
+        assert context.session.is_revoked is False
+
+    def test_revoke_invalidates_cache(self, user):
+        _, token = session_service.create_session(user.id)
+        assert session_service.validate_session(token) is not None
+
+        session_service.revoke_session(token)
+
+        assert session_service.validate_session(token) is None
+
+    def test_revoke_all_invalidates_cache(self, user):
+        _, token = session_service.create_session(user.id)
+        assert session_service.validate_session(token) is not None
+
+        session_service.revoke_all_user_sessions(user.id)
+
+        assert session_service.validate_session(token) is None
+
+
+class TestRevokeAllUserSessions:
+    def test_revokes_every_active_session(self, user):
+        tokens = [session_service.create_session(user.id)[1] for _ in range(3)]
+        session_service.revoke_session(tokens[0])
+
+        assert session_service.revoke_all_user_sessions(user.id, reason="Password changed") == 2
+        for token in tokens:
+            assert session_service.validate_session(token) is None
+        assert _session_row(tokens[1]).revoked_reason == "Password changed"
+
+
+class TestCleanupExpiredSessions:
+    def test_deletes_old_sessions_in_batches(self, user):
+        old = utcnow() - timedelta(days=31)
+        tokens = [session_service.create_session(user.id)[1] for _ in range(5)]
+        for token in tokens[:3]:
+            row = _session_row(token)
+            row.created_at = old
+            row.expires_at = old + session_service.SESSION_ABSOLUTE_TIMEOUT
+        db.session.commit()
+
+        assert session_service.cleanup_expired_sessions(batch_size=2) >= 3
+        remaining = {
+            row.token_hash for row in db.session.query(SessionToken).filter_by(user_id=user.id)
+        }
+        assert remaining == {session_service.hash_token(t) for t in tokens[3:]}
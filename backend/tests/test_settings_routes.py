@@ -0,0 +1,24 @@
+"""
+Settings route tests.
+
+Verifies:
+- The registry listing carries an ETag and honours If-None-Match
+"""
+
+
+class TestSettingsRegistryRoute:
+    def test_registry_etag_round_trip(self, client, admin_headers):
+        first = client.get("/api/settings/registry", headers=admin_headers)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert first.get_json()["count"] == len(first.get_json()["items"])
+
+        cached = client.get("/api/settings/registry", headers={**admin_headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.data == b""
+
+    def test_registry_stale_etag_returns_body(self, client, admin_headers):
+        resp = client.get("/api/settings/registry", headers={**admin_headers, "If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+        assert resp.get_json()["items"]
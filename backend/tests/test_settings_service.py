@@ -2,7 +2,17 @@ import unittest
 from flask import Flask
 
 from app.extensions import db
-from app.models import Organization, Store, User, Register, SettingRegistry, SettingValue, SettingAudit
+from app.models import (
+    Organization,
+    Store,
+    User,
+    Register,
+    SettingRegistry,
+    SettingValue,
+    SettingAudit,
+    OrganizationSetting,
+    DeviceSetting,
+)
 from app.services import settings_service
 from app.services.settings_service import (
     SCOPE_ORG,
@@ -37,6 +47,8 @@ class SettingsServiceTests(unittest.TestCase):
 
     def setUp(self):
         db.session.query(SettingAudit).delete()
+        db.session.query(OrganizationSetting).delete()
+        db.session.query(DeviceSetting).delete()
         db.session.query(SettingValue).delete()
         db.session.query(SettingRegistry).delete()
         db.session.query(Register).delete()
@@ -44,6 +56,7 @@ class SettingsServiceTests(unittest.TestCase):
         db.session.query(Store).delete()
         db.session.query(Organization).delete()
         db.session.commit()
+        settings_service.invalidate_registry_cache()
 
         self.org = Organization(name="Test Org", code="TEST")
         db.session.add(self.org)
@@ -129,6 +142,7 @@ class SettingsServiceTests(unittest.TestCase):
         ]
         db.session.add_all(rows)
         db.session.commit()
+        settings_service.invalidate_registry_cache()
 
     def test_precedence_resolution_user_over_device_store_org(self):
         self._seed_registry()
@@ -169,6 +183,21 @@ class SettingsServiceTests(unittest.TestCase):
         with self.assertRaises(SettingsAuthorizationError):
             settings_service.get_scope_settings(actor=actor, scope_type=SCOPE_ORG, scope_id=self.org.id)
 
+    def test_scope_authorization_denies_cross_org_admin(self):
+        self._seed_registry()
+        other_org = Organization(name="Other Org", code="OTHER")
+        db.session.add(other_org)
+        db.session.commit()
+        actor = settings_service.SettingsActor(
+            user_id=self.cashier.id,
+            org_id=other_org.id,
+            store_id=None,
+            is_developer=False,
+            permissions={"SYSTEM_ADMIN"},
+        )
+        with self.assertRaises(SettingsAuthorizationError):
+            settings_service.get_scope_settings(actor=actor, scope_type=SCOPE_STORE, scope_id=self.store.id)
+
     def test_sensitive_settings_excluded_from_effective_payload(self):
         self._seed_registry()
         db.session.add(SettingValue(key="test.secret", scope_type=SCOPE_ORG, scope_id=self.org.id, value_json="secret"))
@@ -194,6 +223,142 @@ class SettingsServiceTests(unittest.TestCase):
         self.assertIsNotNone(audit)
         self.assertEqual(audit.new_value_json, True)
 
+    def test_bulk_update_batches_inserts_and_audits(self):
+        self._seed_registry()
+        db.session.add(SettingValue(key="test.bool", scope_type=SCOPE_ORG, scope_id=self.org.id, value_json=False))
+        db.session.commit()
+        actor = settings_service.make_actor(user_id=self.admin.id)
+        result = settings_service.bulk_upsert_scope_settings(
+            actor=actor,
+            scope_type=SCOPE_ORG,
+            scope_id=self.org.id,
+            updates=[
+                {"key": "test.precedence", "value_json": "first"},
+                {"key": "test.bool", "value_json": True},
+                {"key": "test.precedence", "value_json": "second"},
+            ],
+        )
+        self.assertEqual(result["errors"], [])
+        values = {
+            r.key: r.value_json
+            for r in db.session.query(SettingValue).filter_by(scope_type=SCOPE_ORG, scope_id=self.org.id)
+        }
+        self.assertEqual(values, {"test.precedence": "second", "test.bool": True})
+        audits = db.session.query(SettingAudit).filter_by(key="test.precedence").order_by(SettingAudit.id).all()
+        self.assertEqual([(a.old_value_json, a.new_value_json) for a in audits], [(None, "first"), ("first", "second")])
+
+    def test_constraints_enforced_by_compiled_validators(self):
+        db.session.add_all(
+            [
+                SettingRegistry(
+                    key="test.mode",
+                    scope_allowed=["ORG"],
+                    value_type="enum",
+                    validation_json={"enum": ["fast", "safe"]},
+                    category="test",
+                ),
+                SettingRegistry(
+                    key="test.limit",
+                    scope_allowed=["ORG"],
+                    value_type="int",
+                    validation_json={"min": 1, "max": 10},
+                    category="test",
+                ),
+                SettingRegistry(
+                    key="test.code",
+                    scope_allowed=["ORG"],
+                    value_type="string",
+                    validation_json={"regex": "[A-Z]{3}"},
+                    category="test",
+                ),
+            ]
+        )
+        db.session.commit()
+        settings_service.invalidate_registry_cache()
+        actor = settings_service.make_actor(user_id=self.admin.id)
+
+        def _update(key, value):
+            return settings_service.bulk_upsert_scope_settings(
+                actor=actor,
+                scope_type=SCOPE_ORG,
+                scope_id=self.org.id,
+                updates=[{"key": key, "value_json": value}],
+            )
+
+        self.assertEqual(_update("test.mode", "safe")["errors"], [])
+        self.assertEqual(len(_update("test.mode", "reckless")["errors"]), 1)
+        self.assertEqual(_update("test.limit", "7")["updated"][0]["value_json"], 7)
+        self.assertEqual(len(_update("test.limit", 11)["errors"]), 1)
+        self.assertEqual(_update("test.code", "ABC")["errors"], [])
+        # The pattern must match the whole value, not just a prefix
+        self.assertEqual(len(_update("test.code", "ABCD")["errors"]), 1)
+
+    def test_registry_map_cached_until_invalidated(self):
+        self._seed_registry()
+        first = settings_service._get_registry_map()
+        self.assertIn("test.precedence", first)
+        self.assertIs(settings_service._get_registry_map(), first)
+        settings_service.invalidate_registry_cache()
+        self.assertIsNot(settings_service._get_registry_map(), first)
+
+    def test_list_registry_ordered_and_serialized_once(self):
+        self._seed_registry()
+        actor = settings_service.make_actor(user_id=self.admin.id)
+        first = settings_service.list_registry(actor)
+        order = [(d["category"], d["subcategory"] or "", d["key"]) for d in first]
+        self.assertEqual(order, sorted(order))
+        second = settings_service.list_registry(actor)
+        self.assertIs(first[0], second[0])
+
+    def test_scope_org_id_memoized_per_request(self):
+        from flask import current_app, g
+
+        store_id, org_id = self.store.id, self.org.id
+        with current_app.test_request_context():
+            self.assertEqual(settings_service._scope_org_id(SCOPE_STORE, store_id), org_id)
+            self.assertEqual(g._settings_scope_org_cache, {(SCOPE_STORE, store_id): org_id})
+            self.assertIsNone(settings_service.scope_org_id_or_none(SCOPE_DEVICE, 999999))
+
+    def test_legacy_org_setting_upsert_inserts_then_updates(self):
+        created = settings_service.upsert_org_setting(self.org.id, "receipt.footer", "thanks", self.admin.id)
+        updated = settings_service.upsert_org_setting(self.org.id, "receipt.footer", "bye", self.cashier.id)
+        self.assertEqual(created["id"], updated["id"])
+        self.assertEqual(updated["value"], "bye")
+        self.assertEqual(updated["updated_by_user_id"], self.cashier.id)
+        self.assertEqual(db.session.query(OrganizationSetting).filter_by(org_id=self.org.id).count(), 1)
+
+    def test_legacy_device_setting_upsert_inserts_then_updates(self):
+        settings_service.upsert_device_setting(self.device.id, self.org.id, "auto_logout", "300", self.admin.id)
+        updated = settings_service.upsert_device_setting(self.device.id, self.org.id, "auto_logout", "600", self.admin.id)
+        self.assertEqual(updated["value"], "600")
+        self.assertEqual(settings_service.get_device_settings(self.device.id, self.org.id), [updated])
+
+    def test_legacy_device_setting_upsert_rejects_other_org(self):
+        other = Organization(name="Other Org", code="OTHER")
+        db.session.add(other)
+        db.session.commit()
+        with self.assertRaises(settings_service.SettingsNotFoundError):
+            settings_service.upsert_device_setting(self.device.id, other.id, "auto_logout", "300", self.admin.id)
+        self.assertEqual(db.session.query(DeviceSetting).count(), 0)
+        with self.assertRaises(settings_service.SettingsNotFoundError):
+            settings_service.get_device_settings(self.device.id, other.id)
+
+    def test_missing_scope_raises_not_found(self):
+        self._seed_registry()
+        actor = settings_service.make_actor(user_id=self.admin.id)
+        db.session.expunge_all()
+        for scope_type in (SCOPE_ORG, SCOPE_STORE, SCOPE_DEVICE, SCOPE_USER):
+            with self.assertRaises(settings_service.SettingsNotFoundError):
+                settings_service.get_scope_settings(actor=actor, scope_type=scope_type, scope_id=999999)
+
+        orphan = User(username="orphan", email="orphan@test.local", password_hash="x", is_active=True)
+        db.session.add(orphan)
+        db.session.commit()
+        orphan_id = orphan.id
+        db.session.expunge_all()
+        with self.assertRaisesRegex(settings_service.SettingsNotFoundError, "no organization"):
+            settings_service.get_scope_settings(actor=actor, scope_type=SCOPE_USER, scope_id=orphan_id)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,62 @@
+"""
+Store hierarchy tests.
+
+Verifies descendant resolution and tree assembly for nested stores.
+"""
+
+import pytest
+
+from app.extensions import db
+from app.models import Store
+from app.services import store_service
+
+
+@pytest.fixture
+def hierarchy(app, seed):
+    """root -> (east -> east_1, west); plus an unrelated store."""
+    org_id = seed["org_id"]
+    root = Store(org_id=org_id, name="Region")
+    db.session.add(root)
+    db.session.flush()
+    east = Store(org_id=org_id, name="East", parent_store_id=root.id)
+    west = Store(org_id=org_id, name="West", parent_store_id=root.id)
+    db.session.add_all([east, west])
+    db.session.flush()
+    east_1 = Store(org_id=org_id, name="East 1", parent_store_id=east.id)
+    other = Store(org_id=org_id, name="Elsewhere")
+    db.session.add_all([east_1, other])
+    db.session.flush()
+    return {"root": root, "east": east, "west": west, "east_1": east_1, "other": other}
+
+
+class TestDescendantStoreIds:
+    def test_includes_whole_subtree(self, hierarchy):
+        h = hierarchy
+        ids = store_service.get_descendant_store_ids(h["root"].id)
+        assert ids[0] == h["root"].id
+        assert sorted(ids) == sorted([h["root"].id, h["east"].id, h["west"].id, h["east_1"].id])
+
+    def test_excludes_self_when_requested(self, hierarchy):
+        h = hierarchy
+        ids = store_service.get_descendant_store_ids(h["east"].id, include_self=False)
+        assert ids == [h["east_1"].id]
+
+    def test_leaf_has_no_descendants(self, hierarchy):
+        leaf = hierarchy["east_1"]
+        assert store_service.get_descendant_store_ids(leaf.id) == [leaf.id]
+
+
+class TestStoreTree:
+    def test_builds_nested_tree(self, hierarchy, seed):
+        h = hierarchy
+        tree = store_service.get_store_tree(seed["org_id"], h["root"].id)
+
+        assert tree["store"]["id"] == h["root"].id
+        children = {c["store"]["id"]: c for c in tree["children"]}
+        assert set(children) == {h["east"].id, h["west"].id}
+        assert [c["store"]["id"] for c in children[h["east"].id]["children"]] == [h["east_1"].id]
+        assert children[h["west"].id]["children"] == []
+
+    def test_other_org_store_not_found(self, hierarchy, seed):
+        with pytest.raises(store_service.StoreError):
+            store_service.get_store_tree(seed["org_id"] + 999, hierarchy["root"].id)
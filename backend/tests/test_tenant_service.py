@@ -0,0 +1,62 @@
+"""
+Tenant service tests.
+
+Verifies the request-scoped store id cache, its invalidation on store
+creation, and single and batch store membership checks.
+"""
+
+import pytest
+from flask import g
+
+from app.extensions import db
+from app.models import Organization
+from app.services import store_service, tenant_service
+
+
+class TestOrgStoreIds:
+    def test_cached_per_request_and_refreshed_on_create(self, app):
+        org = Organization(name="Tenant Cache Org", code="TENANTCACHE", is_active=True)
+        db.session.add(org)
+        db.session.commit()
+
+        with app.test_request_context():
+            assert tenant_service.get_org_store_ids(org.id) == set()
+            assert org.id in g._org_store_ids
+
+            store = store_service.create_store(org.id, "Cached Store")
+            assert tenant_service.get_org_store_ids(org.id) == {store.id}
+
+    def test_returned_set_is_a_copy(self, app, seed):
+        with app.test_request_context():
+            ids = tenant_service.get_org_store_ids(seed["org_id"])
+            ids.add(-1)
+            assert -1 not in tenant_service.get_org_store_ids(seed["org_id"])
+
+
+class TestRequireStoresInOrg:
+    def test_rejects_store_from_other_org(self, app):
+        orgs = [Organization(name=f"Stores Check Org {i}", code=f"STORECHK{i}", is_active=True) for i in range(2)]
+        db.session.add_all(orgs)
+        db.session.commit()
+        own = store_service.create_store(orgs[0].id, "Own Store")
+        foreign = store_service.create_store(orgs[1].id, "Foreign Store")
+
+        with app.test_request_context():
+            assert tenant_service.require_stores_in_org([own.id, own.id], orgs[0].id) == [own]
+            with pytest.raises(tenant_service.TenantAccessError):
+                tenant_service.require_stores_in_org([own.id, foreign.id], orgs[0].id)
+
+
+class TestRequireStoreInOrgExists:
+    def test_membership(self, app):
+        orgs = [Organization(name=f"Exists Check Org {i}", code=f"EXISTSCHK{i}", is_active=True) for i in range(2)]
+        db.session.add_all(orgs)
+        db.session.commit()
+        own = store_service.create_store(orgs[0].id, "Exists Own Store")
+        foreign = store_service.create_store(orgs[1].id, "Exists Foreign Store")
+
+        with app.test_request_context():
+            assert tenant_service.require_store_in_org_exists(own.id, orgs[0].id) is None
+            for store_id in (foreign.id, 999999):
+                with pytest.raises(tenant_service.TenantAccessError):
+                    tenant_service.require_store_in_org_exists(store_id, orgs[0].id)
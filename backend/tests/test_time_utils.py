@@ -0,0 +1,53 @@
+"""
+Time helper tests.
+
+Verifies:
+- ISO-8601 parsing normalizes to UTC-naive and rejects bad input
+- Repeated timestamps are served from the parse cache
+- UTC 'Z' serialization of naive and aware datetimes
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app import time_utils
+from app.time_utils import parse_iso_datetime, to_utc_z
+
+
+class TestParseIsoDatetime:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("2026-03-04T05:06", datetime(2026, 3, 4, 5, 6)),
+            (" 2026-03-04T05:06:07Z ", datetime(2026, 3, 4, 5, 6, 7)),
+            ("2026-03-04T05:06:07+02:00", datetime(2026, 3, 4, 3, 6, 7)),
+            ("2026-03-04T23:30:00-01:00", datetime(2026, 3, 5, 0, 30)),
+        ],
+    )
+    def test_normalizes_to_utc_naive(self, raw, expected):
+        parsed = parse_iso_datetime(raw)
+        assert parsed == expected
+        assert parsed.tzinfo is None
+
+    def test_empty_and_invalid(self):
+        assert parse_iso_datetime(None) is None
+        assert parse_iso_datetime("   ") is None
+        with pytest.raises(ValueError):
+            parse_iso_datetime("not a date")
+
+    def test_repeated_values_hit_cache(self):
+        raw = "2031-07-08T09:10:11Z"
+        before = time_utils._parse_iso_utc_naive.cache_info().hits
+        assert parse_iso_datetime(raw) is parse_iso_datetime(f" {raw}")
+        assert time_utils._parse_iso_utc_naive.cache_info().hits == before + 1
+
+
+class TestToUtcZ:
+    def test_serializes_to_z(self):
+        assert to_utc_z(None) is None
+        assert to_utc_z(datetime(2026, 3, 4, 5, 6, 7, 999)) == "2026-03-04T05:06:07Z"
+        assert to_utc_z(datetime(2026, 3, 4, 5, 6, 7, tzinfo=timezone.utc)) == "2026-03-04T05:06:07Z"
+
+        plus_two = timezone(timedelta(hours=2))
+        assert to_utc_z(datetime(2026, 3, 4, 5, 6, 7, tzinfo=plus_two)) == "2026-03-04T03:06:07Z"
@@ -0,0 +1,100 @@
+"""
+Timekeeping service tests.
+
+Verifies:
+- Clock in/out lifecycle and worked-minute totals
+- Break start/end and the clock-out-while-on-break guard
+- Pending tasks block clock-out until completed
+- Correction submission and approval
+"""
+
+import pytest
+
+from app.services import communications_service, timekeeping_service
+from app.services.timekeeping_service import TimekeepingError
+
+
+@pytest.fixture
+def worker(isolated_org):
+    tenant = isolated_org()
+    return {"user_id": tenant["user"].id, "store_id": tenant["store_ids"][0], "org_id": tenant["org_id"]}
+
+
+class TestClockLifecycle:
+    def test_clock_in_and_out(self, worker):
+        entry = timekeeping_service.clock_in(user_id=worker["user_id"], store_id=worker["store_id"])
+        assert timekeeping_service.get_current_status(worker["user_id"])["status"] == "CLOCKED_IN"
+
+        with pytest.raises(TimekeepingError, match="already clocked in"):
+            timekeeping_service.clock_in(user_id=worker["user_id"], store_id=worker["store_id"])
+
+        closed = timekeeping_service.clock_out(user_id=worker["user_id"])
+        assert closed.id == entry.id
+        assert closed.status == "CLOSED"
+        assert closed.total_worked_minutes == 0
+        assert timekeeping_service.get_current_status(worker["user_id"])["status"] == "CLOCKED_OUT"
+
+    def test_clock_out_requires_open_entry(self, worker):
+        with pytest.raises(TimekeepingError, match="not clocked in"):
+            timekeeping_service.clock_out(user_id=worker["user_id"])
+
+    def test_pending_tasks_block_clock_out(self, app, worker):
+        task = communications_service.create_task(
+            worker["org_id"],
+            {"title": "Count drawer", "assigned_to_user_id": worker["user_id"]},
+            worker["user_id"],
+        )
+        timekeeping_service.clock_in(user_id=worker["user_id"], store_id=worker["store_id"])
+
+        with app.test_request_context():
+            with pytest.raises(TimekeepingError, match="pending tasks"):
+                timekeeping_service.clock_out(user_id=worker["user_id"])
+            # Completing the task drops the request-scoped pending cache
+            communications_service.update_task(task["id"], {"status": "COMPLETED"})
+            assert timekeeping_service.clock_out(user_id=worker["user_id"]).status == "CLOSED"
+
+    def test_breaks(self, worker):
+        timekeeping_service.clock_in(user_id=worker["user_id"], store_id=worker["store_id"])
+        timekeeping_service.start_break(user_id=worker["user_id"])
+        assert timekeeping_service.get_current_status(worker["user_id"])["on_break"] is True
+
+        with pytest.raises(TimekeepingError, match="Break already in progress"):
+            timekeeping_service.start_break(user_id=worker["user_id"])
+        with pytest.raises(TimekeepingError, match="while on break"):
+            timekeeping_service.clock_out(user_id=worker["user_id"])
+
+        brk = timekeeping_service.end_break(user_id=worker["user_id"])
+        assert brk.end_at is not None
+        with pytest.raises(TimekeepingError, match="No active break"):
+            timekeeping_service.end_break(user_id=worker["user_id"])
+        assert timekeeping_service.clock_out(user_id=worker["user_id"]).status == "CLOSED"
+
+
+class TestCorrections:
+    def test_submit(self, worker):
+        entry = timekeeping_service.clock_in(user_id=worker["user_id"], store_id=worker["store_id"])
+        timekeeping_service.clock_out(user_id=worker["user_id"])
+
+        correction = timekeeping_service.create_correction(
+            entry_id=entry.id,
+            corrected_clock_in_at=entry.clock_in_at,
+            corrected_clock_out_at=entry.clock_out_at,
+            reason="Forgot to clock out",
+            submitted_by_user_id=worker["user_id"],
+        )
+        assert correction.status == "PENDING"
+        assert correction.time_clock_entry is entry
+
+        approved = timekeeping_service.approve_correction(
+            correction_id=correction.id,
+            approved_by_user_id=worker["user_id"],
+            approval_notes="ok",
+        )
+        assert approved.status == "APPROVED"
+        assert approved.approved_at is not None
+
+        with pytest.raises(TimekeepingError, match="already processed"):
+            timekeeping_service.approve_correction(
+                correction_id=correction.id,
+                approved_by_user_id=worker["user_id"],
+            )
@@ -0,0 +1,159 @@
+"""
+Transfer service tests.
+
+Verifies:
+- Full PENDING -> APPROVED -> IN_TRANSIT -> RECEIVED lifecycle
+- Approval guards: missing transfer, wrong status, no lines
+- Shipping posts linked OUT transactions and re-checks on-hand
+- Receiving posts linked IN transactions at the destination
+- Ship/receive ledger events are written in line order
+- Verb commits leave the returned transfer loaded
+"""
+
+import pytest
+from sqlalchemy import inspect
+
+from app.extensions import db
+from app.models import InventoryTransaction, MasterLedgerEvent, Product
+from app.services import transfer_service
+from app.services.concurrency import commit_with_retry
+from app.services.inventory_service import (
+    find_insufficient_inventory,
+    get_quantities_on_hand,
+    get_quantity_on_hand,
+    get_weighted_average_cost_cents,
+    get_weighted_average_costs_cents,
+)
+
+
+@pytest.fixture
+def setup(isolated_org):
+    tenant = isolated_org(store_count=2)
+    source, dest = tenant["store_ids"]
+    user = tenant["user"]
+    products = [
+        Product(store_id=source, sku=f"TR-{source}-{i}", name=f"Transfer Product {i}")
+        for i in range(3)
+    ]
+    db.session.add_all(products)
+    db.session.flush()
+    for product in products:
+        db.session.add(
+            InventoryTransaction(
+                store_id=source,
+                product_id=product.id,
+                type="RECEIVE",
+                quantity_delta=10,
+                unit_cost_cents=150,
+                status="POSTED",
+            )
+        )
+    db.session.flush()
+    return {"user": user, "from": source, "to": dest, "products": products}
+
+
+def _approved_transfer(setup, quantities):
+    transfer = transfer_service.create_transfer(setup["from"], setup["to"], setup["user"].id)
+    for product, qty in zip(setup["products"], quantities):
+        transfer_service.add_transfer_line(transfer.id, product.id, qty)
+    transfer_service.approve_transfer(transfer.id, setup["user"].id)
+    return transfer
+
+
+class TestTransferLifecycle:
+    def test_ship_and_receive_move_inventory(self, setup):
+        transfer = _approved_transfer(setup, [4, 2, 7])
+        user_id = setup["user"].id
+
+        shipped = transfer_service.ship_transfer(transfer.id, user_id)
+        assert shipped.status == transfer_service.TRANSFER_STATUS_IN_TRANSIT
+        for line, qty in zip(sorted(shipped.lines, key=lambda l: l.id), [4, 2, 7]):
+            out_txn = db.session.get(InventoryTransaction, line.out_transaction_id)
+            assert out_txn.product_id == line.product_id
+            assert out_txn.quantity_delta == -qty
+            assert line.unit_cost_cents == 150
+            assert get_quantity_on_hand(setup["from"], line.product_id) == 10 - qty
+
+        received = transfer_service.receive_transfer(transfer.id, user_id)
+        assert received.status == transfer_service.TRANSFER_STATUS_RECEIVED
+        for line in received.lines:
+            in_txn = db.session.get(InventoryTransaction, line.in_transaction_id)
+            assert in_txn.store_id == setup["to"]
+            assert in_txn.product_id == line.product_id
+            assert in_txn.quantity_delta == line.quantity
+            assert get_quantity_on_hand(setup["to"], line.product_id) == line.quantity
+
+        events = (
+            db.session.query(MasterLedgerEvent.event_type, MasterLedgerEvent.entity_id)
+            .filter_by(transfer_id=transfer.id)
+            .order_by(MasterLedgerEvent.id)
+            .all()
+        )
+        lines = sorted(received.lines, key=lambda l: l.id)
+        assert [e.event_type for e in events] == (
+            ["transfer.created", "transfer.approved"]
+            + ["inventory.transfer_out"] * 3 + ["transfer.shipped"]
+            + ["inventory.transfer_in"] * 3 + ["transfer.received"]
+        )
+        assert [e.entity_id for e in events[2:5]] == [l.out_transaction_id for l in lines]
+        assert [e.entity_id for e in events[6:9]] == [l.in_transaction_id for l in lines]
+
+        summary = transfer_service.get_transfer_summary(transfer.id)
+        assert summary["status"] == transfer_service.TRANSFER_STATUS_RECEIVED
+        assert summary["lines"] == [l.to_dict() for l in lines]
+
+    def test_approve_guards(self, setup):
+        user_id = setup["user"].id
+        with pytest.raises(transfer_service.TransferError, match="not found"):
+            transfer_service.approve_transfer(999999, user_id)
+
+        empty = transfer_service.create_transfer(setup["from"], setup["to"], user_id)
+        with pytest.raises(transfer_service.TransferError, match="no lines"):
+            transfer_service.approve_transfer(empty.id, user_id)
+
+        transfer = _approved_transfer(setup, [1])
+        assert transfer.status == transfer_service.TRANSFER_STATUS_APPROVED
+        assert transfer.approved_by_user_id == user_id
+        assert transfer.version_id == 2
+        with pytest.raises(transfer_service.TransferError, match="APPROVED status"):
+            transfer_service.approve_transfer(transfer.id, user_id)
+
+    def test_commit_keeps_transfer_loaded(self, setup):
+        transfer = _approved_transfer(setup, [1])
+        commit_with_retry(expire_on_commit=False)
+        assert not inspect(transfer).expired_attributes
+        assert db.session().expire_on_commit is True
+
+        commit_with_retry()
+        assert "status" in inspect(transfer).expired_attributes
+
+    def test_ship_rechecks_on_hand(self, setup):
+        transfer = _approved_transfer(setup, [4, 2, 7])
+        db.session.add(
+            InventoryTransaction(
+                store_id=setup["from"],
+                product_id=setup["products"][2].id,
+                type="ADJUST",
+                quantity_delta=-5,
+                status="POSTED",
+            )
+        )
+        db.session.flush()
+
+        with pytest.raises(transfer_service.TransferError, match="Insufficient inventory"):
+            transfer_service.ship_transfer(transfer.id, setup["user"].id)
+
+    def test_batched_lookups_match_per_product(self, setup):
+        ids = [p.id for p in setup["products"]]
+        on_hand = get_quantities_on_hand(setup["from"], ids + [999999])
+        assert on_hand == {**{pid: get_quantity_on_hand(setup["from"], pid) for pid in ids}, 999999: 0}
+
+        requested = {ids[0]: 10, ids[1]: 11, 999999: 1}
+        assert find_insufficient_inventory(setup["from"], requested) == {ids[1]: 10, 999999: 0}
+
+        costs = get_weighted_average_costs_cents(setup["from"], ids + [999999])
+        assert costs == {**{pid: get_weighted_average_cost_cents(setup["from"], pid) for pid in ids}, 999999: None}
+
+    def test_missing_transfer_summary(self, app):
+        with pytest.raises(transfer_service.TransferError):
+            transfer_service.get_transfer_summary(999999)
@@ -0,0 +1,47 @@
+"""
+User store access service tests.
+
+Verifies:
+- Effective manager stores include the primary store unless excluded
+- Grants and revokes are visible within the same request
+- Single-store checks match the effective manager store set
+"""
+
+import pytest
+
+from app.services import user_store_access_service
+
+
+@pytest.fixture
+def manager(isolated_org):
+    tenant = isolated_org(store_count=2)
+    primary, other = tenant["store_ids"]
+    return {"user_id": tenant["user"].id, "primary": primary, "other": other}
+
+
+class TestManagerStoreIds:
+    def test_primary_store(self, manager):
+        user_id = manager["user_id"]
+        assert user_store_access_service.get_manager_store_ids(user_id) == {manager["primary"]}
+        assert user_store_access_service.get_manager_store_ids(user_id, include_primary=False) == set()
+
+    def test_grant_and_revoke_within_request(self, app, manager):
+        user_id, other = manager["user_id"], manager["other"]
+        with app.test_request_context():
+            assert not user_store_access_service.user_can_manage_store(user_id, other)
+
+            user_store_access_service.grant_manager_access(user_id=user_id, store_id=other)
+            assert user_store_access_service.user_can_manage_store(user_id, other)
+            assert user_store_access_service.get_manager_store_ids(user_id, include_primary=False) == {other}
+
+            assert user_store_access_service.revoke_manager_access(user_id=user_id, store_id=other)
+            assert not user_store_access_service.user_can_manage_store(user_id, other)
+
+    def test_can_manage_store(self, manager):
+        user_id, primary, other = manager["user_id"], manager["primary"], manager["other"]
+        assert user_store_access_service.user_can_manage_store(user_id, primary)
+        assert not user_store_access_service.user_can_manage_store(user_id, other)
+        assert not user_store_access_service.user_can_manage_store(user_id, None)
+
+        user_store_access_service.grant_manager_access(user_id=user_id, store_id=other)
+        assert user_store_access_service.user_can_manage_store(user_id, other)
@@ -0,0 +1,159 @@
+"""
+Payload validation tests.
+
+Verifies:
+- Allowlist, unknown-field and required-field checks
+- Policies normalize their field sets to frozensets
+- Column-driven coercion (integer strictness, booleans, strings, datetimes)
+- Column type subclasses coerce like their base type
+- Null, blank and max-length constraints from column metadata
+- Inventory business rules per transaction type
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import BigInteger, Enum, Numeric, Unicode
+
+from app.models import InventoryTransaction, Product
+from app.validation import (
+    ModelValidationPolicy,
+    ValidationError,
+    _coercer_for,
+    enforce_rules_inventory,
+    validate_payload,
+)
+
+
+POLICY = ModelValidationPolicy(
+    writable_fields={"sku", "name", "description", "price_cents", "is_active", "store_id"},
+    required_on_create={"sku", "name"},
+)
+
+
+def _validate(payload, *, partial=False, model=Product, policy=POLICY):
+    return validate_payload(model=model, payload=payload, policy=policy, partial=partial)
+
+
+class TestValidatePayload:
+    def test_coerces_by_column_type(self):
+        patch = _validate({
+            "sku": "  ABC-1 ",
+            "name": "Widget",
+            "description": None,
+            "price_cents": " 1250 ",
+            "is_active": 1,
+        })
+        assert patch == {
+            "sku": "ABC-1",
+            "name": "Widget",
+            "description": None,
+            "price_cents": 1250,
+            "is_active": True,
+        }
+
+    def test_field_checks(self):
+        with pytest.raises(ValidationError, match="Missing required fields: name"):
+            _validate({"sku": "A"})
+        assert _validate({"price_cents": 5}, partial=True) == {"price_cents": 5}
+        with pytest.raises(ValidationError, match="Field not allowed: id"):
+            _validate({"id": 1}, partial=True)
+
+        policy = ModelValidationPolicy(writable_fields={"bogus"})
+        with pytest.raises(ValidationError, match="Unknown field: bogus"):
+            _validate({"bogus": 1}, partial=True, policy=policy)
+        # The first offending key in payload order is reported
+        with pytest.raises(ValidationError, match="Unknown field: bogus"):
+            _validate({"bogus": 1, "sku": "A"}, partial=True, policy=policy)
+
+        with pytest.raises(ValidationError, match="Invalid JSON payload"):
+            _validate(["sku"])
+
+    def test_policy_is_immutable(self):
+        policy = ModelValidationPolicy(writable_fields={"sku"})
+        assert policy.writable_fields == frozenset({"sku"})
+        assert policy.required_on_create == frozenset()
+        assert hash(policy) == hash(ModelValidationPolicy(writable_fields=["sku"]))
+
+    @pytest.mark.parametrize(
+        ("raw", "message"),
+        [
+            ("1e3", "scientific notation"),
+            ("12.5", "no decimals"),
+            (12.5, "not a decimal"),
+            ("", "must be an integer"),
+            ("abc", "must be an integer"),
+            (True, "must be an integer"),
+        ],
+    )
+    def test_integer_strictness(self, raw, message):
+        with pytest.raises(ValidationError, match=message):
+            _validate({"price_cents": raw}, partial=True)
+
+    @pytest.mark.parametrize(("raw", "expected"), [("-7", -7), ("+7", 7), ("1_000", 1000), (" 0042 ", 42)])
+    def test_integer_strings(self, raw, expected):
+        assert _validate({"price_cents": raw}, partial=True) == {"price_cents": expected}
+
+    def test_column_constraints(self):
+        with pytest.raises(ValidationError, match="name cannot be null"):
+            _validate({"name": None}, partial=True)
+        with pytest.raises(ValidationError, match="name cannot be blank"):
+            _validate({"name": "   "}, partial=True)
+        with pytest.raises(ValidationError, match="sku exceeds max length 64"):
+            _validate({"sku": "x" * 65}, partial=True)
+        assert _validate({"description": "x" * 5000}, partial=True)["description"] == "x" * 5000
+
+    def test_datetime_fields(self):
+        policy = ModelValidationPolicy(writable_fields={"occurred_at"})
+        patch = _validate(
+            {"occurred_at": "2026-01-02T03:04:05Z"}, partial=True, model=InventoryTransaction, policy=policy
+        )
+        assert patch["occurred_at"] == datetime(2026, 1, 2, 3, 4, 5)
+
+        with pytest.raises(ValidationError, match="ISO-8601"):
+            _validate({"occurred_at": "not a date"}, partial=True, model=InventoryTransaction, policy=policy)
+        with pytest.raises(ValidationError, match="must be a datetime"):
+            _validate({"occurred_at": 12}, partial=True, model=InventoryTransaction, policy=policy)
+
+        aware = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        assert _validate({"occurred_at": aware}, partial=True, model=InventoryTransaction, policy=policy) == {
+            "occurred_at": aware
+        }
+
+
+@pytest.mark.parametrize(
+    ("coltype", "raw", "expected"),
+    [
+        (BigInteger(), " 42 ", 42),
+        (Unicode(10), " hi ", "hi"),
+        (Enum("A", "B"), " A ", "A"),
+        (Numeric(), "1.5", "1.5"),
+    ],
+)
+def test_coercer_resolves_subclasses(coltype, raw, expected):
+    assert _coercer_for(coltype)("field", raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("tx_type", "patch", "message"),
+    [
+        ("RECEIVE", {"quantity_delta": 0, "unit_cost_cents": 5}, "quantity_delta must be > 0 for RECEIVE"),
+        ("RECEIVE", {"quantity_delta": 2}, "unit_cost_cents is required for RECEIVE"),
+        ("RECEIVE", {"quantity_delta": 2, "unit_cost_cents": -1}, "unit_cost_cents must be >= 0"),
+        ("ADJUST", {"quantity_delta": 0}, "quantity_delta must be non-zero for ADJUST"),
+        ("ADJUST", {"quantity_delta": -3, "unit_cost_cents": 5}, "unit_cost_cents must be omitted for ADJUST"),
+        ("SALE", {}, "quantity_delta is required for SALE"),
+        ("SALE", {"quantity_delta": 1, "sale_id": " "}, "sale_id is required for SALE"),
+        ("SALE", {"quantity_delta": 1, "sale_id": "S1"}, "sale_line_id is required for SALE"),
+        ("TRANSFER", {}, "Unsupported inventory transaction type"),
+    ],
+)
+def test_inventory_rules_reject(tx_type, patch, message):
+    with pytest.raises(ValidationError, match=message):
+        enforce_rules_inventory(tx_type, patch)
+
+
+def test_inventory_rules_accept():
+    enforce_rules_inventory("RECEIVE", {"quantity_delta": 2, "unit_cost_cents": 0})
+    enforce_rules_inventory("ADJUST", {"quantity_delta": -3, "unit_cost_cents": None})
+    enforce_rules_inventory("SALE", {"quantity_delta": 1, "sale_id": "S1", "sale_line_id": 7})
@@ -0,0 +1,86 @@
+"""
+Vendor service tests.
+
+Verifies:
+- Create/update/deactivate/reactivate lifecycle
+- Org-level vendor events are recorded against the org's first store
+- Duplicate codes, including those of inactive vendors, are rejected within an org
+- Listing returns the page and the filtered total
+"""
+
+import pytest
+
+from app.extensions import db
+from app.models import MasterLedgerEvent
+from app.services import vendor_service
+from app.services.vendor_service import VendorValidationError
+
+
+@pytest.fixture
+def org(isolated_org):
+    tenant = isolated_org(store_count=2, with_user=False)
+    return {"org_id": tenant["org_id"], "first_store_id": min(tenant["store_ids"])}
+
+
+def _create(org, **kwargs):
+    kwargs.setdefault("name", "Acme Supply")
+    kwargs.setdefault("reorder_mechanism", "Email rep")
+    return vendor_service.create_vendor(org_id=org["org_id"], **kwargs)
+
+
+class TestVendorLifecycle:
+    def test_lifecycle_events(self, org):
+        vendor = _create(org, code="acme")
+        assert vendor.code == "ACME"
+
+        vendor_service.update_vendor(vendor_id=vendor.id, contact_name="Pat")
+        vendor_service.deactivate_vendor(vendor.id)
+        vendor_service.reactivate_vendor(vendor.id)
+
+        events = (
+            db.session.query(MasterLedgerEvent.event_type, MasterLedgerEvent.store_id)
+            .filter_by(entity_type="vendor", entity_id=vendor.id)
+            .order_by(MasterLedgerEvent.id)
+            .all()
+        )
+        assert [e.event_type for e in events] == [
+            "vendor.created",
+            "vendor.updated",
+            "vendor.deactivated",
+            "vendor.reactivated",
+        ]
+        assert {e.store_id for e in events} == {org["first_store_id"]}
+
+    def test_duplicate_code_rejected(self, org):
+        first = _create(org, code="DUP")
+        with pytest.raises(VendorValidationError, match="already exists"):
+            _create(org, name="Other", code="dup")
+
+        # Codes stay reserved by inactive vendors (uq_vendors_org_code)
+        vendor_service.deactivate_vendor(first.id)
+        with pytest.raises(VendorValidationError, match="already exists"):
+            _create(org, name="Other", code="DUP")
+
+        other = _create(org, name="Other", code="OTHER")
+        with pytest.raises(VendorValidationError, match="already exists"):
+            vendor_service.update_vendor(vendor_id=other.id, code="dup")
+        assert vendor_service.get_vendor(other.id).code == "OTHER"
+
+
+class TestListVendors:
+    def test_page_and_total(self, org):
+        for name in ("Cedar", "Alder", "Birch", "Aspen"):
+            _create(org, name=name)
+        inactive = _create(org, name="Acacia")
+        vendor_service.deactivate_vendor(inactive.id)
+
+        vendors, total = vendor_service.list_vendors(org["org_id"], limit=2, offset=1)
+        assert [v.name for v in vendors] == ["Aspen", "Birch"]
+        assert total == 4
+
+        vendors, total = vendor_service.list_vendors(org["org_id"], include_inactive=True, search="ac")
+        assert [v.name for v in vendors] == ["Acacia"]
+        assert total == 1
+
+        assert vendor_service.list_vendors(org["org_id"], offset=10) == ([], 4)
+        assert vendor_service.list_vendors(org["org_id"], search="zzz") == ([], 0)